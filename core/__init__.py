@@ -30,7 +30,12 @@ from core.types import (
     Team,
     TeamTravelDistances,
     TravelDistances,
+    json_dump_file,
+    json_dumps,
+    json_load_all,
     json_load_cache,
+    json_load_mapped,
+    json_loads,
     sanitize_team_name,
     team_name_to_filepath,
 )
@@ -60,7 +65,12 @@ __all__ = [
     "get_twitter_card_meta",
     "get_headers",
     "get_session",
+    "json_dump_file",
+    "json_dumps",
+    "json_load_all",
     "json_load_cache",
+    "json_load_mapped",
+    "json_loads",
     "make_request",
     "print_block",
     "sanitize_team_name",
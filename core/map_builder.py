@@ -7,10 +7,16 @@ sport, league structure, or data source -- the caller provides pre-built
 MarkerItem objects and a MapConfig with all project-specific settings.
 """
 
+import concurrent.futures
+import functools
+import gzip
+import itertools
 import json
 import logging
 import math
-from collections import defaultdict
+import os
+import pickle
+from collections import Counter
 from dataclasses import dataclass, field
 from html import escape
 from pathlib import Path
@@ -18,14 +24,13 @@ from typing import Any, TypedDict, cast
 
 import folium
 import numpy as np
-from branca.element import MacroElement
+import shapely
+from branca.element import Element, MacroElement
 from folium.plugins import FeatureGroupSubGroup, MarkerCluster
 from folium.template import Template as FoliumTemplate
-from scipy.spatial import Voronoi
 from shapely.geometry import MultiPolygon, Point, Polygon, mapping, shape
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
-from shapely.prepared import PreparedGeometry, prep
 
 from core.basemap_tiles import (
     CARTO_THEME_MARK_DARK,
@@ -33,19 +38,35 @@ from core.basemap_tiles import (
     CARTO_TILE_URL_LIGHT,
     folium_carto_attribution,
 )
+from core.config import CACHE_DIR
+from core.types import json_dump_file, json_dumps, json_load_all, json_load_mapped
 
 logger = logging.getLogger(__name__)
 
 
-def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Great-circle distance in km (WGS84 sphere, R=6371)."""
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
+def _haversine_km_many(lat1: float, lon1: float, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Great-circle distance in km from one point to each of *lat2*/*lon2* (sphere, R=6371)."""
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
     a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+        np.sin(dlat / 2) ** 2
+        + math.cos(math.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlon / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return 6371.0 * c
+
+
+def _haversine_km_grid(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """:func:`_haversine_km_many` broadcast over arrays of origins as well as targets."""
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlon / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
     return 6371.0 * c
 
 
@@ -54,7 +75,7 @@ def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkerItem:
     """A single point to place on the map."""
 
@@ -97,6 +118,10 @@ class MapConfig:
     inline_boundaries_file: str = "dist/shared/boundaries.json"
     shared_boundaries_path: str = "../shared"
     fallback_icon_url: str | None = None
+    # Write each tier's territories in multi-group maps to a JSON file beside the HTML,
+    # fetched the first time the (hidden by default) layer is shown, instead of inlining
+    # them. The files are fetched, so this needs the map served over HTTP.
+    territory_files: bool = False
     header_elements: list[str] = field(default_factory=list)
     body_elements: list[str] = field(default_factory=list)
 
@@ -131,9 +156,8 @@ class ITLRegionGeom(TypedDict):
 
     name: str
     code: str | None
-    geom: BaseGeometry
+    geom: BaseGeometry  # prepared in place by shapely.prepare
     simplified: BaseGeometry
-    prepared: PreparedGeometry
     centroid: Point
 
 
@@ -170,11 +194,46 @@ class _RegionToItems(TypedDict):
 
 
 def _load_geojson(path: str | Path) -> dict[str, Any]:
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json_load_mapped(path)
 
 
 _SIMPLIFY_TOLERANCE = 0.001
+# Territory and boundary coordinates are snapped to ~1 m before embedding; regions are
+# already simplified to ~100 m, so the extra digits only bloated the emitted GeoJSON.
+_EMBED_GRID_SIZE = 1e-5
+# Boundary features keep only their ONS name and code properties (e.g. LAD25NM, LAD25CD)
+_BOUNDARY_PROPERTY_SUFFIXES = ("NM", "CD")
+
+
+def _embedded_mappings(geoms: Any) -> list[dict[str, Any]]:
+    """GeoJSON mappings of *geoms* snapped to :data:`_EMBED_GRID_SIZE`, in one GEOS call.
+
+    Boundaries are only drawn, so coordinates are rounded pointwise rather than having
+    GEOS rebuild valid topology, which is several times slower across every ward.
+    Polygonal layers are exported as one ragged coordinate array and sliced into rings,
+    rather than ``mapping()`` copying every ring into tuples of tuples.
+    """
+    snapped = shapely.set_precision(geoms, _EMBED_GRID_SIZE, mode="pointwise")
+    type_ids = shapely.get_type_id(snapped)
+    is_polygon = type_ids == shapely.GeometryType.POLYGON
+    is_area = is_polygon | (type_ids == shapely.GeometryType.MULTIPOLYGON)
+    if not len(snapped) or not is_area.all() or shapely.is_empty(snapped).any():
+        return [mapping(g) for g in snapped]
+    _, coords, offsets = shapely.to_ragged_array(snapped)
+    nested = coords.tolist()
+    for bounds in offsets:
+        ends = bounds.tolist()
+        nested = [nested[start:end] for start, end in zip(ends[:-1], ends[1:], strict=True)]
+    if len(offsets) == 2:  # every geometry is a Polygon
+        return [{"type": "Polygon", "coordinates": rings} for rings in nested]
+    return [
+        (
+            {"type": "Polygon", "coordinates": polygons[0]}
+            if polygon
+            else {"type": "MultiPolygon", "coordinates": polygons}
+        )
+        for polygons, polygon in zip(nested, is_polygon.tolist(), strict=True)
+    ]
 
 
 def _load_lookup_rows(path: str | Path) -> list[dict[str, str]]:
@@ -186,7 +245,209 @@ def _load_lookup_rows(path: str | Path) -> list[dict[str, str]]:
     return data
 
 
-def load_itl_hierarchy(paths: dict[str, str]) -> ITLHierarchy:
+ITL_HIERARCHY_CACHE_FILE = CACHE_DIR / "itl_hierarchy.pkl"
+_ITL_HIERARCHY_CACHE_VERSION = 1
+_REGION_LEVELS = ("itl3", "itl2", "itl1", "itl0", "lad", "ward")
+
+
+def _hierarchy_source_stamp(paths: dict[str, str]) -> list[tuple[str, str, int, int] | None]:
+    """(level, path, mtime_ns, size) for every boundary/lookup file, None if missing."""
+    stamp: list[tuple[str, str, int, int] | None] = []
+    for level, path in sorted(paths.items()):
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((level, str(path), st.st_mtime_ns, st.st_size))
+    return stamp
+
+
+def _pack_regions(regions: dict[str, ITLRegionGeom]) -> dict[str, Any]:
+    geoms = [r["geom"] for r in regions.values()]
+    simplified = [r["simplified"] for r in regions.values()]
+    return {
+        "keys": list(regions),
+        "names": [r["name"] for r in regions.values()],
+        "codes": [r["code"] for r in regions.values()],
+        "geom": shapely.to_wkb(geoms, flavor="iso"),
+        "simplified": shapely.to_wkb(simplified, flavor="iso"),
+    }
+
+
+def _regions_from_arrays(
+    keys: list[str],
+    names: list[str],
+    codes: list[str | None],
+    geoms: np.ndarray,
+    simplified: np.ndarray | None = None,
+) -> dict[str, ITLRegionGeom]:
+    """Region dicts built with bulk shapely calls rather than per-geometry ones.
+
+    *simplified* is computed from *geoms* when not given. Later duplicate keys win.
+    """
+    shapely.prepare(geoms)  # one bulk call, so containment queries on geom are prepared
+    if simplified is None:
+        simplified = shapely.simplify(geoms, _SIMPLIFY_TOLERANCE, preserve_topology=True)
+    centroids = shapely.centroid(geoms)
+    return {
+        key: {
+            "name": name,
+            "code": code,
+            "geom": geom,
+            "simplified": simple,
+            "centroid": centroid,
+        }
+        for key, name, code, geom, simple, centroid in zip(
+            keys, names, codes, geoms, simplified, centroids, strict=True
+        )
+    }
+
+
+_AREA_TYPES = ("Polygon", "MultiPolygon")
+
+
+def geometries_from_geojson(geometries: list[dict[str, Any]]) -> np.ndarray:
+    """Shapely geometries for GeoJSON geometry dicts, in order.
+
+    Polygon and MultiPolygon coordinates are flattened into one coordinate array and
+    built by a single ``shapely.from_ragged_array`` call, instead of ``shape()``
+    converting every ring separately. Anything else (or 3D coordinates) uses ``shape()``.
+    """
+    out = np.empty(len(geometries), dtype=object)
+    areas = [i for i, g in enumerate(geometries) if g["type"] in _AREA_TYPES and g["coordinates"]]
+    polygon_lists = [
+        [g["coordinates"]] if g["type"] == "Polygon" else g["coordinates"]
+        for g in (geometries[i] for i in areas)
+    ]
+    rings = [ring for polygons in polygon_lists for polygon in polygons for ring in polygon]
+    ring_sizes = [len(ring) for ring in rings]
+    flat = np.fromiter(
+        itertools.chain.from_iterable(itertools.chain.from_iterable(rings)), dtype=np.float64
+    )
+    if len(flat) == 2 * sum(ring_sizes):
+        multipolygons = shapely.from_ragged_array(
+            shapely.GeometryType.MULTIPOLYGON,
+            flat.reshape(-1, 2),
+            (
+                np.cumsum([0, *ring_sizes]),
+                np.cumsum(
+                    [0, *(len(polygon) for polygons in polygon_lists for polygon in polygons)]
+                ),
+                np.cumsum([0, *(len(polygons) for polygons in polygon_lists)]),
+            ),
+        )
+        # Keep single polygons as Polygon, as shape() would
+        is_polygon = np.array([geometries[i]["type"] == "Polygon" for i in areas], dtype=bool)
+        out[areas] = np.where(is_polygon, shapely.get_geometry(multipolygons, 0), multipolygons)
+    else:
+        areas = []
+    rest = np.ones(len(geometries), dtype=bool)
+    rest[areas] = False
+    for i in np.flatnonzero(rest):
+        out[i] = shape(geometries[i])
+    return out
+
+
+def _regions_from_features(
+    features: list[dict[str, Any]], key_prop: str, name_prop: str, code_prop: str
+) -> dict[str, ITLRegionGeom]:
+    """Regions keyed by *key_prop*, skipping features that lack it."""
+    kept = [feat for feat in features if feat["properties"].get(key_prop)]
+    geoms = geometries_from_geojson([feat["geometry"] for feat in kept])
+    return _regions_from_arrays(
+        [feat["properties"][key_prop] for feat in kept],
+        [feat["properties"][name_prop] for feat in kept],
+        [feat["properties"].get(code_prop) for feat in kept],
+        geoms,
+    )
+
+
+# Boundary file -> (key, name, code) feature properties for each hierarchy level
+_HIERARCHY_LEVEL_PROPS: dict[str, tuple[str, str, str]] = {
+    "itl3": ("ITL325NM", "ITL325NM", "ITL325CD"),
+    "itl2": ("ITL225NM", "ITL225NM", "ITL225CD"),
+    "itl1": ("ITL125NM", "ITL125NM", "ITL125CD"),
+    "countries": ("CTRY24NM", "CTRY24NM", "CTRY24CD"),
+    "lad": ("LAD25CD", "LAD25NM", "LAD25CD"),
+    "wards": ("WD25CD", "WD25NM", "WD25CD"),
+}
+
+
+def _unpack_regions(packed: dict[str, Any]) -> dict[str, ITLRegionGeom]:
+    return _regions_from_arrays(
+        packed["keys"],
+        packed["names"],
+        packed["codes"],
+        shapely.from_wkb(packed["geom"]),
+        shapely.from_wkb(packed["simplified"]),
+    )
+
+
+def _read_hierarchy_cache(cache_file: Path, stamp: list[Any]) -> ITLHierarchy | None:
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable ITL hierarchy cache %s: %s", cache_file, e)
+        return None
+    if cached.get("version") != _ITL_HIERARCHY_CACHE_VERSION or cached.get("stamp") != stamp:
+        return None
+    hierarchy = dict(cached["links"])
+    for level in _REGION_LEVELS:
+        hierarchy[f"{level}_regions"] = _unpack_regions(cached["regions"][level])
+    return cast(ITLHierarchy, hierarchy)
+
+
+def _write_hierarchy_cache(cache_file: Path, stamp: list[Any], hierarchy: ITLHierarchy) -> None:
+    regions = {
+        level: _pack_regions(hierarchy[f"{level}_regions"])  # type: ignore[literal-required]
+        for level in _REGION_LEVELS
+    }
+    links = {k: v for k, v in hierarchy.items() if not k.endswith("_regions")}
+    payload = {
+        "version": _ITL_HIERARCHY_CACHE_VERSION,
+        "stamp": stamp,
+        "regions": regions,
+        "links": links,
+    }
+    tmp_file = cache_file.with_suffix(cache_file.suffix + ".tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning("Could not write ITL hierarchy cache %s: %s", cache_file, e)
+
+
+def load_itl_hierarchy(
+    paths: dict[str, str], cache_file: str | Path | None = ITL_HIERARCHY_CACHE_FILE
+) -> ITLHierarchy:
+    """Load the ITL hierarchy, reusing *cache_file* while the source files are unchanged.
+
+    Parsing the GeoJSON, simplifying every polygon and resolving the LAD/ward links
+    is identical from run to run, so the built hierarchy is pickled with geometries
+    stored as WKB and rebuilt with bulk ``shapely.from_wkb`` / ``shapely.prepare``
+    calls. The cache is keyed on the mtime and size of every file in *paths*; pass
+    ``cache_file=None`` to always rebuild.
+    """
+    if cache_file is None:
+        return _build_itl_hierarchy(paths)
+    cache_file = Path(cache_file)
+    stamp = _hierarchy_source_stamp(paths)
+    hierarchy = _read_hierarchy_cache(cache_file, stamp)
+    if hierarchy is not None:
+        logger.debug("Loaded ITL hierarchy from cache %s", cache_file)
+        return hierarchy
+    hierarchy = _build_itl_hierarchy(paths)
+    _write_hierarchy_cache(cache_file, stamp, hierarchy)
+    return hierarchy
+
+
+def _build_itl_hierarchy(paths: dict[str, str]) -> ITLHierarchy:
     """Load GeoJSON boundaries and compute hierarchy links.
 
     *paths* maps level names to file paths::
@@ -202,131 +463,67 @@ def load_itl_hierarchy(paths: dict[str, str]) -> ITLHierarchy:
     missing or absent, this function falls back to the legacy centroid /
     feature-property heuristics so older deployments keep working.
     """
-    itl3_data = _load_geojson(paths["itl3"])
-    itl2_data = _load_geojson(paths["itl2"])
-    itl1_data = _load_geojson(paths["itl1"])
-    itl0_data = _load_geojson(paths["countries"])
-    lad_data = _load_geojson(paths["lad"])
+    levels = [level for level in _HIERARCHY_LEVEL_PROPS if level != "wards"]
     wards_path = Path(paths["wards"])
     if wards_path.exists():
-        ward_data = _load_geojson(wards_path)
+        levels.append("wards")
     else:
         logger.warning("Wards file %s not found, skipping ward-level hierarchy", wards_path)
-        ward_data = {"features": []}
-
-    itl3_regions: dict[str, ITLRegionGeom] = {}
-    for feat in itl3_data["features"]:
-        geom = shape(feat["geometry"])
-        itl3_regions[feat["properties"]["ITL325NM"]] = {
-            "name": feat["properties"]["ITL325NM"],
-            "code": feat["properties"].get("ITL325CD"),
-            "geom": geom,
-            "simplified": geom.simplify(_SIMPLIFY_TOLERANCE, preserve_topology=True),
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-
-    itl2_regions: dict[str, ITLRegionGeom] = {}
-    for feat in itl2_data["features"]:
-        geom = shape(feat["geometry"])
-        itl2_regions[feat["properties"]["ITL225NM"]] = {
-            "name": feat["properties"]["ITL225NM"],
-            "code": feat["properties"].get("ITL225CD"),
-            "geom": geom,
-            "simplified": geom.simplify(_SIMPLIFY_TOLERANCE, preserve_topology=True),
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-
-    itl1_regions: dict[str, ITLRegionGeom] = {}
-    for feat in itl1_data["features"]:
-        geom = shape(feat["geometry"])
-        itl1_regions[feat["properties"]["ITL125NM"]] = {
-            "name": feat["properties"]["ITL125NM"],
-            "code": feat["properties"].get("ITL125CD"),
-            "geom": geom,
-            "simplified": geom.simplify(_SIMPLIFY_TOLERANCE, preserve_topology=True),
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-
-    itl0_regions: dict[str, ITLRegionGeom] = {}
-    for feat in itl0_data["features"]:
-        geom = shape(feat["geometry"])
-        itl0_regions[feat["properties"]["CTRY24NM"]] = {
-            "name": feat["properties"]["CTRY24NM"],
-            "code": feat["properties"].get("CTRY24CD"),
-            "geom": geom,
-            "simplified": geom.simplify(_SIMPLIFY_TOLERANCE, preserve_topology=True),
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-
-    lad_regions: dict[str, ITLRegionGeom] = {}
-    for feat in lad_data["features"]:
-        props = feat["properties"]
-        lad_code = props.get("LAD25CD")
-        if not lad_code:
-            continue
-        geom = shape(feat["geometry"])
-        lad_regions[lad_code] = {
-            "name": props["LAD25NM"],
-            "code": lad_code,
-            "geom": geom,
-            "simplified": geom.simplify(_SIMPLIFY_TOLERANCE, preserve_topology=True),
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-
-    ward_regions: dict[str, ITLRegionGeom] = {}
-    ward_to_lad_geojson: dict[str, str | None] = {}
-    for feat in ward_data["features"]:
-        props = feat["properties"]
-        ward_code = props.get("WD25CD")
-        if not ward_code:
-            continue
-        geom = shape(feat["geometry"])
-        ward_regions[ward_code] = {
-            "name": props["WD25NM"],
-            "code": ward_code,
-            "geom": geom,
-            "simplified": geom.simplify(_SIMPLIFY_TOLERANCE, preserve_topology=True),
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-        ward_to_lad_geojson[ward_code] = props.get("LAD25CD")
+    features: dict[str, list[dict[str, Any]]] = {level: [] for level in _HIERARCHY_LEVEL_PROPS}
+    for level, data in zip(levels, json_load_all(paths[level] for level in levels), strict=True):
+        features[level] = data["features"]
+
+    # Levels are independent and most of their cost is GEOS work that releases the GIL
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        built = executor.map(
+            lambda level: _regions_from_features(features[level], *_HIERARCHY_LEVEL_PROPS[level]),
+            _HIERARCHY_LEVEL_PROPS,
+        )
+        regions = dict(zip(_HIERARCHY_LEVEL_PROPS, built, strict=True))
+    itl3_regions = regions["itl3"]
+    itl2_regions = regions["itl2"]
+    itl1_regions = regions["itl1"]
+    itl0_regions = regions["countries"]
+    lad_regions = regions["lad"]
+    ward_regions = regions["wards"]
+    ward_to_lad_geojson: dict[str, str | None] = {
+        feat["properties"]["WD25CD"]: feat["properties"].get("LAD25CD")
+        for feat in features["wards"]
+        if feat["properties"].get("WD25CD")
+    }
 
     itl1_by_code = {r["code"]: r["name"] for r in itl1_regions.values() if r["code"]}
     itl2_by_code = {r["code"]: r["name"] for r in itl2_regions.values() if r["code"]}
 
+    # ITL regions are keyed by name, so each child/parent link is recorded in both
+    # directions from a single pass over the child level.
     itl3_to_itl2: dict[str, str] = {}
+    itl2_to_itl3s: dict[str, list[str]] = {}
     for itl3 in itl3_regions.values():
-        if itl3["code"] and len(itl3["code"]) >= 4:
-            parent = itl3["code"][:4]
-            if parent in itl2_by_code:
-                itl3_to_itl2[itl3["name"]] = itl2_by_code[parent]
+        code = itl3["code"]
+        itl2_name = itl2_by_code.get(code[:4]) if code and len(code) >= 4 else None
+        if itl2_name:
+            itl3_to_itl2[itl3["name"]] = itl2_name
+            itl2_to_itl3s.setdefault(itl2_name, []).append(itl3["name"])
 
     itl2_to_itl1: dict[str, str] = {}
-    for itl2 in itl2_regions.values():
-        if itl2["code"] and len(itl2["code"]) >= 3:
-            parent = itl2["code"][:3]
-            if parent in itl1_by_code:
-                itl2_to_itl1[itl2["name"]] = itl1_by_code[parent]
-
     itl1_to_itl2s: dict[str, list[str]] = {}
-    for itl2_name, itl1_name in itl2_to_itl1.items():
-        itl1_to_itl2s.setdefault(itl1_name, []).append(itl2_name)
+    for itl2 in itl2_regions.values():
+        code = itl2["code"]
+        itl1_name = itl1_by_code.get(code[:3]) if code and len(code) >= 3 else None
+        if itl1_name:
+            itl2_to_itl1[itl2["name"]] = itl1_name
+            itl1_to_itl2s.setdefault(itl1_name, []).append(itl2["name"])
 
     itl0_to_itl1s: dict[str, list[str]] = {}
-    for itl1_name, itl1 in itl1_regions.items():
-        for itl0_name, itl0 in itl0_regions.items():
-            if itl0["prepared"].contains(itl1["centroid"]):
-                itl0_to_itl1s.setdefault(itl0_name, []).append(itl1_name)
-                break
-
-    itl2_to_itl3s: dict[str, list[str]] = {}
-    for itl3_name, itl2_name in itl3_to_itl2.items():
-        itl2_to_itl3s.setdefault(itl2_name, []).append(itl3_name)
+    itl0_order = list(itl0_regions)
+    itl1_centroids = np.array([r["centroid"] for r in itl1_regions.values()], dtype=object)
+    for itl1_name, hits in zip(
+        itl1_regions, _regions_containing(itl0_regions, itl1_centroids), strict=True
+    ):
+        itl0_name = _first_of(itl0_order, hits)
+        if itl0_name:
+            itl0_to_itl1s.setdefault(itl0_name, []).append(itl1_name)
 
     # ------------------------------------------------------------------
     # LAD <-> ITL3 mapping
@@ -370,28 +567,23 @@ def load_itl_hierarchy(paths: dict[str, str]) -> ITLHierarchy:
     missing_lads = [code for code in lad_regions if code not in lad_to_itl3]
     if missing_lads:
         logger.debug("  Centroid fallback for %d LAD(s)", len(missing_lads))
-        for lad_code in missing_lads:
-            lad = lad_regions[lad_code]
-            centroid = lad["centroid"]
-            found_itl1 = None
-            for itl1 in itl1_regions.values():
-                if itl1["prepared"].contains(centroid):
-                    found_itl1 = itl1["name"]
-                    break
-            if not found_itl1:
+        centroids = np.array([lad_regions[code]["centroid"] for code in missing_lads], dtype=object)
+        in_itl1 = _regions_containing(itl1_regions, centroids)
+        in_itl2 = _regions_containing(itl2_regions, centroids)
+        in_itl3 = _regions_containing(itl3_regions, centroids)
+        itl1_order = list(itl1_regions)
+        for i, lad_code in enumerate(missing_lads):
+            itl1_key = _first_of(itl1_order, in_itl1[i])
+            if not itl1_key:
                 continue
-            found_itl2 = None
-            for itl2_name in itl1_to_itl2s.get(found_itl1, []):
-                if itl2_regions[itl2_name]["prepared"].contains(centroid):
-                    found_itl2 = itl2_name
-                    break
+            found_itl1 = itl1_regions[itl1_key]["name"]
+            found_itl2 = _first_of(itl1_to_itl2s.get(found_itl1, []), in_itl2[i])
             if not found_itl2:
                 continue
-            for itl3_name in itl2_to_itl3s.get(found_itl2, []):
-                if itl3_regions[itl3_name]["prepared"].contains(centroid):
-                    lad_to_itl3[lad_code] = itl3_name
-                    itl3_to_lads.setdefault(itl3_name, []).append(lad_code)
-                    break
+            itl3_name = _first_of(itl2_to_itl3s.get(found_itl2, []), in_itl3[i])
+            if itl3_name:
+                lad_to_itl3[lad_code] = itl3_name
+                itl3_to_lads.setdefault(itl3_name, []).append(lad_code)
 
     logger.debug("  Assigned %d of %d LADs to ITL3 regions", len(lad_to_itl3), len(lad_regions))
     logger.debug("  %d ITL3 regions contain LADs", len(itl3_to_lads))
@@ -452,6 +644,65 @@ def load_itl_hierarchy(paths: dict[str, str]) -> ITLHierarchy:
     }
 
 
+_RegionPath = tuple[str | None, str | None, str | None, str | None, str | None, str | None]
+
+
+def _regions_containing(regions: dict[str, ITLRegionGeom], points: np.ndarray) -> list[set[str]]:
+    """Keys of *regions* containing each of *points*, from one bulk STRtree query."""
+    hits: list[set[str]] = [set() for _ in range(len(points))]
+    if not regions or not len(points):
+        return hits
+    keys = list(regions)
+    tree = shapely.STRtree([r["geom"] for r in regions.values()])
+    point_idx, region_idx = tree.query(points, predicate="within")
+    for p, r in zip(point_idx.tolist(), region_idx.tolist(), strict=True):
+        hits[p].add(keys[r])
+    return hits
+
+
+def _first_of(candidates: list[str], hits: set[str]) -> str | None:
+    if not hits:
+        return None
+    return next((key for key in candidates if key in hits), None)
+
+
+def _locate_points(
+    lons: np.ndarray, lats: np.ndarray, itl_hierarchy: ITLHierarchy
+) -> list[_RegionPath]:
+    """(itl0, itl1, itl2, itl3, lad, ward) for each point via hierarchical containment.
+
+    Each level is resolved with one STRtree query over all points instead of a
+    ``prepared.contains`` call per point per candidate region. The result is then
+    narrowed top-down exactly as before: a level only counts when it is a child of the
+    region picked one level up, and ties go to the first child in hierarchy order.
+    """
+    points = shapely.points(lons, lats)
+    in_itl0 = _regions_containing(itl_hierarchy["itl0_regions"], points)
+    in_itl1 = _regions_containing(itl_hierarchy["itl1_regions"], points)
+    in_itl2 = _regions_containing(itl_hierarchy["itl2_regions"], points)
+    in_itl3 = _regions_containing(itl_hierarchy["itl3_regions"], points)
+    in_lad = _regions_containing(itl_hierarchy["lad_regions"], points)
+    in_ward = _regions_containing(itl_hierarchy["ward_regions"], points)
+
+    itl0_order = list(itl_hierarchy["itl0_regions"])
+    itl1_order = list(itl_hierarchy["itl1_regions"])
+    itl1_to_itl2s = itl_hierarchy["itl1_to_itl2s"]
+    itl2_to_itl3s = itl_hierarchy["itl2_to_itl3s"]
+    itl3_to_lads = itl_hierarchy["itl3_to_lads"]
+    lad_to_wards = itl_hierarchy["lad_to_wards"]
+
+    located: list[_RegionPath] = []
+    for i in range(len(points)):
+        itl0 = _first_of(itl0_order, in_itl0[i])
+        itl1 = _first_of(itl1_order, in_itl1[i])
+        itl2 = _first_of(itl1_to_itl2s.get(itl1, []), in_itl2[i]) if itl1 else None
+        itl3 = _first_of(itl2_to_itl3s.get(itl2, []), in_itl3[i]) if itl2 else None
+        lad = _first_of(itl3_to_lads.get(itl3, []), in_lad[i]) if itl3 else None
+        ward = _first_of(lad_to_wards.get(lad, []), in_ward[i]) if lad else None
+        located.append((itl0, itl1, itl2, itl3, lad, ward))
+    return located
+
+
 def preassign_itl_regions(items: list[MarkerItem], itl_hierarchy: ITLHierarchy) -> None:
     """Pre-compute ITL region assignments for all items in a single pass.
 
@@ -460,73 +711,16 @@ def preassign_itl_regions(items: list[MarkerItem], itl_hierarchy: ITLHierarchy)
     skip per-map spatial queries.  Identical ``(latitude, longitude)`` pairs
     are only queried once.
     """
-    itl0_regions = itl_hierarchy["itl0_regions"]
-    itl1_regions = itl_hierarchy["itl1_regions"]
-    itl2_regions = itl_hierarchy["itl2_regions"]
-    itl3_regions = itl_hierarchy["itl3_regions"]
-    lad_regions = itl_hierarchy["lad_regions"]
-    ward_regions = itl_hierarchy["ward_regions"]
-    itl1_to_itl2s = itl_hierarchy["itl1_to_itl2s"]
-    itl2_to_itl3s = itl_hierarchy["itl2_to_itl3s"]
-    itl3_to_lads = itl_hierarchy["itl3_to_lads"]
-    lad_to_wards = itl_hierarchy["lad_to_wards"]
-
-    seen: dict[tuple[float, float], tuple[str | None, ...]] = {}
+    unique_coords = list(dict.fromkeys((item.latitude, item.longitude) for item in items))
+    seen: dict[tuple[float, float], _RegionPath] = {}
+    if unique_coords:
+        coords = np.array(unique_coords, dtype=np.float64)
+        located = _locate_points(coords[:, 1], coords[:, 0], itl_hierarchy)
+        seen = dict(zip(unique_coords, located, strict=True))
 
     for item in items:
         key = (item.latitude, item.longitude)
-        if key in seen:
-            item.itl0, item.itl1, item.itl2, item.itl3, item.lad, item.ward = seen[key]
-            continue
-
-        point = Point(item.longitude, item.latitude)
-        _itl0 = _itl1 = _itl2 = _itl3 = _lad = _ward = None
-
-        for r in itl0_regions.values():
-            if r["prepared"].contains(point):
-                _itl0 = r["name"]
-                break
-
-        for r in itl1_regions.values():
-            if r["prepared"].contains(point):
-                _itl1 = r["name"]
-                break
-
-        if _itl1:
-            for name in itl1_to_itl2s.get(_itl1, []):
-                if itl2_regions[name]["prepared"].contains(point):
-                    _itl2 = name
-                    break
-
-        if _itl2:
-            for name in itl2_to_itl3s.get(_itl2, []):
-                if itl3_regions[name]["prepared"].contains(point):
-                    _itl3 = name
-                    break
-
-        if _itl3:
-            for code in itl3_to_lads.get(_itl3, []):
-                lad = lad_regions.get(code)
-                if lad and lad["prepared"].contains(point):
-                    _lad = code
-                    break
-
-        if _lad and ward_regions:
-            for code in lad_to_wards.get(_lad, []):
-                ward = ward_regions.get(code)
-                if ward and ward["prepared"].contains(point):
-                    _ward = code
-                    break
-
-        item.itl0, item.itl1, item.itl2, item.itl3, item.lad, item.ward = (
-            _itl0,
-            _itl1,
-            _itl2,
-            _itl3,
-            _lad,
-            _ward,
-        )
-        seen[key] = (_itl0, _itl1, _itl2, _itl3, _lad, _ward)
+        item.itl0, item.itl1, item.itl2, item.itl3, item.lad, item.ward = seen[key]
 
     logger.debug(
         "Pre-assigned ITL regions for %d items (%d unique locations)",
@@ -535,6 +729,73 @@ def preassign_itl_regions(items: list[MarkerItem], itl_hierarchy: ITLHierarchy)
     )
 
 
+def simplified_features(
+    features: list[dict[str, Any]],
+    within: BaseGeometry | None = None,
+    *,
+    geoms: np.ndarray | None = None,
+) -> list[dict[str, Any]]:
+    """GeoJSON *features* with simplified geometries, for embedding in map pages.
+
+    With *within*, only features whose centroid lies inside it are kept. *geoms* are
+    the already-parsed geometries of *features*, if the caller has them. The whole
+    layer is filtered and simplified with bulk shapely calls. Only the ONS name and
+    code properties (``*NM`` / ``*CD``) are kept; the rest are never read client-side.
+    """
+    if geoms is None:
+        geoms = geometries_from_geojson([f["geometry"] for f in features])
+    if within is not None and len(geoms):
+        shapely.prepare(within)
+        keep = shapely.contains(within, shapely.centroid(geoms))
+        features = list(itertools.compress(features, keep))
+        geoms = geoms[keep]
+    simplified = shapely.simplify(geoms, _SIMPLIFY_TOLERANCE, preserve_topology=True)
+    return [
+        {
+            "type": "Feature",
+            "geometry": geometry,
+            "properties": {
+                key: value
+                for key, value in f.get("properties", {}).items()
+                if key.endswith(_BOUNDARY_PROPERTY_SUFFIXES)
+            },
+        }
+        for f, geometry in zip(features, _embedded_mappings(simplified), strict=True)
+    ]
+
+
+# Bump when the shared boundaries format changes, so stale exports are rewritten
+_SHARED_BOUNDARIES_VERSION = 1
+
+
+def write_shared_boundaries(boundary_data: dict[str, Any], output_path: str | Path) -> None:
+    """Write *boundary_data* to *output_path* plus a gzipped ``.gz`` copy beside it.
+
+    Map pages fetch the ``.gz`` copy (see :func:`shared_boundaries_fetch_js`); the plain
+    file is kept for inline embedding and for browsers without ``DecompressionStream``.
+    """
+    output_path = Path(output_path)
+    json_dump_file(boundary_data, output_path)
+    gz_path = output_path.with_name(output_path.name + ".gz")
+    # mtime=0 keeps the archive byte-identical when the boundaries have not changed
+    gz_path.write_bytes(gzip.compress(output_path.read_bytes(), compresslevel=9, mtime=0))
+
+
+def shared_boundaries_fetch_js(shared_path: str) -> str:
+    """JS expression resolving to the shared boundaries object under *shared_path*.
+
+    Prefers ``boundaries.json.gz`` inflated with ``DecompressionStream`` and falls back
+    to the plain file when the stream API is missing or the compressed fetch fails.
+    """
+    plain = f"fetch('{shared_path}/boundaries.json').then(r => r.json())"
+    return (
+        f"(window.DecompressionStream ? fetch('{shared_path}/boundaries.json.gz').then(r => {{"
+        " if (!r.ok) throw new Error(r.status);"
+        " return new Response(r.body.pipeThrough(new DecompressionStream('gzip'))).json();"
+        f" }}).catch(() => {plain}) : {plain})"
+    )
+
+
 def export_shared_boundaries(
     paths: dict[str, str],
     output_dir: str = "dist/shared",
@@ -551,13 +812,32 @@ def export_shared_boundaries(
 
     If *itl_hierarchy* is supplied, pre-simplified geometries are used directly
     instead of re-loading and simplifying the raw GeoJSON files.
+
+    A stamp of the source files is written beside the output; while it still matches,
+    the export is skipped even without *skip_if_exists*.
     """
     output_dir_path = Path(output_dir)
     output_dir_path.mkdir(parents=True, exist_ok=True)
     output_path = output_dir_path / "boundaries.json"
-    if skip_if_exists and output_path.exists():
-        logger.debug("Shared boundary file already exists at %s, skipping export.", output_path)
-        return
+    stamp_path = output_dir_path / "boundaries.stamp.json"
+    stamp = json_dumps(
+        {
+            "version": _SHARED_BOUNDARIES_VERSION,
+            "sources": _hierarchy_source_stamp(paths),
+            "countries": country_names or [],
+        }
+    )
+    if output_path.exists() and output_path.with_name("boundaries.json.gz").exists():
+        if skip_if_exists:
+            logger.debug("Shared boundary file already exists at %s, skipping export.", output_path)
+            return
+        try:
+            up_to_date = stamp_path.read_text(encoding="utf-8") == stamp
+        except FileNotFoundError:
+            up_to_date = False
+        if up_to_date:
+            logger.debug("Shared boundary file %s is up to date, skipping export.", output_path)
+            return
 
     boundary_data: dict[str, Any] = {
         "countries": {},
@@ -575,26 +855,39 @@ def export_shared_boundaries(
         country_geoms: list[BaseGeometry] = []
         for name, region in itl_hierarchy["itl0_regions"].items():
             if name in country_set:
+                (geometry,) = _embedded_mappings([region["simplified"]])
                 boundary_data["countries"][name] = {
                     "type": "FeatureCollection",
                     "features": [
                         {
                             "type": "Feature",
-                            "geometry": mapping(region["simplified"]),
+                            "geometry": geometry,
                             "properties": {"CTRY24NM": name, "CTRY24CD": region["code"]},
                         }
                     ],
                 }
                 country_geoms.append(region["geom"])
 
-        country_filter: PreparedGeometry | None = None
+        country_filter: BaseGeometry | None = None
         if country_geoms:
-            country_filter = prep(unary_union(country_geoms))
-
-        def _in_countries(centroid: Point) -> bool:
-            if country_filter is None:
-                return True
-            return country_filter.contains(centroid)
+            country_filter = unary_union(country_geoms)
+            shapely.prepare(country_filter)
+
+        def _regions_in_countries(
+            regions: dict[str, ITLRegionGeom],
+        ) -> list[tuple[str, ITLRegionGeom, dict[str, Any]]]:
+            # One vectorized containment test and one snapping call per level rather than
+            # one call per region
+            entries = list(regions.items())
+            if country_filter is not None and entries:
+                centroids = np.array([region["centroid"] for _, region in entries], dtype=object)
+                keep = shapely.contains(country_filter, centroids)
+                entries = list(itertools.compress(entries, keep))
+            geometries = _embedded_mappings([region["simplified"] for _, region in entries])
+            return [
+                (key, region, geometry)
+                for (key, region), geometry in zip(entries, geometries, strict=True)
+            ]
 
         level_map = {
             "itl_1": itl_hierarchy["itl1_regions"],
@@ -603,53 +896,49 @@ def export_shared_boundaries(
         }
         for bd_key, regions in level_map.items():
             feats = []
-            for region in regions.values():
-                if not _in_countries(region["centroid"]):
-                    continue
+            prefix = bd_key.upper().replace("_", "")
+            for _, region, geometry in _regions_in_countries(regions):
                 feats.append(
                     {
                         "type": "Feature",
-                        "geometry": mapping(region["simplified"]),
+                        "geometry": geometry,
                         "properties": {
-                            f"{bd_key.upper().replace('_', '')}25NM": region["name"],
-                            f"{bd_key.upper().replace('_', '')}25CD": region["code"],
+                            f"{prefix}25NM": region["name"],
+                            f"{prefix}25CD": region["code"],
                         },
                     }
                 )
             boundary_data[bd_key] = {"type": "FeatureCollection", "features": feats}
 
         lad_feats = []
-        for region in itl_hierarchy["lad_regions"].values():
-            if not _in_countries(region["centroid"]):
-                continue
+        for _, region, geometry in _regions_in_countries(itl_hierarchy["lad_regions"]):
             lad_feats.append(
                 {
                     "type": "Feature",
-                    "geometry": mapping(region["simplified"]),
+                    "geometry": geometry,
                     "properties": {"LAD25NM": region["name"], "LAD25CD": region["code"]},
                 }
             )
         boundary_data["lad"] = {"type": "FeatureCollection", "features": lad_feats}
 
         ward_feats = []
-        for wcode, region in itl_hierarchy["ward_regions"].items():
-            if not _in_countries(region["centroid"]):
-                continue
+        ward_to_lad = itl_hierarchy["ward_to_lad"]
+        for wcode, region, geometry in _regions_in_countries(itl_hierarchy["ward_regions"]):
             ward_feats.append(
                 {
                     "type": "Feature",
-                    "geometry": mapping(region["simplified"]),
+                    "geometry": geometry,
                     "properties": {
                         "WD25NM": region["name"],
                         "WD25CD": region["code"],
-                        "LAD25CD": itl_hierarchy["ward_to_lad"].get(wcode),
+                        "LAD25CD": ward_to_lad.get(wcode),
                     },
                 }
             )
         boundary_data["wards"] = {"type": "FeatureCollection", "features": ward_feats}
     else:
         # Fallback: load raw GeoJSON files and simplify on the fly.
-        country_filter_fb: PreparedGeometry | None = None
+        country_filter_fb: BaseGeometry | None = None
         countries_path = Path(paths["countries"])
         if countries_path.exists():
             countries_data = _load_geojson(countries_path)
@@ -659,85 +948,40 @@ def export_shared_boundaries(
                     f for f in countries_data["features"] if f["properties"].get("CTRY24NM") == name
                 ]
                 if feats:
+                    geoms = geometries_from_geojson([f["geometry"] for f in feats])
                     boundary_data["countries"][name] = {
                         "type": "FeatureCollection",
-                        "features": [
-                            {
-                                "type": "Feature",
-                                "geometry": mapping(
-                                    shape(f["geometry"]).simplify(0.001, preserve_topology=True)
-                                ),
-                                "properties": f.get("properties", {}),
-                            }
-                            for f in feats
-                        ],
+                        "features": simplified_features(feats, geoms=geoms),
                     }
-                    country_geoms_fb.extend(shape(f["geometry"]) for f in feats)
+                    country_geoms_fb.extend(geoms)
             if country_geoms_fb:
-                country_filter_fb = prep(unary_union(country_geoms_fb))
-
-        def _feature_in_countries(feat: dict[str, Any]) -> bool:
-            if country_filter_fb is None:
-                return True
-            return country_filter_fb.contains(shape(feat["geometry"]).centroid)
-
-        for level, key in [("ITL_1", "itl1"), ("ITL_2", "itl2"), ("ITL_3", "itl3")]:
-            gp = Path(paths.get(key, f"boundaries/{level}.geojson"))
-            if gp.exists():
-                data = _load_geojson(gp)
-                boundary_data[level.lower()] = {
-                    "type": "FeatureCollection",
-                    "features": [
-                        {
-                            "type": "Feature",
-                            "geometry": mapping(
-                                shape(f["geometry"]).simplify(0.001, preserve_topology=True)
-                            ),
-                            "properties": f.get("properties", {}),
-                        }
-                        for f in data["features"]
-                        if _feature_in_countries(f)
-                    ],
-                }
+                country_filter_fb = unary_union(country_geoms_fb)
 
-        lad_path = Path(paths["lad"])
-        if lad_path.exists():
-            data = _load_geojson(lad_path)
-            boundary_data["lad"] = {
-                "type": "FeatureCollection",
-                "features": [
-                    {
-                        "type": "Feature",
-                        "geometry": mapping(
-                            shape(f["geometry"]).simplify(0.001, preserve_topology=True)
-                        ),
-                        "properties": f.get("properties", {}),
-                    }
-                    for f in data["features"]
-                    if _feature_in_countries(f)
-                ],
-            }
-
-        wards_path = Path(paths["wards"])
-        if wards_path.exists():
-            data = _load_geojson(wards_path)
-            boundary_data["wards"] = {
-                "type": "FeatureCollection",
-                "features": [
-                    {
-                        "type": "Feature",
-                        "geometry": mapping(
-                            shape(f["geometry"]).simplify(0.001, preserve_topology=True)
-                        ),
-                        "properties": f.get("properties", {}),
-                    }
-                    for f in data["features"]
-                    if _feature_in_countries(f)
-                ],
-            }
-
-    with open(output_path, "w") as fout:
-        json.dump(boundary_data, fout, separators=(",", ":"))
+        layer_paths = {
+            level.lower(): Path(paths.get(key, f"boundaries/{level}.geojson"))
+            for level, key in [("ITL_1", "itl1"), ("ITL_2", "itl2"), ("ITL_3", "itl3")]
+        }
+        layer_paths["lad"] = Path(paths["lad"])
+        layer_paths["wards"] = Path(paths["wards"])
+        layer_paths = {level: path for level, path in layer_paths.items() if path.exists()}
+        filter_wkb = None if country_filter_fb is None else shapely.to_wkb(country_filter_fb)
+
+        def _simplify_layer(path: Path) -> dict[str, Any]:
+            # Each layer gets its own copy of the filter: a prepared geometry must not be
+            # queried from several threads at once
+            within = None if filter_wkb is None else shapely.from_wkb(filter_wkb)
+            # Parsed inside the task, so a raw layer is freed once it is simplified rather
+            # than every layer's features being held until the last one is done
+            features = simplified_features(_load_geojson(path)["features"], within)
+            return {"type": "FeatureCollection", "features": features}
+
+        # The layers are independent, and simplification is GEOS work that releases the GIL
+        with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            layers = executor.map(_simplify_layer, layer_paths.values())
+            boundary_data.update(zip(layer_paths, layers, strict=True))
+
+    write_shared_boundaries(boundary_data, output_path)
+    stamp_path.write_text(stamp, encoding="utf-8")
 
     logger.debug("Exported shared boundary data to: %s", output_path)
 
@@ -824,82 +1068,31 @@ def _assign_items_to_itl_regions(
                 if item["ward"]:
                     ward_to_items.setdefault(item["ward"], []).append(item)
     else:
-        itl0_regions = itl_hierarchy["itl0_regions"]
-        itl1_regions = itl_hierarchy["itl1_regions"]
-        itl2_regions = itl_hierarchy["itl2_regions"]
-        itl3_regions = itl_hierarchy["itl3_regions"]
-        lad_regions = itl_hierarchy["lad_regions"]
-        ward_regions = itl_hierarchy["ward_regions"]
-        itl1_to_itl2s = itl_hierarchy["itl1_to_itl2s"]
-        itl2_to_itl3s = itl_hierarchy["itl2_to_itl3s"]
-        itl3_to_lads = itl_hierarchy["itl3_to_lads"]
-        lad_to_wards = itl_hierarchy["lad_to_wards"]
-
-        for _, items in items_by_tier.items():
-            for item in items:
-                total_items += 1
-                point = Point(item.get("longitude", 0.0), item.get("latitude", 0.0))
-
-                item["itl0"] = None
-                item["itl1"] = None
-                item["itl2"] = None
-                item["itl3"] = None
-                item["lad"] = None
-                item["ward"] = None
-
-                for itl0 in itl0_regions.values():
-                    if itl0["prepared"].contains(point):
-                        item["itl0"] = itl0["name"]
-                        itl0_to_items.setdefault(itl0["name"], []).append(item)
-                        break
-
-                found_itl1 = None
-                for itl1 in itl1_regions.values():
-                    if itl1["prepared"].contains(point):
-                        found_itl1 = itl1["name"]
-                        item["itl1"] = found_itl1
-                        itl1_to_items.setdefault(found_itl1, []).append(item)
-                        break
-                if not found_itl1:
-                    continue
-
-                found_itl2 = None
-                for itl2_name in itl1_to_itl2s.get(found_itl1, []):
-                    if itl2_regions[itl2_name]["prepared"].contains(point):
-                        found_itl2 = itl2_name
-                        item["itl2"] = found_itl2
-                        itl2_to_items.setdefault(found_itl2, []).append(item)
-                        break
-                if not found_itl2:
-                    continue
-
-                found_itl3 = None
-                for itl3_name in itl2_to_itl3s.get(found_itl2, []):
-                    if itl3_regions[itl3_name]["prepared"].contains(point):
-                        found_itl3 = itl3_name
-                        item["itl3"] = itl3_name
-                        itl3_to_items.setdefault(itl3_name, []).append(item)
-                        total_assigned += 1
-                        break
-                if not found_itl3:
-                    continue
-
-                found_lad = None
-                for lad_code in itl3_to_lads.get(found_itl3, []):
-                    lad = lad_regions.get(lad_code)
-                    if lad and lad["prepared"].contains(point):
-                        found_lad = lad_code
-                        item["lad"] = lad_code
-                        lad_to_items.setdefault(lad_code, []).append(item)
-                        break
-
-                if found_lad and ward_regions:
-                    for ward_code in lad_to_wards.get(found_lad, []):
-                        ward = ward_regions.get(ward_code)
-                        if ward and ward["prepared"].contains(point):
-                            item["ward"] = ward_code
-                            ward_to_items.setdefault(ward_code, []).append(item)
-                            break
+        all_items = [item for items in items_by_tier.values() for item in items]
+        total_items = len(all_items)
+        lons = np.fromiter(
+            (item.get("longitude", 0.0) for item in all_items), dtype=np.float64, count=total_items
+        )
+        lats = np.fromiter(
+            (item.get("latitude", 0.0) for item in all_items), dtype=np.float64, count=total_items
+        )
+        for item, path in zip(all_items, _locate_points(lons, lats, itl_hierarchy), strict=True):
+            itl0, itl1, itl2, itl3, lad, ward = path
+            item["itl0"], item["itl1"], item["itl2"] = itl0, itl1, itl2
+            item["itl3"], item["lad"], item["ward"] = itl3, lad, ward
+            if itl0:
+                itl0_to_items.setdefault(itl0, []).append(item)
+            if itl1:
+                itl1_to_items.setdefault(itl1, []).append(item)
+            if itl2:
+                itl2_to_items.setdefault(itl2, []).append(item)
+            if itl3:
+                itl3_to_items.setdefault(itl3, []).append(item)
+                total_assigned += 1
+            if lad:
+                lad_to_items.setdefault(lad, []).append(item)
+            if ward:
+                ward_to_items.setdefault(ward, []).append(item)
 
     logger.debug("ITL Region Assignment%s:", " (pre-assigned)" if pre_assigned else "")
     logger.debug("  Assigned %d of %d items to ITL regions", total_assigned, total_items)
@@ -932,45 +1125,100 @@ def _pick_color(palette: list[str], index: int) -> str:
 # ---------------------------------------------------------------------------
 
 
+_VoronoiSites = tuple[tuple[float, float, str], ...]
+"""``(longitude, latitude, group)`` per item, in item order."""
+
+_VORONOI_CACHE_MAX = 4096
+_voronoi_cache: dict[
+    tuple[int, _VoronoiSites], tuple[BaseGeometry, list[tuple[str, BaseGeometry]]]
+] = {}
+
+
 def _create_bounded_voronoi(
     items: list[_PlacedItem], boundary_geom: BaseGeometry, group_colors: dict[str, str]
 ) -> list[dict[str, Any]]:
-    """Voronoi diagram bounded and clipped to *boundary_geom*, merged by group."""
+    """Voronoi diagram bounded and clipped to *boundary_geom*, merged by group.
+
+    The same region is often split among the same teams by several maps (each tier map,
+    the all-tiers map, merit maps), so the merged cells are memoized per boundary and
+    site list. The key uses the boundary's identity; the entry keeps the boundary
+    alive and is checked with ``is`` so a recycled id can never produce a false hit.
+    """
     if len(items) < 2:
         return []
 
-    points = np.array([[it["latitude"], it["longitude"]] for it in items])
-    minx, miny, maxx, maxy = boundary_geom.bounds
-    padding = max(maxx - minx, maxy - miny) * 2
-    corners = np.array(
-        [
-            [miny - padding, minx - padding],
-            [miny - padding, maxx + padding],
-            [maxy + padding, maxx + padding],
-            [maxy + padding, minx - padding],
-        ]
+    sites: _VoronoiSites = tuple((it["longitude"], it["latitude"], it["group"]) for it in items)
+    key = (id(boundary_geom), sites)
+    cached = _voronoi_cache.get(key)
+    if cached is not None and cached[0] is boundary_geom:
+        group_cells = cached[1]
+    else:
+        group_cells = _voronoi_group_cells(sites, boundary_geom)
+        if len(_voronoi_cache) >= _VORONOI_CACHE_MAX:
+            _voronoi_cache.clear()
+        _voronoi_cache[key] = (boundary_geom, group_cells)
+    return [{"geom": geom, "color": group_colors[grp], "group": grp} for grp, geom in group_cells]
+
+
+def _voronoi_group_cells(
+    sites: _VoronoiSites, boundary_geom: BaseGeometry
+) -> list[tuple[str, BaseGeometry]]:
+    """``(group, merged cells)`` in order of each group's first non-empty cell."""
+    # GEOS rejects coincident sites, so build cells for distinct coordinates and let
+    # items sharing a ground share its cell. Interning through a dict numbers the grounds
+    # in one pass, without building a coordinate array just to sort it for np.unique.
+    site_index: dict[tuple[float, float], int] = {}
+    site_of_item = np.fromiter(
+        (site_index.setdefault((lon, lat), len(site_index)) for lon, lat, _ in sites),
+        dtype=np.intp,
+        count=len(sites),
     )
-    all_points = np.vstack([points, corners])
-    vor = Voronoi(all_points)
-
-    cells_by_group: dict[str, list[Any]] = defaultdict(list)
-    for idx in range(len(items)):
-        region_idx = vor.point_region[idx]
-        region_vertices = vor.regions[region_idx]
-        if not region_vertices or -1 in region_vertices:
-            continue
-        vertices = [(vor.vertices[i][1], vor.vertices[i][0]) for i in region_vertices]
-        if len(vertices) < 3:
-            continue
-        clipped = Polygon(vertices).intersection(boundary_geom)
-        if not clipped.is_empty and hasattr(clipped, "area") and clipped.area > 0:
-            cells_by_group[items[idx]["group"]].append(clipped)
-
-    result = []
-    for grp, cells in cells_by_group.items():
-        if cells:
-            result.append({"geom": unary_union(cells), "color": group_colors[grp], "group": grp})
-    return result
+    unique_coords = np.array(list(site_index), dtype=np.float64)
+    if len(unique_coords) == 1:
+        # Every item shares one ground, whose cell is the whole boundary
+        clipped = np.array([boundary_geom], dtype=object)
+    else:
+        cells = shapely.get_parts(
+            shapely.voronoi_polygons(
+                shapely.multipoints(unique_coords), extend_to=boundary_geom, ordered=True
+            )
+        )
+        clipped = shapely.intersection(cells, boundary_geom)
+        # A cell touching a multi-part boundary along an edge comes back as a collection
+        # with stray lines or points; keep only its polygonal parts.
+        collections = shapely.get_type_id(clipped) == shapely.GeometryType.GEOMETRYCOLLECTION
+        for i in np.flatnonzero(collections):
+            parts = shapely.get_parts(clipped[i])
+            clipped[i] = shapely.union_all(parts[shapely.area(parts) > 0])
+    keep = shapely.area(clipped)[site_of_item] > 0
+
+    # Intern group names to small ints so grouping is integer comparisons, not string ones
+    group_ids: dict[str, int] = {}
+    item_group = np.fromiter(
+        (group_ids.setdefault(grp, len(group_ids)) for _, _, grp in sites),
+        dtype=np.intp,
+        count=len(sites),
+    )
+    group_names = list(group_ids)
+    kept = np.flatnonzero(keep)
+    kept_group = item_group[kept]
+    present, first_seen, counts = np.unique(kept_group, return_index=True, return_counts=True)
+    # One stable sort lays each group's sites out contiguously, in item order, so every
+    # group is a slice rather than a fresh boolean mask over all kept items.
+    by_group = np.split(
+        site_of_item[kept[np.argsort(kept_group, kind="stable")]], np.cumsum(counts)[:-1]
+    )
+
+    # Cells of distinct sites tile the boundary edge to edge, so each group's cells can
+    # be merged with a coverage union, which only has to drop the shared edges. Most
+    # split regions hold a handful of grounds, and a group with one ground just keeps
+    # its cell.
+    merged: list[tuple[str, BaseGeometry]] = []
+    for i in np.argsort(first_seen):
+        cells = clipped[np.unique(by_group[i])]
+        geom = cells[0] if len(cells) == 1 else shapely.coverage_union_all(cells)
+        merged.append((group_names[present[i]], geom))
+    return merged
 
 
 def _collect_group_geometries(
@@ -1009,13 +1257,24 @@ def _collect_group_geometries(
     }
     lad_to_itl3 = itl_hierarchy["lad_to_itl3"]
 
-    item_ids = {id(it) for it in items}
+    # Items already carry their region keys, so bucket this tier's items directly rather
+    # than filtering every region's list (which spans all tiers) once per tier. Regions keep
+    # the order of *region_to_items* so territory output is unchanged.
+    # The groups present in each region are collected in the same pass, so the ownership
+    # checks below never rescan a region's items.
     filtered: dict[str, dict[str, list[_PlacedItem]]] = {}
+    groups_in: dict[str, dict[str, set[str]]] = {}
     for level in all_levels:
+        by_region: dict[str, list[_PlacedItem]] = {}
+        groups_by_region: dict[str, set[str]] = {}
+        for it in items:
+            rk = it[level]  # type: ignore[literal-required]
+            if rk:
+                by_region.setdefault(rk, []).append(it)
+                groups_by_region.setdefault(rk, set()).add(it["group"])
         level_map = region_to_items.get(level, {})
-        filtered[level] = {
-            rk: [it for it in rk_items if id(it) in item_ids] for rk, rk_items in level_map.items()
-        }
+        filtered[level] = {rk: by_region[rk] for rk in level_map if rk in by_region}
+        groups_in[level] = groups_by_region
 
     tier_num = items[0].get("tier_num", 999)
     if config.tier_entry_level and tier_num in config.tier_entry_level:
@@ -1033,15 +1292,41 @@ def _collect_group_geometries(
 
     group_geometries: dict[str, list[BaseGeometry]] = {}
 
+    # Structure-of-arrays copy of the tier's coordinates: nearest-item searches index into
+    # these and run one vectorized haversine instead of a Python call per candidate.
+    item_index = {id(it): i for i, it in enumerate(items)}
+    item_lats = np.fromiter((it["latitude"] for it in items), dtype=np.float64, count=len(items))
+    item_lons = np.fromiter((it["longitude"] for it in items), dtype=np.float64, count=len(items))
+
+    # Candidate lists are always lists held by *filtered*, and every empty child of a
+    # region searches the same one, so their coordinates are gathered once per list.
+    coords_by_list: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    def list_coords(parent_items: list[_PlacedItem]) -> tuple[np.ndarray, np.ndarray]:
+        coords = coords_by_list.get(id(parent_items))
+        if coords is None:
+            idx = np.fromiter(
+                (item_index[id(it)] for it in parent_items), dtype=np.intp, count=len(parent_items)
+            )
+            coords = coords_by_list[id(parent_items)] = (item_lats[idx], item_lons[idx])
+        return coords
+
     def closest_group(parent_items: list[_PlacedItem], centroid: Point) -> str | None:
         if not parent_items:
             return None
-        clat, clon = centroid.y, centroid.x
-        best = min(
-            parent_items,
-            key=lambda it: _haversine_km(clat, clon, it["latitude"], it["longitude"]),
+        dist = _haversine_km_many(centroid.y, centroid.x, *list_coords(parent_items))
+        return parent_items[int(np.argmin(dist))]["group"]
+
+    def closest_groups(parent_items: list[_PlacedItem], centroids: list[Point]) -> list[str]:
+        # One (centroids x items) distance matrix instead of a search per centroid
+        lats, lons = list_coords(parent_items)
+        dist = _haversine_km_grid(
+            shapely.get_y(centroids)[:, np.newaxis],
+            shapely.get_x(centroids)[:, np.newaxis],
+            lats,
+            lons,
         )
-        return best["group"]
+        return [parent_items[i]["group"] for i in np.argmin(dist, axis=1).tolist()]
 
     def split_region(
         level: str, region_key: str, parent_items: list[_PlacedItem]
@@ -1057,23 +1342,25 @@ def _collect_group_geometries(
                 return []
             return [{"geom": region["simplified"], "group": fb, "color": group_colors[fb]}]
 
-        groups_here = {it["group"] for it in items_here}
+        groups_here = groups_in[level][region_key]
         if len(groups_here) == 1:
             grp = next(iter(groups_here))
             child_level_check = next_level.get(level)
             if child_level_check and level_index[child_level_check] <= floor_idx:
-                occupied = sum(
-                    1
-                    for ck in child_map_by_level.get(level, {}).get(region_key, [])
-                    if filtered[child_level_check].get(ck)
+                # Only "none or one occupied child" matters, so stop scanning at the second
+                occupied_children = list(
+                    itertools.islice(
+                        (
+                            ck
+                            for ck in child_map_by_level.get(level, {}).get(region_key, [])
+                            if filtered[child_level_check].get(ck)
+                        ),
+                        2,
+                    )
                 )
-                if occupied <= 1:
-                    children_with = [
-                        ck
-                        for ck in child_map_by_level.get(level, {}).get(region_key, [])
-                        if ck in regions_by_level.get(child_level_check, {})
-                        and filtered[child_level_check].get(ck)
-                    ]
+                if len(occupied_children) <= 1:
+                    child_regions_check = regions_by_level.get(child_level_check, {})
+                    children_with = [ck for ck in occupied_children if ck in child_regions_check]
                     if children_with:
                         narrow: list[dict[str, Any]] = []
                         for ck in children_with:
@@ -1114,7 +1401,7 @@ def _collect_group_geometries(
             if not items_in_child:
                 empty_children.append(ck)
                 continue
-            child_groups = {it["group"] for it in items_in_child}
+            child_groups = groups_in[child_level][ck]
             if len(child_groups) == 1:
                 grp = next(iter(child_groups))
                 result_cells.append(
@@ -1127,7 +1414,7 @@ def _collect_group_geometries(
             else:
                 result_cells.extend(split_region(child_level, ck, items_in_child))
 
-        for eck in empty_children:
+        if empty_children:
             pool = items_here
             if level == "lad":
                 itl3_key = lad_to_itl3.get(region_key)
@@ -1135,8 +1422,10 @@ def _collect_group_geometries(
                     pool_itl3 = filtered["itl3"].get(itl3_key, [])
                     if pool_itl3:
                         pool = pool_itl3
-            fb = closest_group(pool, child_regions[eck]["centroid"])
-            if fb:
+            fallbacks = closest_groups(
+                pool, [child_regions[eck]["centroid"] for eck in empty_children]
+            )
+            for eck, fb in zip(empty_children, fallbacks, strict=True):
                 result_cells.append(
                     {
                         "geom": child_regions[eck]["simplified"],
@@ -1156,8 +1445,82 @@ def _collect_group_geometries(
 _TerritoryMerged = dict[str, dict[str, Any]]
 """Per-group merged GeoJSON mapping: ``{group_name: geojson_dict}``."""
 
-TerritoryCache = dict[tuple[Any, ...], _TerritoryMerged]
-"""Cache of territory results keyed by ``(entry_level, floor_level, frozenset(item_names))``."""
+_TerritoryKey = tuple[Any, ...]
+
+
+class TerritoryCache(dict[_TerritoryKey, _TerritoryMerged]):
+    """Territory results keyed by ``(entry_level, floor_level, frozenset(item_sites))``.
+
+    Entries loaded by :func:`load_territory_cache` wait in *stored* and are copied in
+    on their first lookup, so the mapping itself only holds territories this run used
+    or computed. That is all :func:`save_territory_cache` writes, so keys for teams
+    that have since moved or changed league drop out of the file.
+    """
+
+    def __init__(self, stored: dict[_TerritoryKey, _TerritoryMerged] | None = None) -> None:
+        super().__init__()
+        self.stored = stored or {}
+
+    def __missing__(self, key: _TerritoryKey) -> _TerritoryMerged:
+        value = self.stored[key]
+        self[key] = value
+        return value
+
+    def get(self, key: _TerritoryKey, default: Any = None) -> Any:  # type: ignore[override]
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+_TERRITORY_CACHE_VERSION = 1
+
+
+def load_territory_cache(paths: dict[str, str], cache_file: str | Path) -> TerritoryCache:
+    """Territories saved by :func:`save_territory_cache`, or ``{}`` if stale or missing.
+
+    Keys already pin each tier's teams, coordinates and regions, so the file is only
+    tied to the boundary files in *paths* (as for :func:`load_itl_hierarchy`) and to
+    :data:`_TERRITORY_CACHE_VERSION`, which is bumped when territory building changes.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return TerritoryCache()
+    except Exception as e:
+        logger.warning("Ignoring unreadable territory cache %s: %s", cache_file, e)
+        return TerritoryCache()
+    if cached.get("version") != _TERRITORY_CACHE_VERSION or cached.get(
+        "stamp"
+    ) != _hierarchy_source_stamp(paths):
+        return TerritoryCache()
+    territories: dict[_TerritoryKey, _TerritoryMerged] = cached["territories"]
+    logger.debug("Loaded %d cached territories from %s", len(territories), cache_file)
+    return TerritoryCache(territories)
+
+
+def save_territory_cache(
+    territory_cache: TerritoryCache, paths: dict[str, str], cache_file: str | Path
+) -> None:
+    """Persist the territories this run used or computed for :func:`load_territory_cache`.
+
+    Loaded entries that were never looked up are left out (see :class:`TerritoryCache`).
+    """
+    cache_file = Path(cache_file)
+    payload = {
+        "version": _TERRITORY_CACHE_VERSION,
+        "stamp": _hierarchy_source_stamp(paths),
+        "territories": dict(territory_cache),
+    }
+    tmp_file = cache_file.with_suffix(cache_file.suffix + ".tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning("Could not write territory cache %s: %s", cache_file, e)
 
 
 def _merge_territories(
@@ -1166,6 +1529,11 @@ def _merge_territories(
     """Union + hole-removal for each group, returning GeoJSON mapping dicts."""
     min_hole_area = 1e-4
 
+    def large_holes(poly: Polygon) -> list[BaseGeometry]:
+        # Measure every interior ring of the polygon in one vectorized call
+        rings = shapely.get_interior_ring(poly, np.arange(shapely.get_num_interior_rings(poly)))
+        return list(rings[shapely.area(shapely.polygons(rings)) >= min_hole_area])
+
     def remove_small_holes(geom: BaseGeometry) -> BaseGeometry:
         if geom.is_empty:
             return geom
@@ -1173,7 +1541,7 @@ def _merge_territories(
             poly = cast(Polygon, geom)
             if not poly.interiors:
                 return geom
-            holes = [r for r in poly.interiors if Polygon(r).area >= min_hole_area]
+            holes = large_holes(poly)
             if len(holes) == len(poly.interiors):
                 return geom
             return Polygon(poly.exterior, holes)
@@ -1182,16 +1550,7 @@ def _merge_territories(
             if not any(p.interiors for p in multi.geoms):
                 return geom
             return MultiPolygon(
-                [
-                    (
-                        Polygon(
-                            p.exterior, [r for r in p.interiors if Polygon(r).area >= min_hole_area]
-                        )
-                        if p.interiors
-                        else p
-                    )
-                    for p in multi.geoms
-                ]
+                [Polygon(p.exterior, large_holes(p)) if p.interiors else p for p in multi.geoms]
             )
         return geom
 
@@ -1199,25 +1558,172 @@ def _merge_territories(
     for grp, geometries in group_geometries.items():
         if not geometries:
             continue
+        # GEOS's cascaded union already partitions its inputs with an STR-tree, so
+        # splitting a group into connected components first only adds overhead.
         merged = unary_union(geometries)
         merged = remove_small_holes(merged)
-        result[grp] = mapping(merged)
+        result[grp] = mapping(shapely.set_precision(merged, _EMBED_GRID_SIZE))
     return result
 
 
+class _RenderedScript(Element):
+    """Script text that is already rendered and is emitted verbatim."""
+
+    def __init__(self, script: str) -> None:
+        super().__init__()
+        self.script = script
+
+    def render(self, **kwargs: Any) -> str:
+        return self.script
+
+
+class _DataScript(MacroElement):
+    """A ``script``-only MacroElement whose output embeds bulk data.
+
+    branca hands each rendered macro to ``Element(text)``, which compiles the text as a
+    Jinja template. For territory GeoJSON and marker columns that is megabytes of
+    lexing per layer, and any ``{{`` in the data would be read as template syntax.
+    """
+
+    def render(self, **kwargs: Any) -> None:
+        script = self._template.module.script(self, kwargs)
+        figure = self.get_root()
+        figure.script.add_child(  # type: ignore[attr-defined]
+            _RenderedScript(script), name=self.get_name()
+        )
+
+
+@functools.cache
+def _territory_style(color: str) -> str:
+    """Territory layer style as JSON, serialized once per palette colour."""
+    return json_dumps(
+        {"fillColor": color, "color": color, "weight": 1, "fillOpacity": 0.6, "opacity": 0.6}
+    )
+
+
+def _delta_rings(geometry: dict[str, Any]) -> list[list[list[int]]] | None:
+    """Polygon rings of *geometry* as flat ``[dx, dy, ...]`` grid-unit deltas.
+
+    Territory coordinates already sit on the :data:`_EMBED_GRID_SIZE` grid, so each
+    vertex is a small integer step from the previous one; that is about half the size
+    of the GeoJSON and a third once gzipped. ``None`` for non-polygonal geometries.
+    """
+    if geometry["type"] == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return None
+    return [
+        [
+            np.diff(
+                np.rint(np.asarray(ring) / _EMBED_GRID_SIZE).astype(np.int64), axis=0, prepend=0
+            )
+            .ravel()
+            .tolist()
+            for ring in polygon
+        ]
+        for polygon in polygons
+    ]
+
+
+def _territory_collection_json(
+    merged_geojson: _TerritoryMerged, group_colors: dict[str, str]
+) -> str:
+    """One FeatureCollection for a layer's territories, each feature carrying its style.
+
+    A single ``L.geoJson`` per feature group, rather than one per group in it, keeps
+    the Leaflet layer count down on all-tiers maps; the style lives in the feature
+    properties so no per-layer style function has to dispatch on the group. Polygons
+    are sent as :func:`_delta_rings` in ``q``, which :data:`TERRITORY_DECODER_JS`
+    turns back into GeoJSON geometries.
+    """
+    features = []
+    for grp, geojson_dict in merged_geojson.items():
+        style = _territory_style(group_colors[grp])
+        rings = _delta_rings(geojson_dict)
+        if rings is None:
+            geometry = f'"geometry":{json_dumps(geojson_dict)}'
+        else:
+            geometry = f'"geometry":null,"q":{json_dumps(rings)}'
+        features.append(f'{{"type":"Feature","properties":{{"style":{style}}},{geometry}}}')
+    return f'{{"type":"FeatureCollection","features":[{",".join(features)}]}}'
+
+
+class _TerritoryGeoJson(_DataScript):
+    """Territory GeoJSON from :func:`_territory_collection_json`.
+
+    ``folium.GeoJson`` pushes its data through Jinja's ``tojson`` (stdlib, sorted keys,
+    indented separators) and wraps it in per-feature styler plumbing; territory
+    geometries are the bulk of every map's HTML and need neither.
+    """
+
+    _template = FoliumTemplate("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = L.geoJson(
+                decodeTerritories({{ this.geojson }}),
+                {style: f => f.properties.style}
+            ).addTo({{ this._parent.get_name() }});
+        {% endmacro %}
+        """)
+
+    def __init__(self, geojson: str) -> None:
+        super().__init__()
+        self._name = "TerritoryGeoJson"
+        self.geojson = geojson
+
+
 def _render_territories(
     feature_group: folium.FeatureGroup,
     merged_geojson: _TerritoryMerged,
     group_colors: dict[str, str],
 ) -> None:
-    """Add pre-merged GeoJSON territory layers to *feature_group*."""
-    for grp, geojson_dict in merged_geojson.items():
-        color = group_colors[grp]
+    """Add pre-merged GeoJSON territories to *feature_group* as one layer."""
+    if merged_geojson:
+        feature_group.add_child(
+            _TerritoryGeoJson(_territory_collection_json(merged_geojson, group_colors))
+        )
 
-        def style_fn(feature: Any, c: str = color) -> dict[str, Any]:
-            return {"fillColor": c, "color": c, "weight": 1, "fillOpacity": 0.6, "opacity": 0.6}
 
-        folium.GeoJson(geojson_dict, style_function=style_fn).add_to(feature_group)
+class _TerritoryFile(_DataScript):
+    """Territories fetched from *url* when their feature group is first shown."""
+
+    _template = FoliumTemplate("""
+        {% macro script(this, kwargs) %}
+            (function(group, url) {
+                var loaded = false;
+                group.on("add", function() {
+                    if (loaded) return;
+                    loaded = true;
+                    fetch(url).then(r => r.json()).then(geojson => {
+                        L.geoJson(decodeTerritories(geojson), {style: f => f.properties.style})
+                            .addTo(group);
+                    }).catch(e => {
+                        loaded = false;
+                        console.warn('Could not load territories:', e);
+                    });
+                });
+            })({{ this._parent.get_name() }}, {{ this.url|tojson }});
+        {% endmacro %}
+        """)
+
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self._name = "TerritoryFile"
+        self.url = url
+
+
+def _write_territory_file(
+    feature_group: folium.FeatureGroup,
+    merged_geojson: _TerritoryMerged,
+    group_colors: dict[str, str],
+    path: Path,
+    url: str,
+) -> None:
+    """Write *merged_geojson* to *path* and have *feature_group* load it from *url*."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(_territory_collection_json(merged_geojson, group_colors), encoding="utf-8")
+    feature_group.add_child(_TerritoryFile(url))
 
 
 # ---------------------------------------------------------------------------
@@ -1673,9 +2179,52 @@ DARK_MODE_JS = DARK_MODE_JS.replace("__JM_LIGHT__", CARTO_THEME_MARK_LIGHT).repl
     "__JM_DARK__", CARTO_THEME_MARK_DARK
 )
 
+TERRITORY_DECODER_JS = """
+<script>
+// Expands the delta-encoded territory rings written by _delta_rings in map_builder.py
+function decodeTerritories(collection) {
+    collection.features.forEach(function(feature) {
+        if (!feature.q) {
+            return;
+        }
+        feature.geometry = {
+            type: "MultiPolygon",
+            coordinates: feature.q.map(function(polygon) {
+                return polygon.map(function(ring) {
+                    var x = 0, y = 0, coords = [];
+                    for (var i = 0; i < ring.length; i += 2) {
+                        x += ring[i];
+                        y += ring[i + 1];
+                        coords.push([x * __GRID__, y * __GRID__]);
+                    }
+                    return coords;
+                });
+            })
+        };
+        delete feature.q;
+    });
+    return collection;
+}
+
+// Same for every layer of an inlined shared boundaries object
+function decodeBoundaries(bd) {
+    Object.values(bd.countries || {}).forEach(decodeTerritories);
+    ["itl_1", "itl_2", "itl_3", "lad", "wards"].forEach(function(level) {
+        if (bd[level]) {
+            decodeTerritories(bd[level]);
+        }
+    });
+    return bd;
+}
+</script>
+""".replace("__GRID__", repr(_EMBED_GRID_SIZE))
+
 
 def _build_base_map(config: MapConfig) -> folium.Map:
-    m = folium.Map(location=list(config.center), zoom_start=config.zoom, tiles=None)
+    # Territory and boundary polygons are drawn on one canvas instead of an SVG node each
+    m = folium.Map(
+        location=list(config.center), zoom_start=config.zoom, tiles=None, prefer_canvas=True
+    )
     folium.TileLayer(
         tiles=CARTO_TILE_URL_LIGHT,
         attr=folium_carto_attribution(),
@@ -1684,47 +2233,38 @@ def _build_base_map(config: MapConfig) -> folium.Map:
     header = m.get_root().header  # type: ignore[attr-defined]
     header.add_child(folium.Element(POPUP_CSS))
     header.add_child(folium.Element(DARK_MODE_JS))
+    header.add_child(folium.Element(TERRITORY_DECODER_JS))
     return m
 
 
-def _add_marker(
-    marker_group: FeatureGroupSubGroup | folium.FeatureGroup,
-    item: _PlacedItem,
-    color: str,
-    tier_order: int | None = None,
-    fallback_icon_url: str | None = None,
-    league_border: bool = False,
-) -> None:
-    name_esc = escape(item["name"])
-    popup_content = item.get("popup_html") or f'<div class="rugby-popup"><b>{name_esc}</b></div>'
-    popup_content = popup_content.replace(
-        '<h4 class="popup-title">',
-        f'<h4 class="popup-title" style="color: {color};">',
-        1,
+_MARKER_ICON_SIZE = 30
+
+
+@functools.lru_cache(maxsize=4096)
+def _popup_regions_html(itl1: str, itl2: str, itl3: str) -> str:
+    """Region line for a popup; teams in the same ITL3 region share it."""
+    if not itl1:
+        return ""
+    return (
+        f'<p class="popup-regions">'
+        f"<b>{escape(itl1)}</b> | {escape(itl2)} | <i>{escape(itl3)}</i>"
+        f"</p>"
     )
 
-    itl1 = item.get("itl1") or ""
-    itl2 = item.get("itl2") or ""
-    itl3 = item.get("itl3") or ""
-    if itl1:
-        region_html = (
-            f'<p class="popup-regions">'
-            f"<b>{escape(itl1)}</b> | {escape(itl2)} | <i>{escape(itl3)}</i>"
-            f"</p>"
-        )
-    else:
-        region_html = ""
-    popup_content = popup_content.replace("__ITL_REGIONS__", region_html)
 
-    icon_size = 30
-    icon_url = item.get("icon_url")
+@functools.lru_cache(maxsize=8192)
+def _marker_icon_html(
+    icon_url: str | None, color: str, league_border: bool, fallback_icon_url: str | None
+) -> str:
+    """Marker icon HTML, memoized since each team recurs across tier and combined maps."""
+    icon_size = _MARKER_ICON_SIZE
     border_css = f"border: 2px solid {color}; " if league_border else ""
     if icon_url:
         if fallback_icon_url:
             onerror = f"this.onerror=null; this.src='{escape(fallback_icon_url)}'"
         else:
             onerror = "this.style.display='none'"
-        icon_html = (
+        return (
             f'<div style="text-align: center;">'
             f'<img src="{escape(icon_url)}" '
             f'style="width: {icon_size}px; height: {icon_size}px; border-radius: 50%; '
@@ -1732,36 +2272,141 @@ def _add_marker(
             f'onerror="{onerror}">'
             f"</div>"
         )
-    else:
-        icon_html = (
-            f'<div style="text-align: center;">'
-            f'<div style="width: {icon_size}px; height: {icon_size}px; border-radius: 50%; '
-            f"background: {color}; border: 2px solid white; "
-            f'box-shadow: 0 0 3px rgba(0,0,0,0.3);"></div>'
-            f"</div>"
-        )
+    return (
+        f'<div style="text-align: center;">'
+        f'<div style="width: {icon_size}px; height: {icon_size}px; border-radius: 50%; '
+        f"background: {color}; border: 2px solid white; "
+        f'box-shadow: 0 0 3px rgba(0,0,0,0.3);"></div>'
+        f"</div>"
+    )
+
+
+def _popup_content(item: _PlacedItem, color: str) -> str:
+    popup_content = item.get("popup_html") or (
+        f'<div class="rugby-popup"><b>{escape(item["name"])}</b></div>'
+    )
+    return popup_content.replace(
+        '<h4 class="popup-title">',
+        f'<h4 class="popup-title" style="color: {color};">',
+        1,
+    ).replace(
+        "__ITL_REGIONS__",
+        _popup_regions_html(item.get("itl1") or "", item.get("itl2") or "", item.get("itl3") or ""),
+    )
 
-    icon = folium.DivIcon(html=icon_html, icon_size=(icon_size, icon_size), icon_anchor=(15, 15))
 
-    marker = folium.Marker(
-        location=[item["latitude"], item["longitude"]],
-        popup=folium.Popup(popup_content, max_width=250),
-        icon=icon,
-        tooltip=name_esc,
+def _script_json(value: Any) -> str:
+    """:func:`json_dumps` made safe to inline in a ``<script>`` block, as Jinja's ``tojson`` is."""
+    return (
+        json_dumps(value)
+        .replace("&", "\\u0026")
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("'", "\\u0027")
     )
-    marker.options["tierOrder"] = tier_order  # type: ignore[index]
-    marker.options["imageUrl"] = icon_url or ""  # type: ignore[index]
-    marker.options["itemName"] = item["name"]  # type: ignore[index]
-    marker.add_to(marker_group)
 
 
-def _add_marker_cluster(m: folium.Map, fallback_icon_url: str | None = None) -> MarkerCluster:
+class _MarkerBatch(_DataScript):
+    """A marker group's markers held as columns and built client-side by one loop.
+
+    Each ``folium.Marker`` drags a ``DivIcon``, ``Popup`` and ``Tooltip`` along, and
+    every one of those compiles its rendered JS as a fresh Jinja template, so a map
+    with a few thousand teams spent most of its save time in the template compiler.
+    Icon HTML is interned, as most teams in a league share a colour and fallback.
+    """
+
+    _template = FoliumTemplate("""
+        {% macro script(this, kwargs) %}
+            (function(group, d) {
+                var icons = d.icons.map(function(html) {
+                    return L.divIcon({
+                        html: html,
+                        iconSize: [d.iconSize, d.iconSize],
+                        iconAnchor: [d.iconSize / 2, d.iconSize / 2],
+                        className: "empty"
+                    });
+                });
+                d.lats.forEach(function(lat, i) {
+                    var marker = L.marker([lat, d.lons[i]], {
+                        icon: icons[d.icon[i]],
+                        tierOrder: d.tierOrder,
+                        imageUrl: d.imageUrls[i],
+                        itemName: d.names[i]
+                    }).addTo(group);
+                    var popup = L.popup({maxWidth: 250});
+                    // Popup DOM is built on first click rather than for every marker on load
+                    marker.once("click", function() {
+                        var content = document.createElement("div");
+                        content.style.width = "100.0%";
+                        content.style.height = "100.0%";
+                        content.innerHTML = d.popups[i];
+                        popup.setContent(content);
+                    });
+                    marker.bindPopup(popup);
+                    marker.bindTooltip("<div>" + d.tooltips[i] + "</div>", {sticky: true});
+                });
+            })({{ this._parent.get_name() }}, {{ this.data }});
+        {% endmacro %}
+        """)
+
+    def __init__(
+        self,
+        items: list[_PlacedItem],
+        colors: list[str],
+        tier_order: int | None,
+        fallback_icon_url: str | None,
+        league_border: bool,
+    ) -> None:
+        super().__init__()
+        self._name = "MarkerBatch"
+        icon_index: dict[str, int] = {}
+        icons = [
+            icon_index.setdefault(
+                _marker_icon_html(it.get("icon_url"), color, league_border, fallback_icon_url),
+                len(icon_index),
+            )
+            for it, color in zip(items, colors, strict=True)
+        ]
+        self.data = _script_json(
+            {
+                "iconSize": _MARKER_ICON_SIZE,
+                "tierOrder": tier_order,
+                "icons": list(icon_index),
+                "icon": icons,
+                "lats": [it["latitude"] for it in items],
+                "lons": [it["longitude"] for it in items],
+                "names": [it["name"] for it in items],
+                "tooltips": [escape(it["name"]) for it in items],
+                "imageUrls": [it.get("icon_url") or "" for it in items],
+                "popups": [_popup_content(it, c) for it, c in zip(items, colors, strict=True)],
+            }
+        )
+
+
+def _add_markers(
+    marker_group: FeatureGroupSubGroup | folium.FeatureGroup,
+    items: list[_PlacedItem],
+    colors: list[str],
+    tier_order: int | None = None,
+    fallback_icon_url: str | None = None,
+    league_border: bool = False,
+) -> None:
+    """Add *items* to *marker_group*, ``colors[i]`` styling ``items[i]``."""
+    if items:
+        marker_group.add_child(
+            _MarkerBatch(items, colors, tier_order, fallback_icon_url, league_border)
+        )
+
+
+@functools.cache
+def _cluster_icon_create_js(fallback_icon_url: str | None) -> str:
+    """Cluster icon JS, which only varies with the fallback icon URL."""
     if fallback_icon_url:
         escaped_fallback = escape(fallback_icon_url)
         onerror_js = f"this.onerror=null; this.src=\\'{escaped_fallback}\\'"
     else:
         onerror_js = "this.style.display=\\'none\\'"
-    icon_create_function = f"""
+    return f"""
     function(cluster) {{
         var markers = cluster.getAllChildMarkers();
         var bestMarker = null;
@@ -1799,6 +2444,9 @@ def _add_marker_cluster(m: folium.Map, fallback_icon_url: str | None = None) ->
         }}
     }}
     """
+
+
+def _add_marker_cluster(m: folium.Map, fallback_icon_url: str | None = None) -> MarkerCluster:
     parent_cluster = MarkerCluster(
         control=False,
         options={
@@ -1810,41 +2458,49 @@ def _add_marker_cluster(m: folium.Map, fallback_icon_url: str | None = None) ->
             "zoomToBoundsOnClick": False,
             "animate": False,
             "animateAddingMarkers": False,
+            # Sub-groups join the map after their markers and hand them over in one
+            # addLayers call; chunking that call keeps large maps responsive while loading.
+            "chunkedLoading": True,
+            "chunkedInterval": 100,
+            "chunkedDelay": 20,
         },
-        icon_create_function=icon_create_function,
+        icon_create_function=_cluster_icon_create_js(fallback_icon_url),
     )
     m.add_child(parent_cluster)
     return parent_cluster
 
 
-def _legend(
-    title: str,
-    items_by_tier: dict[str, list[_PlacedItem]],
-    tier_order: list[str],
-    group_colors: dict[str, str],
-) -> folium.Element:
-    html = f"""
+_LEGEND_CSS = """
     <style>
-    .legend-toggle {{ cursor:pointer; user-select:none; display:inline-block; float:right; font-weight:bold; font-size:18px; }}
-    .legend-content.collapsed {{ display:none; }}
-    @media only screen and (max-width: 768px) {{
-        .map-legend {{ bottom:10px !important; right:10px !important; width:200px !important; max-height:300px !important; font-size:11px !important; padding:8px !important; }}
-        .map-legend h4 {{ font-size:13px !important; }}
-        .map-legend i {{ width:12px !important; height:12px !important; }}
-        .legend-content {{ max-height:250px !important; }}
-    }}
-    html[data-rugby-effective="dark"] .map-legend {{
+    .legend-toggle { cursor:pointer; user-select:none; display:inline-block; float:right; font-weight:bold; font-size:18px; }
+    .legend-content.collapsed { display:none; }
+    @media only screen and (max-width: 768px) {
+        .map-legend { bottom:10px !important; right:10px !important; width:200px !important; max-height:300px !important; font-size:11px !important; padding:8px !important; }
+        .map-legend h4 { font-size:13px !important; }
+        .map-legend i { width:12px !important; height:12px !important; }
+        .legend-content { max-height:250px !important; }
+    }
+    html[data-rugby-effective="dark"] .map-legend {
         background-color:#16213e !important;
         color:#e0e0e0 !important;
         border-color:#444 !important;
-    }}
-    html[data-rugby-effective="dark"] .map-legend h4 {{
+    }
+    html[data-rugby-effective="dark"] .map-legend h4 {
         color:#e0e8f0;
-    }}
-    html[data-rugby-effective="dark"] .map-legend b {{
+    }
+    html[data-rugby-effective="dark"] .map-legend b {
         color:#e0e8f0;
-    }}
-    </style>
+    }
+    </style>"""
+
+
+def _legend(
+    title: str,
+    items_by_tier: dict[str, list[_PlacedItem]],
+    tier_order: list[str],
+    group_colors: dict[str, str],
+) -> folium.Element:
+    html = _LEGEND_CSS + f"""
     <div class="map-legend" style="position:fixed; bottom:50px; right:50px; width:300px;
                 background-color:white; z-index:999; font-size:14px;
                 border:2px solid grey; border-radius:5px; padding:10px">
@@ -1878,9 +2534,10 @@ def _legend(
                 label = escape(cat) if cat else "Other"
                 html += f'<p style="margin:6px 0 2px 8px;"><i>{label}</i> ({len(cat_items)})</p>'
             indent = "23px" if show_sub else "15px"
-            for grp in sorted({it["group"] for it in cat_items}):
+            group_counts = Counter(it["group"] for it in cat_items)
+            for grp in sorted(group_counts):
                 color = group_colors[grp]
-                count = sum(1 for it in cat_items if it["group"] == grp)
+                count = group_counts[grp]
                 html += (
                     f'<p style="margin:2px 0 2px {indent};">'
                     f'<i style="background:{color}; width:16px; height:16px; '
@@ -2072,12 +2729,39 @@ def _add_layer_control(m: folium.Map) -> None:
 # ---------------------------------------------------------------------------
 
 
+_BOUNDARY_LEVELS = ("itl_1", "itl_2", "itl_3", "lad", "wards")
+
+
+@functools.lru_cache(maxsize=4)
+def _read_inline_boundaries(path: str, mtime_ns: int) -> str:
+    data = json_load_mapped(path)
+    collections = [*data.get("countries", {}).values()]
+    collections += [data[level] for level in _BOUNDARY_LEVELS if data.get(level)]
+    for collection in collections:
+        for feature in collection["features"]:
+            rings = _delta_rings(feature["geometry"]) if feature["geometry"] else None
+            if rings is not None:
+                feature["geometry"] = None
+                feature["q"] = rings
+    return json_dumps(data)
+
+
+def _inline_boundaries_json(path: str) -> str:
+    """The inline boundaries file, read once per file version rather than once per map.
+
+    Polygons are re-encoded as :func:`_delta_rings`, as for territories, since every
+    map page embeds this data; ``decodeBoundaries`` expands them in the browser.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return "{}"
+    return _read_inline_boundaries(path, mtime_ns)
+
+
 def _get_boundary_loader_script(config: MapConfig) -> str:
     if config.use_inline_boundaries:
-        boundaries_path = Path(config.inline_boundaries_file)
-        bd_json = "{}"
-        if boundaries_path.exists():
-            bd_json = boundaries_path.read_text()
+        bd_json = _inline_boundaries_json(config.inline_boundaries_file)
         return f"""
     <script>
     (function() {{
@@ -2098,7 +2782,7 @@ def _get_boundary_loader_script(config: MapConfig) -> str:
             var map = window[Object.keys(window).find(k => k.startsWith('map_') && window[k] instanceof L.Map)];
             if (!map) {{ setTimeout(addBoundaries, 100); return; }}
             var dark = el.classList.contains('rugby-map-dark');
-            const bd = {bd_json};
+            const bd = decodeBoundaries({bd_json});
             var cs = dark ? _darkCountry : _lightCountry;
             Object.entries(bd.countries || {{}}).forEach(([n, d]) => {{ var ly = L.geoJson(d, {{style:cs}}); ly.addTo(map); _countryLayers.push(ly); }});
             var bs = dark ? _darkITL : _lightITL;
@@ -2131,7 +2815,7 @@ def _get_boundary_loader_script(config: MapConfig) -> str:
             var map = window[Object.keys(window).find(k => k.startsWith('map_') && window[k] instanceof L.Map)];
             if (!map) {{ setTimeout(addBoundaries, 100); return; }}
             var dark = el.classList.contains('rugby-map-dark');
-            fetch('{sp}/boundaries.json').then(r => r.json()).then(bd => {{
+            {shared_boundaries_fetch_js(sp)}.then(bd => {{
                 var cs = dark ? _darkCountry : _lightCountry;
                 Object.entries(bd.countries).forEach(([n, d]) => {{ var ly = L.geoJson(d, {{style:cs}}); ly.addTo(map); _countryLayers.push(ly); }});
                 var bs = dark ? _darkITL : _lightITL;
@@ -2147,10 +2831,7 @@ def _get_boundary_loader_script(config: MapConfig) -> str:
 
 def _get_debug_boundary_loader_script(config: MapConfig) -> str:
     if config.use_inline_boundaries:
-        boundaries_path = Path(config.inline_boundaries_file)
-        bd_json = "{}"
-        if boundaries_path.exists():
-            bd_json = boundaries_path.read_text()
+        bd_json = _inline_boundaries_json(config.inline_boundaries_file)
         return f"""
     <script>
     (function() {{
@@ -2159,7 +2840,7 @@ def _get_debug_boundary_loader_script(config: MapConfig) -> str:
             if (!el || !el._leaflet_id) {{ setTimeout(addDebug, 100); return; }}
             var map = window[Object.keys(window).find(k => k.startsWith('map_') && window[k] instanceof L.Map)];
             if (!map) {{ setTimeout(addDebug, 100); return; }}
-            const bd = {bd_json};
+            const bd = decodeBoundaries({bd_json});
             const ds = {{ fillColor:'transparent', color:'red', weight:2, fillOpacity:0 }};
             const layers = {{
                 'Debug: ITL1 Boundaries': bd.itl_1, 'Debug: ITL2 Boundaries': bd.itl_2,
@@ -2185,7 +2866,7 @@ def _get_debug_boundary_loader_script(config: MapConfig) -> str:
             if (!el || !el._leaflet_id) {{ setTimeout(addDebug, 100); return; }}
             var map = window[Object.keys(window).find(k => k.startsWith('map_') && window[k] instanceof L.Map)];
             if (!map) {{ setTimeout(addDebug, 100); return; }}
-            fetch('{sp}/boundaries.json').then(r => r.json()).then(bd => {{
+            {shared_boundaries_fetch_js(sp)}.then(bd => {{
                 const ds = {{ fillColor:'transparent', color:'red', weight:2, fillOpacity:0 }};
                 const layers = {{
                     'Debug: ITL1 Boundaries': bd.itl_1, 'Debug: ITL2 Boundaries': bd.itl_2,
@@ -2224,12 +2905,40 @@ def _resolve_levels(tier_num: int, config: MapConfig) -> tuple[str, str]:
 
 def _territory_cache_key(
     items: list[_PlacedItem], config: MapConfig
-) -> tuple[str, str, frozenset[tuple[str, str]]]:
-    """Build a hashable cache key for a set of items sharing one tier."""
+) -> tuple[str, str, frozenset[tuple[Any, ...]]]:
+    """Build a hashable cache key for a set of items sharing one tier.
+
+    Coordinates and region keys are part of the key so that a cache loaded from disk
+    misses when a team moves, not just when the set of teams changes.
+    """
     tier_num = items[0].get("tier_num", 999) if items else 999
     entry, floor = _resolve_levels(tier_num, config)
-    names = frozenset((it["name"], it["group"]) for it in items)
-    return (entry, floor, names)
+    sites = frozenset(
+        (
+            it["name"],
+            it["group"],
+            it["latitude"],
+            it["longitude"],
+            it["itl0"],
+            it["itl1"],
+            it["itl2"],
+            it["itl3"],
+            it["lad"],
+            it["ward"],
+        )
+        for it in items
+    )
+    return (entry, floor, sites)
+
+
+def _save_map(m: folium.Map, output_path: Path) -> None:
+    """Write *m* to *output_path* as its template renders, without one whole-page string."""
+    root = m.get_root()
+    for child in root._children.values():
+        child.render()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        f.writelines(root._template.generate(this=root, kwargs={}))
 
 
 def generate_single_group_map(
@@ -2276,8 +2985,9 @@ def generate_single_group_map(
         m.add_child(marker_groups[grp])
 
     cache_key = _territory_cache_key(all_placed, config) if territory_cache is not None else None
-    if cache_key is not None and cache_key in territory_cache:  # type: ignore[operator]
-        merged_all = territory_cache[cache_key]  # type: ignore[index]
+    cached = territory_cache.get(cache_key) if territory_cache is not None else None
+    if cached is not None:
+        merged_all = cached
     else:
         geoms = _collect_group_geometries(
             all_placed, region_to_items, itl_hierarchy, group_colors, config
@@ -2288,11 +2998,14 @@ def generate_single_group_map(
     for grp, fg in shading_groups.items():
         _render_territories(fg, {grp: merged_all[grp]} if grp in merged_all else {}, group_colors)
 
+    placed_by_group: dict[str, list[_PlacedItem]] = {grp: [] for grp in group_names}
     for it in all_placed:
-        _add_marker(
-            marker_groups[it["group"]],
-            it,
-            group_colors[it["group"]],
+        placed_by_group[it["group"]].append(it)
+    for grp, placed in placed_by_group.items():
+        _add_markers(
+            marker_groups[grp],
+            placed,
+            [group_colors[grp]] * len(placed),
             tier_order=0,
             fallback_icon_url=config.fallback_icon_url,
             league_border=True,
@@ -2316,11 +3029,69 @@ def generate_single_group_map(
     for elem in config.body_elements:
         html_el.add_child(folium.Element(elem))
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    m.save(output_path)
+    _save_map(m, output_path)
     logger.info("Saved %s map with %d items to: %s", config.title, len(all_placed), output_path)
 
 
+SingleGroupMapJob = tuple[list[MarkerItem], Path, MapConfig]
+"""``(items, output_path, config)`` arguments for one :func:`generate_single_group_map` call."""
+
+_worker_hierarchy: ITLHierarchy | None = None
+_worker_territories: TerritoryCache = TerritoryCache()
+
+
+def _init_map_worker(hierarchy_paths: dict[str, str], territory_cache: TerritoryCache) -> None:
+    global _worker_hierarchy, _worker_territories  # noqa: PLW0603
+    _worker_hierarchy = load_itl_hierarchy(hierarchy_paths)
+    _worker_territories = territory_cache
+
+
+def _run_single_group_map_job(
+    job: SingleGroupMapJob,
+) -> dict[_TerritoryKey, _TerritoryMerged]:
+    assert _worker_hierarchy is not None
+    # Entries new to the worker's mapping are both computed and reused-from-disk ones,
+    # so the caller records every territory the job used
+    known = set(_worker_territories)
+    items, output_path, config = job
+    generate_single_group_map(items, output_path, _worker_hierarchy, config, _worker_territories)
+    return {k: v for k, v in _worker_territories.items() if k not in known}
+
+
+def generate_single_group_maps(
+    jobs: list[SingleGroupMapJob],
+    itl_hierarchy: ITLHierarchy,
+    hierarchy_paths: dict[str, str],
+    territory_cache: TerritoryCache | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """Generate independent single-group maps, spread over worker processes.
+
+    Each worker loads the hierarchy once from *hierarchy_paths* (a cache hit after the
+    caller's own :func:`load_itl_hierarchy`) rather than having it pickled per job, and
+    starts from a copy of *territory_cache*. Territories the workers compute are merged
+    back into *territory_cache* so the caller's later maps reuse them. With one worker,
+    or one job, maps are generated in-process.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for items, output_path, config in jobs:
+            generate_single_group_map(items, output_path, itl_hierarchy, config, territory_cache)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_map_worker,
+        initargs=(
+            hierarchy_paths,
+            TerritoryCache() if territory_cache is None else territory_cache,
+        ),
+    ) as executor:
+        for computed in executor.map(_run_single_group_map_job, jobs):
+            if territory_cache is not None:
+                territory_cache.update(computed)
+
+
 def generate_multi_group_map(
     items: list[MarkerItem],
     output_path: Path,
@@ -2346,13 +3117,11 @@ def generate_multi_group_map(
     for elem in config.header_elements:
         header.add_child(folium.Element(elem))
 
-    groups_by_tier: dict[str, set[str]] = {
-        tier: {it["group"] for it in placed} for tier, placed in items_by_tier.items()
-    }
+    # A group that spans tiers keeps the colour of its first tier
     group_colors: dict[str, str] = {}
     for tier_idx, tier in enumerate(sorted_tier_names):
-        for j, grp in enumerate(sorted(groups_by_tier.get(tier, set()))):
-            group_colors[grp] = _pick_color(config.color_palette, tier_idx + j)
+        for j, grp in enumerate(sorted({it["group"] for it in items_by_tier[tier]})):
+            group_colors.setdefault(grp, _pick_color(config.color_palette, tier_idx + j))
 
     territory_groups: dict[str, folium.FeatureGroup] = {}
     marker_groups: dict[str, FeatureGroupSubGroup] = {}
@@ -2367,10 +3136,12 @@ def generate_multi_group_map(
         m.add_child(territory_groups[tier])
         m.add_child(marker_groups[tier])
 
-    for tier, placed in sorted(items_by_tier.items()):
+    territory_dir = output_path.with_name(f"{output_path.stem}_territories")
+    for tier_idx, (tier, placed) in enumerate(sorted(items_by_tier.items())):
         cache_key = _territory_cache_key(placed, config) if territory_cache is not None else None
-        if cache_key is not None and cache_key in territory_cache:  # type: ignore[operator]
-            merged = territory_cache[cache_key]  # type: ignore[index]
+        cached = territory_cache.get(cache_key) if territory_cache is not None else None
+        if cached is not None:
+            merged = cached
         else:
             geoms = _collect_group_geometries(
                 placed, region_to_items, itl_hierarchy, group_colors, config
@@ -2378,20 +3149,29 @@ def generate_multi_group_map(
             merged = _merge_territories(geoms)
             if territory_cache is not None and cache_key is not None:
                 territory_cache[cache_key] = merged
-        _render_territories(territory_groups[tier], merged, group_colors)
+        if config.territory_files:
+            _write_territory_file(
+                territory_groups[tier],
+                merged,
+                group_colors,
+                territory_dir / f"{tier_idx}.json",
+                f"{territory_dir.name}/{tier_idx}.json",
+            )
+        else:
+            _render_territories(territory_groups[tier], merged, group_colors)
 
     tier_order_map = {tier: idx for idx, tier in enumerate(sorted_tier_names)}
     num_items = 0
     for tier in reversed(sorted_tiers):
-        for it in items_by_tier[tier]:
-            _add_marker(
-                marker_groups[tier],
-                it,
-                group_colors[it["group"]],
-                tier_order_map.get(tier, 999),
-                fallback_icon_url=config.fallback_icon_url,
-            )
-            num_items += 1
+        placed = items_by_tier[tier]
+        _add_markers(
+            marker_groups[tier],
+            placed,
+            [group_colors[it["group"]] for it in placed],
+            tier_order_map.get(tier, 999),
+            fallback_icon_url=config.fallback_icon_url,
+        )
+        num_items += len(placed)
 
     _add_layer_control(m)
 
@@ -2406,6 +3186,5 @@ def generate_multi_group_map(
     for elem in config.body_elements:
         html_el.add_child(folium.Element(elem))
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    m.save(output_path)
+    _save_map(m, output_path)
     logger.info("Saved %s map with %d items to: %s", config.title, num_items, output_path)
@@ -1,12 +1,12 @@
 // Service Worker for caching external resources (especially RFU images)
-const CACHE_NAME = "rugby-maps-v1";
+const CACHE_NAME = "rugby-maps-v2";
 const IMAGE_CACHE = "rugby-images-v1";
 
 // Install event - cache static resources
 self.addEventListener("install", (event) => {
   event.waitUntil(
     caches.open(CACHE_NAME).then((cache) => {
-      return cache.addAll(["shared/boundaries.json"]);
+      return cache.addAll(["shared/boundaries.json.gz"]);
     }),
   );
   self.skipWaiting();
@@ -71,7 +71,7 @@ self.addEventListener("fetch", (event) => {
     return;
   }
 
-  // Cache boundaries.json with stale-while-revalidate
+  // Cache boundaries.json(.gz) with stale-while-revalidate
   if (url.pathname.includes("boundaries.json")) {
     event.respondWith(
       caches.open(CACHE_NAME).then((cache) => {
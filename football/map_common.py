@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from html import escape
 from pathlib import Path
 
@@ -10,6 +9,7 @@ from core import (
     get_favicon_html,
     get_google_analytics_script,
     get_service_worker_registration_script,
+    json_load_all,
     set_config,
 )
 from core.config import BOUNDARIES_DIR, DIST_DIR
@@ -136,41 +136,41 @@ def _render_popup_html(
 
 def load_pyramid_items(*geocoded_dirs: Path) -> list[MarkerItem]:
     """Load MarkerItems from ``geocoded_teams/<season>/pyramid/`` and/or ``.../feeder/``."""
+    filepaths = [
+        filepath
+        for geocoded_dir in geocoded_dirs
+        if geocoded_dir.is_dir()
+        for filepath in sorted(geocoded_dir.glob("*.json"))
+    ]
     items: list[MarkerItem] = []
-    for geocoded_dir in geocoded_dirs:
-        if not geocoded_dir.is_dir():
-            continue
-        for filepath in sorted(geocoded_dir.glob("*.json")):
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
-
-            league_name = data.get("league_name", filepath.stem.replace("_", " "))
-            league_url = data.get("league_url", "")
-
-            for team in data.get("teams", []):
-                if "latitude" not in team or "longitude" not in team:
-                    continue
-                level = int(team.get("level", 0))
-                if level < 1:
-                    continue
-                items.append(
-                    MarkerItem(
-                        name=team["name"],
-                        latitude=team["latitude"],
-                        longitude=team["longitude"],
-                        group=league_name,
-                        tier=tier_display_name(level),
-                        tier_num=level,
-                        icon_url=team.get("image_url"),
-                        popup_html=_render_popup_html(
-                            team["name"],
-                            league_name,
-                            league_url,
-                            team.get("url", ""),
-                            team.get("formatted_address") or team.get("address") or "",
-                        ),
-                    )
+    for filepath, data in zip(filepaths, json_load_all(filepaths), strict=True):
+        league_name = data.get("league_name", filepath.stem.replace("_", " "))
+        league_url = data.get("league_url", "")
+
+        for team in data.get("teams", []):
+            if "latitude" not in team or "longitude" not in team:
+                continue
+            level = int(team.get("level", 0))
+            if level < 1:
+                continue
+            items.append(
+                MarkerItem(
+                    name=team["name"],
+                    latitude=team["latitude"],
+                    longitude=team["longitude"],
+                    group=league_name,
+                    tier=tier_display_name(level),
+                    tier_num=level,
+                    icon_url=team.get("image_url"),
+                    popup_html=_render_popup_html(
+                        team["name"],
+                        league_name,
+                        league_url,
+                        team.get("url", ""),
+                        team.get("formatted_address") or team.get("address") or "",
+                    ),
                 )
+            )
     return items
 
 
@@ -398,6 +398,7 @@ def build_map_config(
         tier_floor_level=TIER_FLOOR_LEVELS,
         default_tier_floor_level="itl3",
         use_inline_boundaries=not production,
+        territory_files=production,
         shared_boundaries_path=shared_path,
         fallback_icon_url=None,
         color_palette=palette or COLOR_PALETTE,
@@ -17,9 +17,15 @@ from dataclasses import replace
 from html import escape
 from pathlib import Path
 
-from core import setup_logging
+from core import json_load_all, setup_logging
 from core.config import BOUNDARIES_DIR
-from core.map_builder import MarkerItem, generate_multi_group_map, load_itl_hierarchy
+from core.map_builder import (
+    MarkerItem,
+    generate_multi_group_map,
+    load_itl_hierarchy,
+    simplified_features,
+    write_shared_boundaries,
+)
 from football import DATA_DIR
 from football.map_common import build_map_config, dist_season_dir, prepare_map_context, short_season
 
@@ -116,10 +122,7 @@ def _load_marker_items(geocoded_dir: Path) -> list[MarkerItem]:
 
     items: list[MarkerItem] = []
 
-    for filepath in sorted(geocoded_dir.rglob("*.json")):
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
-
+    for data in json_load_all(sorted(geocoded_dir.rglob("*.json"))):
         league_name = data.get("league_name", "Unknown")
         league_url = data.get("league_url", "")
         tier_num, tier_name = _classify_league(league_name)
@@ -162,7 +165,6 @@ def _export_england_boundaries(boundaries_path: Path) -> None:
         return
 
     from shapely.geometry import mapping, shape
-    from shapely.prepared import prep
 
     countries_file = Path(BOUNDARY_PATHS["countries"])
     if not countries_file.exists():
@@ -202,8 +204,6 @@ def _export_england_boundaries(boundaries_path: Path) -> None:
         "wards": None,
     }
 
-    england_prep = prep(england_geom)
-
     for level, key, _name_prop in [
         ("itl_1", "itl1", "ITL125NM"),
         ("itl_2", "itl2", "ITL225NM"),
@@ -215,17 +215,7 @@ def _export_england_boundaries(boundaries_path: Path) -> None:
         with open(gp, encoding="utf-8") as f:
             data = json.load(f)
 
-        feats = []
-        for feat in data["features"]:
-            geom = shape(feat["geometry"])
-            if england_prep.contains(geom.centroid):
-                feats.append(
-                    {
-                        "type": "Feature",
-                        "geometry": mapping(geom.simplify(0.001, preserve_topology=True)),
-                        "properties": feat.get("properties", {}),
-                    }
-                )
+        feats = simplified_features(data["features"], england_geom)
 
         if feats:
             boundary_data[level] = {
@@ -235,8 +225,7 @@ def _export_england_boundaries(boundaries_path: Path) -> None:
             logger.info("  %s: %d regions", level, len(feats))
 
     boundaries_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(boundaries_path, "w") as fout:
-        json.dump(boundary_data, fout, separators=(",", ":"))
+    write_shared_boundaries(boundary_data, boundaries_path)
     logger.info("Exported England boundaries to %s", boundaries_path)
 
 
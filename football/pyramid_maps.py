@@ -61,7 +61,7 @@ def main() -> None:
     itl_hierarchy = prepare_map_context(production=production, show_debug=show_debug)
     output_dir = dist_season_dir(season, production=production)
     output_dir.mkdir(parents=True, exist_ok=True)
-    territory_cache: TerritoryCache = {}
+    territory_cache = TerritoryCache()
 
     from core.map_builder import preassign_itl_regions
 
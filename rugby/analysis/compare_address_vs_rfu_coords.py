@@ -27,6 +27,7 @@ from core.config import CACHE_DIR
 from rugby import DATA_DIR
 from rugby.addresses import team_name_to_club_name
 from rugby.distances import distance as haversine_km
+from rugby.geocode import normalize_address
 
 CLUB_ADDRESS_CACHE = CACHE_DIR / "club_address_cache.json"
 GEOCODE_CACHE = CACHE_DIR / "geocode_cache.json"
@@ -45,7 +46,8 @@ def _nominatim_coords(
     addr = club_addresses.get(club)
     if not addr or not isinstance(addr, str):
         return None
-    hit = geocode.get(addr)
+    # Keys are normalised since the geocoder started canonicalising addresses
+    hit = geocode.get(normalize_address(addr), geocode.get(addr))
     if not isinstance(hit, dict):
         return None
     lat, lon = hit.get("latitude"), hit.get("longitude")
@@ -139,7 +141,12 @@ def main() -> None:
         resolved = _nominatim_coords(club, club_addresses, geocode)
         if resolved is None:
             addr = club_addresses.get(club)
-            if isinstance(addr, str) and addr and addr not in geocode:
+            if (
+                isinstance(addr, str)
+                and addr
+                and normalize_address(addr) not in geocode
+                and addr not in geocode
+            ):
                 address_but_no_geocode_hit += 1
         else:
             lat_n, lon_n, _formatted = resolved
@@ -25,14 +25,15 @@ from html import escape as html_escape
 from pathlib import Path
 
 import numpy as np
-from shapely.geometry import Point, mapping, shape
-from shapely.prepared import prep
+import shapely
+from shapely.geometry import mapping, shape
 
 from core import (
     GeocodedLeague,
     TravelDistances,
     get_config,
     get_twitter_card_meta,
+    json_load_mapped,
     set_config,
     setup_logging,
 )
@@ -44,6 +45,7 @@ from core.basemap_tiles import (
     custom_map_basemap_html_attribution,
 )
 from core.config import BOUNDARIES_DIR, DIST_DIR, get_favicon_html, get_google_analytics_script
+from core.map_builder import geometries_from_geojson
 from rugby import DATA_DIR
 from rugby.custom_map_imports import write_bonus_imports_js
 from rugby.custom_map_season_imports import write_season_imports_js
@@ -99,73 +101,96 @@ _ENGLAND_ITL_PREFIXES = frozenset(
 
 
 def _load_geojson(path: Path) -> dict:
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json_load_mapped(path)
+
+
+def _region_dicts(
+    keys: list[str], names: list[str], codes: list[str], geoms: list[dict]
+) -> dict[str, dict]:
+    """Region dicts keyed by *keys* for GeoJSON *geoms*, built with bulk shapely calls."""
+    geom_array = geometries_from_geojson(geoms)
+    shapely.prepare(geom_array)
+    centroids = shapely.centroid(geom_array)
+    return {
+        key: {"name": name, "code": code, "geom": geom, "centroid": centroid}
+        for key, name, code, geom, centroid in zip(
+            keys, names, codes, geom_array, centroids, strict=True
+        )
+    }
 
 
 def _load_regions(path: Path, code_key: str, name_key: str) -> dict[str, dict]:
     """Load GeoJSON features into region dicts keyed by name."""
     data = _load_geojson(path)
-    regions: dict[str, dict] = {}
+    names: list[str] = []
+    codes: list[str] = []
+    geoms: list[dict] = []
     for feat in data["features"]:
         props = feat["properties"]
         code = props.get(code_key, "")
         name = props.get(name_key, "")
         if not code or not name:
             continue
-        geom = shape(feat["geometry"])
-        regions[name] = {
-            "name": name,
-            "code": code,
-            "geom": geom,
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-    return regions
+        names.append(name)
+        codes.append(code)
+        geoms.append(feat["geometry"])
+    return _region_dicts(names, names, codes, geoms)
 
 
 def _load_lad_regions(path: Path) -> dict[str, dict]:
     """Load LAD regions keyed by LAD code."""
     data = _load_geojson(path)
-    regions: dict[str, dict] = {}
+    names: list[str] = []
+    codes: list[str] = []
+    geoms: list[dict] = []
     for feat in data["features"]:
         props = feat["properties"]
         code = props.get("LAD25CD", "")
-        name = props.get("LAD25NM", "")
         if not code:
             continue
-        geom = shape(feat["geometry"])
-        regions[code] = {
-            "name": name,
-            "code": code,
-            "geom": geom,
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
-    return regions
+        names.append(props.get("LAD25NM", ""))
+        codes.append(code)
+        geoms.append(feat["geometry"])
+    return _region_dicts(codes, names, codes, geoms)
 
 
 def _load_ward_regions(path: Path) -> tuple[dict[str, dict], dict[str, str | None]]:
     """Load ward regions keyed by ward code, plus ward→LAD parent mapping."""
     data = _load_geojson(path)
-    regions: dict[str, dict] = {}
+    names: list[str] = []
+    codes: list[str] = []
+    geoms: list[dict] = []
     ward_to_lad: dict[str, str | None] = {}
     for feat in data["features"]:
         props = feat["properties"]
         code = props.get("WD25CD", "")
-        name = props.get("WD25NM", "")
         if not code:
             continue
-        geom = shape(feat["geometry"])
-        regions[code] = {
-            "name": name,
-            "code": code,
-            "geom": geom,
-            "prepared": prep(geom),
-            "centroid": geom.centroid,
-        }
+        names.append(props.get("WD25NM", ""))
+        codes.append(code)
+        geoms.append(feat["geometry"])
         ward_to_lad[code] = props.get("LAD25CD")
-    return regions, ward_to_lad
+    return _region_dicts(codes, names, codes, geoms), ward_to_lad
+
+
+def _regions_containing(regions: dict[str, dict], points: np.ndarray) -> list[set[str]]:
+    """Keys of *regions* containing each of *points*, from one bulk STRtree query."""
+    hits: list[set[str]] = [set() for _ in range(len(points))]
+    if not regions or not len(points):
+        return hits
+    keys = list(regions)
+    tree = shapely.STRtree([r["geom"] for r in regions.values()])
+    point_idx, region_idx = tree.query(points, predicate="within")
+    for p, r in zip(point_idx.tolist(), region_idx.tolist(), strict=True):
+        hits[p].add(keys[r])
+    return hits
+
+
+def _first_of(candidates: list[str], hits: set[str]) -> str | None:
+    """First of *candidates* in *hits*, so ties resolve in hierarchy order."""
+    if not hits:
+        return None
+    return next((key for key in candidates if key in hits), None)
 
 
 def _build_hierarchy(
@@ -201,27 +226,24 @@ def _build_hierarchy(
     for itl3_name, itl2_name in itl3_to_itl2.items():
         itl2_to_itl3s.setdefault(itl2_name, []).append(itl3_name)
 
+    # One STRtree query per level places every LAD centroid, instead of a
+    # prepared.contains call per LAD per candidate region.
     itl3_to_lads: dict[str, list[str]] = {}
-    for lad_code, lad in lad_regions.items():
-        centroid = lad["centroid"]
-        found_itl1 = None
-        for itl1 in itl1_regions.values():
-            if itl1["prepared"].contains(centroid):
-                found_itl1 = itl1["name"]
-                break
-        if not found_itl1:
+    centroids = np.array([lad["centroid"] for lad in lad_regions.values()], dtype=object)
+    in_itl1 = _regions_containing(itl1_regions, centroids)
+    in_itl2 = _regions_containing(itl2_regions, centroids)
+    in_itl3 = _regions_containing(itl3_regions, centroids)
+    itl1_order = list(itl1_regions)
+    for i, lad_code in enumerate(lad_regions):
+        itl1_key = _first_of(itl1_order, in_itl1[i])
+        if not itl1_key:
             continue
-        found_itl2 = None
-        for itl2_name in itl1_to_itl2s.get(found_itl1, []):
-            if itl2_regions[itl2_name]["prepared"].contains(centroid):
-                found_itl2 = itl2_name
-                break
+        found_itl2 = _first_of(itl1_to_itl2s.get(itl1_regions[itl1_key]["name"], []), in_itl2[i])
         if not found_itl2:
             continue
-        for itl3_name in itl2_to_itl3s.get(found_itl2, []):
-            if itl3_regions[itl3_name]["prepared"].contains(centroid):
-                itl3_to_lads.setdefault(itl3_name, []).append(lad_code)
-                break
+        itl3_name = _first_of(itl2_to_itl3s.get(found_itl2, []), in_itl3[i])
+        if itl3_name:
+            itl3_to_lads.setdefault(itl3_name, []).append(lad_code)
 
     lad_to_wards: dict[str, list[str]] = {}
     if ward_to_lad:
@@ -233,8 +255,7 @@ def _build_hierarchy(
 
 
 def _assign_team_regions(
-    lat: float,
-    lng: float,
+    points: np.ndarray,
     itl1_regions: dict[str, dict],
     itl2_regions: dict[str, dict],
     itl3_regions: dict[str, dict],
@@ -244,51 +265,30 @@ def _assign_team_regions(
     itl2_to_itl3s: dict[str, list[str]],
     itl3_to_lads: dict[str, list[str]],
     lad_to_wards: dict[str, list[str]],
-) -> tuple[str | None, str | None, str | None, str | None, str | None]:
-    """Point-in-polygon assignment: returns (itl1_name, itl2_name, itl3_name, lad_code, ward_code)."""
-    point = Point(lng, lat)
-
-    found_itl1 = None
-    for itl1 in itl1_regions.values():
-        if itl1["prepared"].contains(point):
-            found_itl1 = itl1["name"]
-            break
-    if not found_itl1:
-        return None, None, None, None, None
-
-    found_itl2 = None
-    for itl2_name in itl1_to_itl2s.get(found_itl1, []):
-        if itl2_regions[itl2_name]["prepared"].contains(point):
-            found_itl2 = itl2_name
-            break
-    if not found_itl2:
-        return found_itl1, None, None, None, None
-
-    found_itl3 = None
-    for itl3_name in itl2_to_itl3s.get(found_itl2, []):
-        if itl3_regions[itl3_name]["prepared"].contains(point):
-            found_itl3 = itl3_name
-            break
-    if not found_itl3:
-        return found_itl1, found_itl2, None, None, None
-
-    found_lad = None
-    for lad_code in itl3_to_lads.get(found_itl3, []):
-        lad = lad_regions.get(lad_code)
-        if lad and lad["prepared"].contains(point):
-            found_lad = lad_code
-            break
-    if not found_lad:
-        return found_itl1, found_itl2, found_itl3, None, None
-
-    found_ward = None
-    for ward_code in lad_to_wards.get(found_lad, []):
-        ward = ward_regions.get(ward_code)
-        if ward and ward["prepared"].contains(point):
-            found_ward = ward_code
-            break
-
-    return found_itl1, found_itl2, found_itl3, found_lad, found_ward
+) -> list[tuple[str | None, str | None, str | None, str | None, str | None]]:
+    """Point-in-polygon assignment of every point in *points*.
+
+    Returns ``(itl1_name, itl2_name, itl3_name, lad_code, ward_code)`` per point. Each
+    level is one bulk STRtree query; a level only counts when it is a child of the
+    region found one level up.
+    """
+    in_itl1 = _regions_containing(itl1_regions, points)
+    in_itl2 = _regions_containing(itl2_regions, points)
+    in_itl3 = _regions_containing(itl3_regions, points)
+    in_lad = _regions_containing(lad_regions, points)
+    in_ward = _regions_containing(ward_regions, points)
+    itl1_order = list(itl1_regions)
+
+    assigned: list[tuple[str | None, str | None, str | None, str | None, str | None]] = []
+    for i in range(len(points)):
+        itl1_key = _first_of(itl1_order, in_itl1[i])
+        itl1 = itl1_regions[itl1_key]["name"] if itl1_key else None
+        itl2 = _first_of(itl1_to_itl2s.get(itl1, []), in_itl2[i]) if itl1 else None
+        itl3 = _first_of(itl2_to_itl3s.get(itl2, []), in_itl3[i]) if itl2 else None
+        lad = _first_of(itl3_to_lads.get(itl3, []), in_lad[i]) if itl3 else None
+        ward = _first_of(lad_to_wards.get(lad, []), in_ward[i]) if lad else None
+        assigned.append((itl1, itl2, itl3, lad, ward))
+    return assigned
 
 
 # ---------------------------------------------------------------------------
@@ -454,22 +454,27 @@ def _collect_teams(
 
     teams = sorted(seen.values(), key=lambda t: t["n"])
 
+    # Build every team's point in one vectorized call rather than one Point() per team
+    lngs = np.fromiter((t["lng"] for t in teams), dtype=np.float64, count=len(teams))
+    lats = np.fromiter((t["lat"] for t in teams), dtype=np.float64, count=len(teams))
+    points = shapely.points(lngs, lats)
+
+    regions = _assign_team_regions(
+        points,
+        itl1_regions,
+        itl2_regions,
+        itl3_regions,
+        lad_regions,
+        ward_regions,
+        itl1_to_itl2s,
+        itl2_to_itl3s,
+        itl3_to_lads,
+        lad_to_wards,
+    )
+
     assigned = 0
     ward_assigned = 0
-    for team in teams:
-        itl1, itl2, itl3, lad, ward = _assign_team_regions(
-            team["lat"],
-            team["lng"],
-            itl1_regions,
-            itl2_regions,
-            itl3_regions,
-            lad_regions,
-            ward_regions,
-            itl1_to_itl2s,
-            itl2_to_itl3s,
-            itl3_to_lads,
-            lad_to_wards,
-        )
+    for team, (itl1, itl2, itl3, lad, ward) in zip(teams, regions, strict=True):
         if itl1:
             team["r1"] = itl1
         if itl2:
@@ -516,13 +521,18 @@ def _export_boundaries(
 ) -> None:
     """Write boundaries.js with simplified England-only geometries and hierarchy."""
 
-    def _region_entry(region: dict, tolerance: float = SIMPLIFY_TOLERANCE) -> dict:
-        simplified = region["geom"].simplify(tolerance, preserve_topology=True)
-        c = region["centroid"]
-        return {
-            "geom": mapping(simplified),
-            "centroid": [round(c.x, 4), round(c.y, 4)],
-        }
+    def _region_entries(
+        regions: dict[str, dict], keys: list[str], tolerance: float = SIMPLIFY_TOLERANCE
+    ) -> dict[str, dict]:
+        # One vectorized simplify call per level rather than one per region
+        simplified = shapely.simplify(
+            [regions[key]["geom"] for key in keys], tolerance, preserve_topology=True
+        )
+        entries = {}
+        for key, geom in zip(keys, simplified, strict=True):
+            c = regions[key]["centroid"]
+            entries[key] = {"geom": mapping(geom), "centroid": [round(c.x, 4), round(c.y, 4)]}
+        return entries
 
     bd: dict = {
         "countries": {},
@@ -534,7 +544,7 @@ def _export_boundaries(
         "ward": {},
     }
 
-    country_prepared: dict = {}
+    country_geoms: dict = {}
     countries_path = BOUNDARY_PATHS.get("countries")
     if countries_path and countries_path.exists():
         countries_data = _load_geojson(countries_path)
@@ -549,32 +559,26 @@ def _export_boundaries(
                     "geom": geom_dict,
                     "centroid": [round(c.x, 4), round(c.y, 4)],
                 }
-                country_prepared[name] = prep(geom)
-
-    for name, r in itl1_regions.items():
-        if _is_england(r["code"], "itl"):
-            bd["itl1"][name] = _region_entry(r)
-
-    for name, r in itl2_regions.items():
-        if _is_england(r["code"], "itl"):
-            bd["itl2"][name] = _region_entry(r)
+                shapely.prepare(geom)
+                country_geoms[name] = geom
 
-    for name, r in itl3_regions.items():
-        if _is_england(r["code"], "itl"):
-            bd["itl3"][name] = _region_entry(r)
+    for level, regions in (("itl1", itl1_regions), ("itl2", itl2_regions), ("itl3", itl3_regions)):
+        keys = [name for name, r in regions.items() if _is_england(r["code"], "itl")]
+        bd[level] = _region_entries(regions, keys)
 
-    for code, r in lad_regions.items():
-        if _is_england(code, "lad"):
-            bd["lad"][code] = _region_entry(r)
-
-    for code, r in ward_regions.items():
-        if _is_england(code, "lad"):
-            bd["ward"][code] = _region_entry(r, WARD_SIMPLIFY_TOLERANCE)
+    bd["lad"] = _region_entries(
+        lad_regions, [code for code in lad_regions if _is_england(code, "lad")]
+    )
+    bd["ward"] = _region_entries(
+        ward_regions,
+        [code for code in ward_regions if _is_england(code, "lad")],
+        WARD_SIMPLIFY_TOLERANCE,
+    )
 
     itl0_to_itl1s: dict[str, list[str]] = {}
-    for c_name, c_prep in country_prepared.items():
+    for c_name, c_geom in country_geoms.items():
         for itl1_name in bd["itl1"]:
-            if c_prep.contains(itl1_regions[itl1_name]["centroid"]):
+            if c_geom.contains(itl1_regions[itl1_name]["centroid"]):
                 itl0_to_itl1s.setdefault(c_name, []).append(itl1_name)
     bd["itl0_to_itl1s"] = itl0_to_itl1s
 
@@ -889,9 +893,10 @@ def main() -> None:
             for feat in countries_data.get("features", []):
                 cname = feat["properties"].get("CTRY24NM", "")
                 if cname in COUNTRY_OUTLINES:
-                    c_prep = prep(shape(feat["geometry"]))
+                    c_geom = shape(feat["geometry"])
+                    shapely.prepare(c_geom)
                     for itl1_name, itl1 in itl1_regions.items():
-                        if c_prep.contains(itl1["centroid"]):
+                        if c_geom.contains(itl1["centroid"]):
                             itl1_to_country[itl1_name] = cname
             country_assigned = 0
             for team in teams:
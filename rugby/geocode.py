@@ -1,16 +1,26 @@
 """
 Script to geocode team addresses using OpenStreetMap Nominatim API.
 Reads team addresses from team_addresses/ directory and adds coordinates.
-Includes client-side caching by address to minimize API calls.
+Includes client-side caching by address to minimize API calls, and reuses each worker
+thread's keep-alive session (``core.get_session``) so requests skip the TCP/TLS handshake.
 """
 
 import argparse
+import atexit
 import concurrent.futures
+import contextlib
+import functools
 import json
+import os
+import queue
 import re
 import threading
 import time
+import unicodedata
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+from typing import Any
+from urllib.parse import quote_plus, urlencode
 
 import requests
 
@@ -20,24 +30,68 @@ from core import (
     GeocodedLeague,
     GeocodedTeam,
     GeocodeResult,
+    get_session,
+    json_load_mapped,
+    json_loads,
     print_block,
 )
 from core.config import CACHE_DIR
 from rugby import DATA_DIR
 
-_cache_lock = threading.RLock()
-_cache_dirty_lock = threading.Lock()
-
-# Rate limiting for Nominatim (1 request per second)
+NOMINATIM_SEARCH_URL = "https://nominatim.openstreetmap.org/search"
+_NOMINATIM_HEADERS = {
+    "User-Agent": "RugbyMappingProject/1.0 (https://github.com/jmforsythe/Rugby-Map)"
+}
+_RETRY_STATUSES = {503, 429}  # Service unavailable, rate limit
+# Query parameters shared by every search, encoded once; only ``limit`` and ``q`` vary per call
+_SEARCH_PARAMS = {
+    "format": "json",
+    "countrycodes": "gb,im,je,gg",  # UK + IoM + Jersey + Guernsey
+    "addressdetails": 1,
+}
+_SEARCH_URL_PREFIX = f"{NOMINATIM_SEARCH_URL}?{urlencode(_SEARCH_PARAMS)}"
+
+
+@functools.cache
+def _search_url_prefix(limit: int) -> str:
+    return f"{_SEARCH_URL_PREFIX}&limit={limit}&q="
+
+
+# Rate limiting for Nominatim (1 request per second). The interval adapts AIMD-style:
+# every 429/503 doubles it (up to the max) and every success trims it back towards 1s,
+# so the whole pool slows down together instead of each worker backing off on its own.
+_MIN_REQUEST_INTERVAL_SECONDS = 1.0
+_MAX_REQUEST_INTERVAL_SECONDS = 16.0
+_REQUEST_INTERVAL_STEP_SECONDS = 0.25
+_request_interval = _MIN_REQUEST_INTERVAL_SECONDS
 _last_request_time = 0.0
 _rate_limit_lock = threading.Lock()
 
-# Cache dirty flags
-_address_cache_dirty = False
-
-# Cache for address -> coordinates
-geocode_cache: dict[str, GeocodeResult] = {}
+# Cache for address -> coordinates, striped by key hash. Each shard is an immutable
+# snapshot that writers copy, insert into and rebind under that shard's lock, so an insert
+# copies and contends on ~1/_CACHE_SHARDS of the cache; readers take no lock at all.
+_CACHE_SHARDS = 16
+_cache_shards: list[dict[str, GeocodeResult]] = [{} for _ in range(_CACHE_SHARDS)]
+_cache_shard_locks = [threading.Lock() for _ in range(_CACHE_SHARDS)]
 CACHE_FILE = str(CACHE_DIR / "geocode_cache.json")
+# Entries added since the last full save, one ``[key, value]`` JSON line each. Routine
+# flushes append here (O(new entries)); ``flush_cache(force=True)`` folds them into
+# CACHE_FILE, which stays the single file other tools read.
+CACHE_JOURNAL_FILE = str(CACHE_DIR / "geocode_cache.journal.jsonl")
+_journal_keys: list[str] = []
+_journal_lock = threading.Lock()
+# Journal appends run on a daemon writer thread so flush_cache() never blocks on disk I/O;
+# an atexit hook waits for queued appends so a normal exit never cuts a line short
+_journal_queue: queue.Queue[list[tuple[str, object]]] = queue.Queue()
+_journal_writer: threading.Thread | None = None
+
+# Addresses Nominatim answered with no results (for the address and its postcode) are
+# cached as ``{"no_results": True, "cached_at": <epoch>}`` and not re-queried until stale.
+NEGATIVE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Uncached addresses currently being looked up, so concurrent callers share one request
+_inflight_lookups: dict[str, concurrent.futures.Future[GeocodeResult | None]] = {}
+_inflight_lock = threading.Lock()
 
 # Track teams that fail to geocode
 teams_without_geocodes: list[tuple[str, str, str, str]] = (
@@ -46,57 +100,194 @@ teams_without_geocodes: list[tuple[str, str, str, str]] = (
 
 
 def load_cache() -> None:
-    """Load address cache from file."""
-    global geocode_cache
+    """Load address cache from file, replaying any journal left by an unfinished run."""
+    global _cache_shards
+    loaded: dict[str, GeocodeResult] = {}
     if Path(CACHE_FILE).exists():
-        with open(CACHE_FILE, encoding="utf-8") as f:
-            geocode_cache = json.load(f)
-        print(f"Loaded {len(geocode_cache)} cached addresses")
+        loaded = json_load_mapped(CACHE_FILE)
+    if Path(CACHE_JOURNAL_FILE).exists():
+        _replay_cache_journal(loaded)
+    if loaded:
+        shards: list[dict[str, GeocodeResult]] = [{} for _ in range(_CACHE_SHARDS)]
+        for raw_key, value in loaded.items():
+            # Re-key entries written before keys were normalised (idempotent otherwise)
+            key = _normalize_cache_key(raw_key)
+            shards[_cache_shard(key)][key] = value
+        _cache_shards = shards
+        print(f"Loaded {len(loaded)} cached addresses")
+
+
+def _replay_cache_journal(loaded: dict[str, GeocodeResult]) -> None:
+    """Apply journal lines to ``loaded``, stopping at a line cut short by a killed run.
+
+    The journal is truncated back to its last complete line, so later appends do not
+    land on the end of the broken one; the next full save drops it altogether.
+    """
+    with open(CACHE_JOURNAL_FILE, "rb+") as f:
+        good_end = 0
+        for line in f:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("missing newline")
+                if line.strip():
+                    key, value = json_loads(line)
+                    loaded[key] = value
+            except ValueError as e:
+                print(f"Ignoring truncated geocode cache journal after byte {good_end}: {e}")
+                f.truncate(good_end)
+                return
+            good_end += len(line)
+
+
+def _cache_shard(key: str) -> int:
+    return hash(key) & (_CACHE_SHARDS - 1)
+
+
+def _cache_get(key: str) -> GeocodeResult | None:
+    """Lock-free cache lookup against the current snapshot of ``key``'s shard."""
+    return _cache_shards[_cache_shard(key)].get(key)
+
+
+def cache_size() -> int:
+    """Number of cached addresses across all shards."""
+    return sum(len(shard) for shard in _cache_shards)
+
+
+def _cache_snapshot() -> dict[str, GeocodeResult]:
+    """Merge the shards into one key-sorted dict for serialisation."""
+    return dict(sorted(item for shard in _cache_shards for item in shard.items()))
+
 
+def _is_no_results_entry(entry: object) -> bool:
+    return isinstance(entry, dict) and bool(entry.get("no_results"))
 
-def _mark_address_cache_dirty() -> None:
-    global _address_cache_dirty
-    with _cache_dirty_lock:
-        _address_cache_dirty = True
+
+def _is_cache_hit(entry: object) -> bool:
+    """Whether a cache entry answers a lookup: a result, or a negative entry not yet stale."""
+    if _is_no_results_entry(entry):
+        return time.time() - entry["cached_at"] < NEGATIVE_CACHE_TTL_SECONDS  # type: ignore
+    return bool(entry)
+
+
+def _cache_put(key: str, value: GeocodeResult | list[GeocodeResult]) -> None:
+    """Publish a new snapshot of ``key``'s shard containing it and queue it for the journal."""
+    idx = _cache_shard(key)
+    with _cache_shard_locks[idx]:
+        updated = dict(_cache_shards[idx])
+        updated[key] = value
+        _cache_shards[idx] = updated
+    with _journal_lock:
+        _journal_keys.append(key)
 
 
 def flush_cache(force: bool = False) -> None:
-    """Persist cache if dirty (or if force=True)."""
-    global _address_cache_dirty
-    with _cache_dirty_lock:
-        address_dirty = _address_cache_dirty
-        if force:
-            address_dirty = True
-        _address_cache_dirty = False
+    """Persist new cache entries if any; ``force=True`` rewrites the full cache file.
+
+    Pending journal keys double as the dirty flag, so the hot path sets no separate
+    flag and the lock-free emptiness check skips clean flushes without locking.
+    """
+    if force:
+        save_cache()
+    elif _journal_keys:
+        _append_cache_journal()
+
+
+def _append_cache_journal() -> None:
+    """Queue entries added since the last flush for the background journal writer."""
+    global _journal_writer
+    with _journal_lock:
+        keys = list(_journal_keys)
+        _journal_keys.clear()
+    if not keys:
+        return
+    if _journal_writer is None:
+        _journal_writer = threading.Thread(target=_journal_writer_loop, daemon=True)
+        _journal_writer.start()
+        atexit.register(_wait_for_journal_writes)
+    # Values are immutable once published, so capturing them now is enough
+    _journal_queue.put([(key, _cache_get(key)) for key in keys])
 
-    if address_dirty:
-        with _cache_lock:
-            save_cache()
+
+def _wait_for_journal_writes() -> None:
+    """Block until every queued journal append has been written."""
+    _journal_queue.join()
+
+
+def _journal_writer_loop() -> None:
+    while True:
+        entries = _journal_queue.get()
+        try:
+            with open(CACHE_JOURNAL_FILE, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        except OSError as e:
+            # The entries are still in memory and will be in the next full save
+            print_block(f"  ! Could not append to geocode cache journal: {e}")
+        finally:
+            _journal_queue.task_done()
 
 
 def save_cache() -> None:
-    """Save address cache to file."""
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(geocode_cache, f, indent=2, ensure_ascii=False)
+    """Save the full address cache to file and drop the now-redundant journal.
+
+    Waits for queued journal appends first, then publishes the file atomically
+    (write to a temp file + ``os.replace``) so a crash never leaves a truncated cache.
+    """
+    _wait_for_journal_writes()
+    with _journal_lock:
+        _journal_keys.clear()
+    snapshot = _cache_snapshot()
+    tmp_file = f"{CACHE_FILE}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, CACHE_FILE)
+    Path(CACHE_JOURNAL_FILE).unlink(missing_ok=True)
 
 
 def wait_for_rate_limit(min_interval_seconds: float = 1.0) -> None:
     """Ensure at least min_interval_seconds has passed since the last API request.
 
     This implements a global rate limiter across all threads to comply with
-    Nominatim's usage policy of max 1 request per second.
+    Nominatim's usage policy of max 1 request per second. Each caller reserves the
+    next free send slot under the lock and sleeps *outside* it, so waiting workers
+    queue up concurrently instead of convoying on a lock held across ``sleep``.
+    The gap is widened further while Nominatim is pushing back (see
+    :func:`_record_response_status`).
     """
     global _last_request_time
 
     with _rate_limit_lock:
-        current_time = time.time()
-        time_since_last_request = current_time - _last_request_time
+        interval = max(min_interval_seconds, _request_interval)
+        slot = max(time.monotonic(), _last_request_time + interval)
+        _last_request_time = slot
+
+    delay = slot - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
 
-        if time_since_last_request < min_interval_seconds:
-            sleep_time = min_interval_seconds - time_since_last_request
-            time.sleep(sleep_time)
 
-        _last_request_time = time.time()
+def _record_response_status(status_code: int) -> None:
+    """Adapt the shared request interval: double on 429/503, step back down on success."""
+    global _request_interval
+    with _rate_limit_lock:
+        if status_code in _RETRY_STATUSES:
+            _request_interval = min(_request_interval * 2, _MAX_REQUEST_INTERVAL_SECONDS)
+        elif status_code == 200:
+            _request_interval = max(
+                _request_interval - _REQUEST_INTERVAL_STEP_SECONDS, _MIN_REQUEST_INTERVAL_SECONDS
+            )
+
+
+def _nominatim_get(query: str, limit: int = 1) -> requests.Response:
+    """Rate-limited Nominatim search request whose status feeds the adaptive pacing.
+
+    The URL is assembled from a pre-encoded prefix so requests has no params to merge
+    and encode on each call.
+    """
+    url = _search_url_prefix(limit) + quote_plus(query)
+    wait_for_rate_limit(1.0)
+    response = get_session().get(url, headers=_NOMINATIM_HEADERS, timeout=10, stream=True)
+    _record_response_status(response.status_code)
+    return response
 
 
 def extract_uk_postcode(address: str) -> str | None:
@@ -109,10 +300,43 @@ def extract_uk_postcode(address: str) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
+def normalize_address(address: str) -> str:
+    """Canonical form of ``address`` used as the cache key and sent to Nominatim.
+
+    Scraped addresses differ only in Unicode form, case, spacing and stray punctuation
+    (``"1 High St , London "`` vs ``"1 High St, London"``); collapsing those raises the
+    cache hit rate without changing what Nominatim matches. Memoized because each team's
+    address is normalized several times per run (partitioning, prefetch, cache lookup).
+    """
+    text = " ".join(unicodedata.normalize("NFKC", address).split()).lower()
+    return text.replace(" ,", ",").strip(" ,.;")
+
+
+def _normalize_cache_key(key: str) -> str:
+    address, sep, suffix = key.partition("\0")
+    return normalize_address(address) + sep + suffix
+
+
 def _nominatim_cache_key(address: str, limit: int) -> str:
     return address if limit == 1 else f"{address}\0limit={limit}"
 
 
+def _read_hits(response: requests.Response) -> list | None:
+    """Hit list from a Nominatim reply, or None for a non-200 status.
+
+    Requests are sent with ``stream=True`` so error bodies are never downloaded or
+    decoded, and the common ``[]`` miss is answered without running the JSON parser.
+    """
+    if response.status_code != 200:
+        response.close()
+        return None
+    body = response.content
+    if body.strip() == b"[]":
+        return []
+    return json_loads(body)
+
+
 def _parse_nominatim_hits(data: list, fallback_address: str) -> list[GeocodeResult]:
     return [
         {
@@ -136,38 +360,28 @@ def search_nominatim(
     if limit < 1:
         return []
 
+    address = normalize_address(address)
     cache_key = _nominatim_cache_key(address, limit)
-    with _cache_lock:
-        cached = geocode_cache.get(cache_key)
-    if cached is not None:
+    cached = _cache_get(cache_key)
+    if _is_no_results_entry(cached):
+        if _is_cache_hit(cached):
+            return []
+    elif cached is not None:
         if limit == 1:
             return [cached] if isinstance(cached, dict) else list(cached)
         return list(cached) if isinstance(cached, list) else [cached]
 
-    base_url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        "q": address,
-        "format": "json",
-        "limit": limit,
-        "countrycodes": "gb,im,je,gg",
-        "addressdetails": 1,
-    }
-    headers = {"User-Agent": "RugbyMappingProject/1.0 (https://github.com/jmforsythe/Rugby-Map)"}
-    retry_statuses = {503, 429}
-
     for attempt in range(max_retries + 1):
         try:
-            wait_for_rate_limit(1.0)
-            response = requests.get(base_url, params=params, headers=headers, timeout=10)
+            response = _nominatim_get(address, limit)
             if response.status_code == 200:
-                results = _parse_nominatim_hits(response.json(), address)
-                with _cache_lock:
-                    geocode_cache[cache_key] = results[0] if limit == 1 and results else results
-                _mark_address_cache_dirty()
+                results = _parse_nominatim_hits(_read_hits(response) or [], address)
+                _cache_put(cache_key, results[0] if limit == 1 and results else results)
                 return results
 
-            if response.status_code in retry_statuses and attempt < max_retries:
-                time.sleep(backoff_base_seconds * (2**attempt))
+            response.close()
+            if response.status_code in _RETRY_STATUSES and attempt < max_retries:
+                # The shared limiter has already widened its interval; just queue again
                 continue
             return []
 
@@ -199,36 +413,57 @@ def geocode_with_nominatim(
     if log_lines is None:
         log_lines = []
 
-    # Check cache first
-    with _cache_lock:
-        cached = geocode_cache.get(address)
-    if cached:
+    address = normalize_address(address)
+
+    # Check cache first (lock-free: the snapshot reference is never mutated in place)
+    cached = _cache_get(address)
+    if _is_cache_hit(cached):
+        if _is_no_results_entry(cached):
+            log_lines.append("    ✗ Cached: no results for address or postcode")
+            return None, log_lines
         log_lines.append("    ✓ Using cached coordinates for address")
         return cached, log_lines
 
-    base_url = "https://nominatim.openstreetmap.org/search"
-
-    params = {
-        "q": address,
-        "format": "json",
-        "limit": 1,
-        "countrycodes": "gb,im,je,gg",  # UK + IoM + Jersey + Guernsey
-        "addressdetails": 1,
-    }
+    # Single-flight: if another thread is already looking this address up, wait for its
+    # answer rather than spending a rate-limited request on the same query.
+    with _inflight_lock:
+        inflight = _inflight_lookups.get(address)
+        is_owner = inflight is None
+        if inflight is None:
+            inflight = _inflight_lookups[address] = concurrent.futures.Future()
+    if not is_owner:
+        coords = inflight.result()
+        if coords:
+            log_lines.append("    ✓ Reused concurrent lookup for address")
+        else:
+            log_lines.append("    ✗ Concurrent lookup for address failed")
+        return coords, log_lines
 
-    headers = {"User-Agent": "RugbyMappingProject/1.0 (https://github.com/jmforsythe/Rugby-Map)"}
+    result: GeocodeResult | None = None
+    try:
+        result, log_lines = _lookup_nominatim(address, max_retries, backoff_base_seconds, log_lines)
+    finally:
+        with _inflight_lock:
+            del _inflight_lookups[address]
+        inflight.set_result(result)
+    return result, log_lines
 
-    retry_statuses = {503, 429}  # Service unavailable, rate limit
 
+def _lookup_nominatim(
+    address: str,
+    max_retries: int,
+    backoff_base_seconds: float,
+    log_lines: list[str],
+) -> tuple[GeocodeResult | None, list[str]]:
+    """Query Nominatim for ``address`` (falling back to its postcode) and cache any hit."""
+    query = address
     for attempt in range(max_retries + 1):
         try:
             # Nominatim requires 1 second between requests - use global rate limiter
-            wait_for_rate_limit(1.0)
-
-            response = requests.get(base_url, params=params, headers=headers, timeout=10)
+            response = _nominatim_get(query)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _read_hits(response) or []
 
                 if len(data) > 0:
                     result: GeocodeResult = {
@@ -238,26 +473,25 @@ def geocode_with_nominatim(
                         "place_id": data[0].get("place_id", ""),
                     }
 
-                    with _cache_lock:
-                        geocode_cache[address] = result
-                    _mark_address_cache_dirty()
+                    _cache_put(address, result)
 
                     return result, log_lines
                 else:
+                    # Only cache "no results" if every query in the fallback chain was
+                    # answered with an empty list, not if any of them hit an HTTP error
+                    all_answered = True
                     # No results - try with just postcode if we haven"t already
-                    if params["q"] == address:  # First attempt with full address
+                    if query == address:  # First attempt with full address
                         postcode = extract_uk_postcode(address)
                         if postcode:
                             log_lines.append(
                                 f"    ! No results for full address, trying postcode: {postcode}"
                             )
-                            params["q"] = postcode
-                            wait_for_rate_limit(1.0)
-                            response = requests.get(
-                                base_url, params=params, headers=headers, timeout=10
-                            )
+                            query = postcode
+                            response = _nominatim_get(query)
 
-                            response_json = response.json() if response.status_code == 200 else None
+                            response_json = _read_hits(response)
+                            all_answered = response_json is not None
                             if not response_json or len(response_json) == 0:
                                 # Try with just first half of postcode if full postcode fails
                                 postcode_parts = postcode.split()
@@ -266,14 +500,11 @@ def geocode_with_nominatim(
                                     log_lines.append(
                                         f"    ! No results for full postcode, trying first half: {postcode_half}"
                                     )
-                                    params["q"] = postcode_half
-                                    wait_for_rate_limit(1.0)
-                                    response = requests.get(
-                                        base_url, params=params, headers=headers, timeout=10
-                                    )
+                                    query = postcode_half
+                                    response = _nominatim_get(query)
 
                             if response.status_code == 200:
-                                data = response.json()
+                                data = _read_hits(response) or []
                                 if len(data) > 0:
                                     result = {
                                         "latitude": float(data[0]["lat"]),
@@ -282,22 +513,25 @@ def geocode_with_nominatim(
                                         "place_id": data[0].get("place_id", ""),
                                     }
 
-                                    with _cache_lock:
-                                        geocode_cache[address] = result
-                                    _mark_address_cache_dirty()
+                                    _cache_put(address, result)
 
                                     log_lines.append("    ✓ Found using postcode")
                                     return result, log_lines
 
                     log_lines.append("    ✗ No results found for address or postcode")
+                    if all_answered and response.status_code == 200:
+                        # A definite "nothing found" rather than a transient error
+                        no_results = {"no_results": True, "cached_at": time.time()}
+                        _cache_put(address, no_results)  # type: ignore
                     return None, log_lines
 
-            if response.status_code in retry_statuses and attempt < max_retries:
-                sleep_seconds = backoff_base_seconds * (2**attempt)
+            response.close()
+            if response.status_code in _RETRY_STATUSES and attempt < max_retries:
+                # The shared limiter has already widened its interval; just queue again
                 log_lines.append(
-                    f"    ! Nominatim retry (status {response.status_code}) in {sleep_seconds:.1f}s"
+                    f"    ! Nominatim retry (status {response.status_code}), "
+                    f"pacing at {_request_interval:.2f}s between requests"
                 )
-                time.sleep(sleep_seconds)
                 continue
 
             log_lines.append(f"    ✗ Nominatim error: HTTP {response.status_code}")
@@ -331,22 +565,22 @@ def process_team(team: AddressTeam, api_retries: int = 3) -> tuple[GeocodedTeam,
     Returns:
         Tuple of (GeocodedTeam, log_text) so the caller can print without interleaving.
     """
-    log_lines: list[str] = [f"  Geocoding: {team["name"]}"]
+    header = f"  Geocoding: {team["name"]}"
 
+    # Short-circuit branches emit one pre-formatted string instead of building a list
     if "error" in team:
-        log_lines.append("    ✗ Skipped - error in address fetch")
         result: GeocodedTeam = dict(team)  # type: ignore
-        return result, "\n".join(log_lines)
+        return result, f"{header}\n    ✗ Skipped - error in address fetch"
 
     address: str | None = team.get("address")
 
     if not address:
-        log_lines.append("    ✗ No address available")
         result = dict(team)  # type: ignore
         result["error"] = "no_address"  # type: ignore
-        return result, "\n".join(log_lines)
+        return result, f"{header}\n    ✗ No address available"
 
     # Geocode the address
+    log_lines: list[str] = [header]
     coords: GeocodeResult | None
     coords, log_lines = geocode_with_nominatim(
         address, max_retries=api_retries, log_lines=log_lines
@@ -364,6 +598,105 @@ def process_team(team: AddressTeam, api_retries: int = 3) -> tuple[GeocodedTeam,
     return result, "\n".join(log_lines)
 
 
+def _executor_or_new(
+    executor: concurrent.futures.Executor | None, max_workers: int
+) -> contextlib.AbstractContextManager[concurrent.futures.Executor]:
+    """Borrow ``executor`` without shutting it down, or own a fresh thread pool."""
+    if executor is not None:
+        return contextlib.nullcontext(executor)
+    return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+
+def _completed_in_window[K](
+    pool: concurrent.futures.Executor,
+    fn: Callable[..., Any],
+    jobs: Iterable[tuple[K, tuple]],
+    window: int,
+) -> Iterator[tuple[K, concurrent.futures.Future]]:
+    """Run ``fn(*args)`` for each ``(key, args)`` job, yielding ``(key, future)`` as each finishes.
+
+    At most ``window`` futures are outstanding at a time; a new job is submitted as soon as
+    one completes, so large runs hold O(workers) futures rather than one per job.
+    """
+    jobs_iter = iter(jobs)
+    pending: dict[concurrent.futures.Future, K] = {}
+
+    def top_up() -> None:
+        while len(pending) < window:
+            job = next(jobs_iter, None)
+            if job is None:
+                return
+            key, args = job
+            pending[pool.submit(fn, *args)] = key
+
+    top_up()
+    while pending:
+        done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        finished = [(pending.pop(future), future) for future in done]
+        top_up()
+        yield from finished
+
+
+def geocoded_output_path(address_file_path: Path, address_dir: Path, season: str) -> Path:
+    """geocoded_teams path for an address file, mirroring subdirectories such as merit/."""
+    return DATA_DIR / "geocoded_teams" / season / address_file_path.relative_to(address_dir)
+
+
+def prefetch_addresses(
+    address_files: list[Path],
+    max_workers: int = 10,
+    api_retries: int = 3,
+    *,
+    executor: concurrent.futures.Executor | None = None,
+) -> set[str]:
+    """Geocode every distinct uncached address across ``address_files`` in one fan-out.
+
+    Grounds shared between leagues (and teams repeated across files) are looked up once,
+    and the league pools that follow only see cache hits. Returns the addresses that
+    could not be geocoded so later passes do not spend requests on them again.
+    Pass ``executor`` to reuse a pool shared with :func:`process_address_file`.
+    """
+    addresses: dict[str, None] = {}  # ordered set
+    for address_file_path in address_files:
+        with open(address_file_path, encoding="utf-8") as f:
+            address_data: AddressLeague = json.load(f)
+        for team in address_data["teams"]:
+            address = team.get("address")
+            if address and "error" not in team:
+                key = normalize_address(address)
+                if not _is_cache_hit(_cache_get(key)):
+                    addresses[key] = None
+
+    failed: set[str] = set()
+    if not addresses:
+        return failed
+
+    print(
+        f"Geocoding {len(addresses)} distinct uncached addresses "
+        f"across {len(address_files)} address files"
+    )
+    with _executor_or_new(executor, max_workers) as pool:
+        jobs = ((address, (address, api_retries)) for address in addresses)
+        try:
+            for address, future in _completed_in_window(
+                pool, geocode_with_nominatim, jobs, max_workers * 2
+            ):
+                try:
+                    coords, log_lines = future.result()
+                except KeyboardInterrupt:
+                    print_block("  ✗ Interrupted by user")
+                    raise
+                except Exception as e:
+                    coords, log_lines = None, [f"    ✗ Geocoding error: {e}"]
+                if not coords:
+                    failed.add(address)
+                print_block("\n".join([f"  Geocoding: {address}", *log_lines]))
+        finally:
+            flush_cache()
+
+    return failed
+
+
 def process_address_file(
     address_file_path: Path,
     address_dir: Path,
@@ -372,16 +705,21 @@ def process_address_file(
     api_retries: int = 3,
     *,
     force: bool = False,
+    failed_addresses: set[str] | None = None,
+    executor: concurrent.futures.Executor | None = None,
 ) -> None:
-    """Process a single address JSON file and geocode all teams."""
+    """Process a single address JSON file and geocode all teams.
+
+    ``failed_addresses`` (from :func:`prefetch_addresses`) are marked as failed
+    without another request. Pass ``executor`` to share one worker pool across leagues
+    instead of starting and joining a fresh pool per file.
+    """
     global teams_without_geocodes
     print(f"{"="*80}")
     print(f"Processing: {address_file_path.name}")
     print(f"{"="*80}")
 
-    # Mirror subdirectory structure (e.g. merit/) from team_addresses to geocoded_teams
-    relative = address_file_path.relative_to(address_dir)
-    output_file = DATA_DIR / "geocoded_teams" / season / relative
+    output_file = geocoded_output_path(address_file_path, address_dir, season)
     if output_file.exists() and not force:
         print("  Skipping - already geocoded")
         return
@@ -398,17 +736,33 @@ def process_address_file(
 
     team_results: list[GeocodedTeam | None] = [None] * len(teams)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures_to_idx: dict[concurrent.futures.Future, int] = {}
+    # Nominatim has no batch endpoint, so the closest we get is one request per distinct
+    # uncached address: cache hits and address-less teams are resolved inline, and teams
+    # sharing a ground reuse the first lookup instead of occupying a worker of their own.
+    if failed_addresses is None:
+        failed_addresses = set()
+    inline_idxs: list[int] = []
+    lookup_idxs: dict[str, int] = {}
+    shared_idxs: list[int] = []
+    for idx, team in enumerate(teams):
+        address = team.get("address")
+        key = normalize_address(address) if address else ""
+        if "error" in team or not key or _is_cache_hit(_cache_get(key)):
+            inline_idxs.append(idx)
+        elif key in lookup_idxs or key in failed_addresses:
+            shared_idxs.append(idx)
+        else:
+            lookup_idxs[key] = idx
 
-        for idx, team in enumerate(teams):
-            future = executor.submit(process_team, team, api_retries)
-            futures_to_idx[future] = idx
+    for idx in inline_idxs:
+        result, log_text = process_team(teams[idx], api_retries)
+        print_block(log_text)
+        team_results[idx] = result
 
+    with _executor_or_new(executor, max_workers) as pool:
+        jobs = ((idx, (teams[idx], api_retries)) for idx in lookup_idxs.values())
         try:
-            for future in concurrent.futures.as_completed(futures_to_idx):
-                idx = futures_to_idx[future]
-
+            for idx, future in _completed_in_window(pool, process_team, jobs, max_workers * 2):
                 try:
                     result, log_text = future.result()
                     print_block(log_text)
@@ -425,6 +779,17 @@ def process_address_file(
         finally:
             flush_cache()
 
+    for idx in shared_idxs:
+        team = teams[idx]
+        if _is_cache_hit(_cache_get(normalize_address(team["address"]))):
+            result, log_text = process_team(team, api_retries)
+        else:
+            result = dict(team)  # type: ignore
+            result["error"] = "geocoding_failed"  # type: ignore
+            log_text = f"  Geocoding: {team["name"]}\n    ✗ Geocoding failed (address already tried this run)"
+        print_block(log_text)
+        team_results[idx] = result
+
     geocoded_teams: list[GeocodedTeam] = [r for r in team_results if r]
 
     # Count successes
@@ -520,31 +885,59 @@ def main() -> None:
 
     print(f"Found {len(address_files)} address files to process")
 
-    for address_file in address_files:
+    # Resolve every distinct address up front so shared grounds cost one request per run
+    pending_files = [
+        f
+        for f in address_files
+        if args.force or not geocoded_output_path(f, address_dir, season).exists()
+    ]
+
+    # One pool for the whole run: the cross-league prefetch and every league share its
+    # threads (and their keep-alive sessions) rather than spinning up a pool per file
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as executor:
         try:
-            process_address_file(
-                address_file,
-                address_dir,
-                season,
+            failed_addresses = prefetch_addresses(
+                pending_files,
                 max_workers=args.workers,
                 api_retries=args.api_retries,
-                force=args.force,
+                executor=executor,
             )
         except KeyboardInterrupt:
             print("\n\n✗ Interrupted by user")
             print("Saving cache and exiting...")
             flush_cache(force=True)
             raise
-        except Exception as e:
-            print(f"\n✗ Error processing {address_file.name}: {e}")
-            import traceback
 
-            traceback.print_exc()
-            flush_cache(force=True)
+        for address_file in address_files:
+            try:
+                process_address_file(
+                    address_file,
+                    address_dir,
+                    season,
+                    max_workers=args.workers,
+                    api_retries=args.api_retries,
+                    force=args.force,
+                    failed_addresses=failed_addresses,
+                    executor=executor,
+                )
+            except KeyboardInterrupt:
+                print("\n\n✗ Interrupted by user")
+                print("Saving cache and exiting...")
+                flush_cache(force=True)
+                raise
+            except Exception as e:
+                print(f"\n✗ Error processing {address_file.name}: {e}")
+                import traceback
+
+                traceback.print_exc()
+                flush_cache(force=True)
+
+    # Fold the per-league journal appends back into the single cache file
+    flush_cache(force=True)
 
     print(f"{"="*80}")
     print('Complete! Geocoded data saved to "geocoded_teams" directory')
-    print(f"Address cache size: {len(geocode_cache)}")
+    print(f"Address cache size: {cache_size()}")
     print(f"{"="*80}")
 
     if teams_without_geocodes:
@@ -20,21 +20,26 @@ from core import (
     get_google_analytics_script,
     get_service_worker_registration_script,
     get_twitter_card_meta,
+    json_load_all,
     json_load_cache,
     set_config,
     setup_logging,
     team_name_to_filepath,
 )
-from core.config import BOUNDARIES_DIR, DIST_DIR
+from core.config import BOUNDARIES_DIR, CACHE_DIR, DIST_DIR
 from core.map_builder import (
     MapConfig,
     MarkerItem,
+    SingleGroupMapJob,
     TerritoryCache,
     export_shared_boundaries,
     generate_multi_group_map,
     generate_single_group_map,
+    generate_single_group_maps,
     load_itl_hierarchy,
+    load_territory_cache,
     preassign_itl_regions,
+    save_territory_cache,
 )
 from rugby import BRAND, DATA_DIR, short_season
 from rugby.distance_lookup import DistanceLookup
@@ -402,7 +407,7 @@ def _load_marker_items(
 
     subsume_lancs = lancashire_merit_geocoded_nonempty(geocoded_path)
 
-    result = LoadedItems()
+    filepaths: list[Path] = []
     for filepath in geocoded_path.rglob("*.json"):
         rel_parts_early = filepath.relative_to(geocoded_path).parts
         is_root_pyramid = len(rel_parts_early) == 1
@@ -412,12 +417,16 @@ def _load_marker_items(
             and pyramid_json_stem_supplanted_by_lancashire_county_merit(filepath.stem)
         ):
             continue
+        filepaths.append(filepath)
+
+    # Items are still built below in scan order
+    league_data = json_load_all(filepaths)
 
+    result = LoadedItems()
+    for filepath, data in zip(filepaths, league_data, strict=True):
         rel_path = filepath.relative_to(geocoded_path).as_posix()
         tier_num, tier_name = extract_tier(rel_path, season)
 
-        data = json_load_cache(str(filepath))
-
         league_name = data.get("league_name", "Unknown League")
         rel_parts = list(filepath.relative_to(geocoded_path).parts)
         is_merit = len(rel_parts) >= 3 and rel_parts[0] == "merit"
@@ -587,6 +596,7 @@ def _build_config(
         tier_floor_level=tier_floor_level if tier_floor_level is not None else TIER_FLOOR_LEVELS,
         default_tier_floor_level="itl3",
         use_inline_boundaries=not is_prod,
+        territory_files=is_prod,
         shared_boundaries_path=shared_path,
         fallback_icon_url=RFU_FALLBACK_ICON,
         color_palette=palette or COLOR_PALETTE,
@@ -673,6 +683,12 @@ def main() -> None:
     parser.add_argument(
         "--production", action="store_true", help="Change folder structure for production"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for per-tier maps (default: CPU count; 1 runs in-process)",
+    )
     parser.add_argument(
         "--emit-shared-boundaries-only",
         action="store_true",
@@ -795,7 +811,10 @@ def main() -> None:
     is_prod = get_config().is_production
     mens_header_tier_links = _tier_sibling_links(mens_tier_order_for_header, is_prod)
     womens_header_tier_links = _tier_sibling_links(womens_tier_order_for_header, is_prod)
-    territory_cache: TerritoryCache = {}
+    # Territories only change when a tier's teams, their locations or the boundaries do,
+    # so re-runs for the same season reuse the previous run's GEOS work.
+    territory_cache_file = CACHE_DIR / f"territories_{season}.pkl"
+    territory_cache: TerritoryCache = load_territory_cache(BOUNDARY_PATHS, territory_cache_file)
 
     logger.debug("Exporting shared boundary data...")
     export_shared_boundaries(
@@ -821,6 +840,9 @@ def main() -> None:
     # ------------------------------------------------------------------
     # Individual pyramid tier maps (+ optional pyramid+merit variants)
     # ------------------------------------------------------------------
+    # Per-tier maps are independent of each other, so they are collected and generated
+    # together across worker processes before the combined maps that reuse their territories.
+    tier_map_jobs: list[SingleGroupMapJob] = []
     if gen_mens_individual:
         mens_by_tier_r, mens_tier_order_r = _group_by_tier(mens_pyramid_r)
 
@@ -839,7 +861,7 @@ def main() -> None:
                     current_tier=tier_name,
                     output_file=out,
                 )
-                generate_single_group_map(tier_items, out, itl_hierarchy, config, territory_cache)
+                tier_map_jobs.append((tier_items, out, config))
 
                 # Pyramid + merit at same level
                 merit_at_level = merit_by_tier_num.get(tier_num, [])
@@ -854,7 +876,7 @@ def main() -> None:
                         _rotated_palette(tier_num),
                         output_file=out,
                     )
-                    generate_single_group_map(combined, out, itl_hierarchy, config, territory_cache)
+                    tier_map_jobs.append((combined, out, config))
 
         # Merit-only tiers (no men's pyramid at this absolute tier number)
         pyramid_tier_nums = (
@@ -879,7 +901,7 @@ def main() -> None:
                     _rotated_palette(tier_num),
                     output_file=out,
                 )
-                generate_single_group_map(merit_items, out, itl_hierarchy, config, territory_cache)
+                tier_map_jobs.append((merit_items, out, config))
 
     if gen_womens_individual and womens_by_tier:
         logger.info("Creating women's pyramid tier maps...")
@@ -897,7 +919,11 @@ def main() -> None:
                 current_tier=tier_name,
                 output_file=out,
             )
-            generate_single_group_map(tier_items, out, itl_hierarchy, config, territory_cache)
+            tier_map_jobs.append((tier_items, out, config))
+
+    generate_single_group_maps(
+        tier_map_jobs, itl_hierarchy, BOUNDARY_PATHS, territory_cache, max_workers=args.workers
+    )
 
     # ------------------------------------------------------------------
     # Pyramid-only all-tiers maps
@@ -1000,6 +1026,7 @@ def main() -> None:
                 )
                 generate_single_group_map(tier_items, out, itl_hierarchy, config, territory_cache)
 
+    save_territory_cache(territory_cache, BOUNDARY_PATHS, territory_cache_file)
     logger.info("All maps created successfully in %s", output_dir)
 
 
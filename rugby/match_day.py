@@ -45,7 +45,12 @@ from core import (
 )
 from core.basemap_tiles import CARTO_TILE_URL_LIGHT, folium_carto_attribution
 from core.config import DIST_DIR
-from core.map_builder import DARK_MODE_JS, POPUP_CSS, LayerControlHook
+from core.map_builder import (
+    DARK_MODE_JS,
+    POPUP_CSS,
+    LayerControlHook,
+    shared_boundaries_fetch_js,
+)
 from rugby import BRAND, DATA_DIR, short_season
 from rugby.seo import BASE_URL, OG_DEFAULT_IMAGE, breadcrumb_ld_script, og_image_meta_html
 from rugby.tiers import (
@@ -1126,7 +1131,7 @@ def build_match_day_map(
             if (!el || !el._leaflet_id) {{ setTimeout(addBoundaries, 100); return; }}
             var map = window[Object.keys(window).find(k => k.startsWith('map_') && window[k] instanceof L.Map)];
             if (!map) {{ setTimeout(addBoundaries, 100); return; }}
-            fetch('{shared_path}/boundaries.json').then(r => r.json()).then(bd => {{
+            {shared_boundaries_fetch_js(shared_path)}.then(bd => {{
                 {boundary_load_body}
             }}).catch(e => console.warn('Could not load boundaries:', e));
         }}
@@ -7,6 +7,7 @@ Merit competitions return **local** tier numbers (1-based within the competition
 Use :func:`get_competition_offset` to translate back to absolute pyramid positions.
 """
 
+import functools
 import logging
 from pathlib import Path
 
@@ -458,65 +459,86 @@ def _lookup_east_midlands_tier(path: str, season: str) -> tuple[int, str] | None
     return None
 
 
-_NAMED_MERIT_LEAGUES: dict[str, int] = {
-    # Values are **local** tiers (absolute minus competition offset).
-    # East Midlands merit leagues are handled by _EAST_MIDLANDS_TIERS (per-season
-    # tables derived from shared-club analysis) — see _lookup_east_midlands_tier.
-    # NOWIRUL (offset 8): Premier (1) > Championship/Conference A (2) >
-    # Conference B (3); generic Divisions use zeroth_tier_map offset 2
-    "merit/NOWIRUL/Cotton_Traders_Premier": 1,
-    "merit/NOWIRUL/NOWIRUL_Cotton_Traders_Premier": 1,
-    "merit/NOWIRUL/NOWIRUL_COTTON_TRADERS_PREMIER": 1,
-    "merit/NOWIRUL/Bateman_BMW_Premier": 1,
-    "merit/NOWIRUL/NOWIRUL_BATHTIME_PREMIER": 1,
-    "merit/NOWIRUL/Cotton_Traders_Championship": 2,
-    "merit/NOWIRUL/NOWIRUL_Cotton_Traders_Championship": 2,
-    "merit/NOWIRUL/Cotton_Traders_Conference_A": 2,
-    "merit/NOWIRUL/Cotton_Traders_Conference_B": 3,
-    # Hampshire (offset 5): Senior Merit (5); Hampshire 2/3/4 sit directly
-    # below pyramid Hampshire 1 (abs 10), not at offset+number.
-    "merit/Hampshire/Hampshire_Senior": 5,
-    "merit/Hampshire/Hampshire_2": 6,
-    "merit/Hampshire/Hampshire_3": 7,
-    "merit/Hampshire/Hampshire_4": 8,
-    # Leicestershire (offset 8): Invitation Merit (2)
-    "merit/Leicestershire/Leicestershire_Invitation": 2,
-    # Surrey (offset 9): Premier (1) > Championship (2) > Alliance (3) >
-    # Conference (4) > Combination 1 (5) > Combination 2 (6) >
-    # Combination 3 / Foundation (7). 2009-2010 JONAP and 2010-2011..2012-2013 ``Surrey_*`` files
-    # use nine separate local bands; see _NAMED_MERIT_LEAGUES_SURREY_2009_2010 and
-    # _NAMED_MERIT_LEAGUES_SURREY_PREMIER_NINE_RUNG.
-    "merit/Surrey/Surrey_Premier": 1,
-    "merit/Surrey/Surrey_Chamionship": 2,
-    "merit/Surrey/Surrey_Championship": 2,
-    "merit/Surrey/Surrey_Alliance": 3,
-    "merit/Surrey/Surrey_East_Conference": 4,
-    "merit/Surrey/Surrey_West_Conference": 4,
-    "merit/Surrey/Surrey_Conference": 4,
-    "merit/Surrey/Surrey_Combination_1": 5,
-    "merit/Surrey/Surrey_Combination_2": 6,
-    "merit/Surrey/Surrey_Combination_3": 7,
-    "merit/Surrey/Surrey_Foundation": 7,
-    "merit/Surrey/Surrey_JONAP_Premier": 1,
-    "merit/Surrey/Surrey_JONAP_Alliance": 3,
-    "merit/Surrey/Surrey_JONAP_Conference": 4,
-    "merit/Surrey/Surrey_JONAP_Combination_1": 5,
-    "merit/Surrey/Surrey_JONAP_Combination_2": 6,
-    "merit/Surrey/Surrey_JONAP_Combination_3": 7,
-    "merit/Surrey/Surrey_JONAP_Foundation": 7,
-    "merit/Surrey/London_Counties": 1,
-    "merit/Surrey/London_1_South": 1,
-    # Herts & Middlesex (offset 9): numbered North/South divisions sit directly
-    # below Championship (local 1), one tier above the unnumbered variants.
-    "merit/Herts_Middlesex/Merit_North_1": 2,
-    "merit/Herts_Middlesex/Merit_North_2": 3,
-    "merit/Herts_Middlesex/Merit_South_1": 2,
-    # Midlands Reserve: some seasons use ``North_-_West_…`` / ``South_-_West_…`` filenames without
-    # ``Div_N``; :func:`get_number_from_tier_name` would yield 0 → local tier 0, and merit SVGs
-    # only draw bands ``range(1, max+1)``, so those leagues vanished from diagrams.
-    "merit/Midlands_Reserve/North": 1,
-    "merit/Midlands_Reserve/South": 1,
-}
+class _PrefixTable(dict[str, int]):
+    """Map of filename prefixes, looked up by the longest prefix of a name.
+
+    One dict probe per distinct prefix length replaces a ``startswith`` scan over
+    every entry. Where one prefix extends another, the longer one is the more
+    specific league, so this is the same match the ordered scans used to find.
+    """
+
+    def __init__(self, entries: dict[str, int]) -> None:
+        super().__init__(entries)
+        self._lengths = sorted({len(prefix) for prefix in self}, reverse=True)
+
+    def longest_prefix(self, name: str) -> str | None:
+        for length in self._lengths:
+            if name[:length] in self:
+                return name[:length]
+        return None
+
+
+_NAMED_MERIT_LEAGUES = _PrefixTable(
+    {
+        # Values are **local** tiers (absolute minus competition offset).
+        # East Midlands merit leagues are handled by _EAST_MIDLANDS_TIERS (per-season
+        # tables derived from shared-club analysis) — see _lookup_east_midlands_tier.
+        # NOWIRUL (offset 8): Premier (1) > Championship/Conference A (2) >
+        # Conference B (3); generic Divisions use zeroth_tier_map offset 2
+        "merit/NOWIRUL/Cotton_Traders_Premier": 1,
+        "merit/NOWIRUL/NOWIRUL_Cotton_Traders_Premier": 1,
+        "merit/NOWIRUL/NOWIRUL_COTTON_TRADERS_PREMIER": 1,
+        "merit/NOWIRUL/Bateman_BMW_Premier": 1,
+        "merit/NOWIRUL/NOWIRUL_BATHTIME_PREMIER": 1,
+        "merit/NOWIRUL/Cotton_Traders_Championship": 2,
+        "merit/NOWIRUL/NOWIRUL_Cotton_Traders_Championship": 2,
+        "merit/NOWIRUL/Cotton_Traders_Conference_A": 2,
+        "merit/NOWIRUL/Cotton_Traders_Conference_B": 3,
+        # Hampshire (offset 5): Senior Merit (5); Hampshire 2/3/4 sit directly
+        # below pyramid Hampshire 1 (abs 10), not at offset+number.
+        "merit/Hampshire/Hampshire_Senior": 5,
+        "merit/Hampshire/Hampshire_2": 6,
+        "merit/Hampshire/Hampshire_3": 7,
+        "merit/Hampshire/Hampshire_4": 8,
+        # Leicestershire (offset 8): Invitation Merit (2)
+        "merit/Leicestershire/Leicestershire_Invitation": 2,
+        # Surrey (offset 9): Premier (1) > Championship (2) > Alliance (3) >
+        # Conference (4) > Combination 1 (5) > Combination 2 (6) >
+        # Combination 3 / Foundation (7). 2009-2010 JONAP and 2010-2011..2012-2013 ``Surrey_*`` files
+        # use nine separate local bands; see _NAMED_MERIT_LEAGUES_SURREY_2009_2010 and
+        # _NAMED_MERIT_LEAGUES_SURREY_PREMIER_NINE_RUNG.
+        "merit/Surrey/Surrey_Premier": 1,
+        "merit/Surrey/Surrey_Chamionship": 2,
+        "merit/Surrey/Surrey_Championship": 2,
+        "merit/Surrey/Surrey_Alliance": 3,
+        "merit/Surrey/Surrey_East_Conference": 4,
+        "merit/Surrey/Surrey_West_Conference": 4,
+        "merit/Surrey/Surrey_Conference": 4,
+        "merit/Surrey/Surrey_Combination_1": 5,
+        "merit/Surrey/Surrey_Combination_2": 6,
+        "merit/Surrey/Surrey_Combination_3": 7,
+        "merit/Surrey/Surrey_Foundation": 7,
+        "merit/Surrey/Surrey_JONAP_Premier": 1,
+        "merit/Surrey/Surrey_JONAP_Alliance": 3,
+        "merit/Surrey/Surrey_JONAP_Conference": 4,
+        "merit/Surrey/Surrey_JONAP_Combination_1": 5,
+        "merit/Surrey/Surrey_JONAP_Combination_2": 6,
+        "merit/Surrey/Surrey_JONAP_Combination_3": 7,
+        "merit/Surrey/Surrey_JONAP_Foundation": 7,
+        "merit/Surrey/London_Counties": 1,
+        "merit/Surrey/London_1_South": 1,
+        # Herts & Middlesex (offset 9): numbered North/South divisions sit directly
+        # below Championship (local 1), one tier above the unnumbered variants.
+        "merit/Herts_Middlesex/Merit_North_1": 2,
+        "merit/Herts_Middlesex/Merit_North_2": 3,
+        "merit/Herts_Middlesex/Merit_South_1": 2,
+        # Midlands Reserve: some seasons use ``North_-_West_…`` / ``South_-_West_…`` filenames without
+        # ``Div_N``; :func:`get_number_from_tier_name` would yield 0 → local tier 0, and merit SVGs
+        # only draw bands ``range(1, max+1)``, so those leagues vanished from diagrams.
+        "merit/Midlands_Reserve/North": 1,
+        "merit/Midlands_Reserve/South": 1,
+    }
+)
 
 # 2009-2010 only: JONAP ladder uses separate local tiers for each Conference and
 # Combination band, with Foundation below Combination 3 (see ``tier_mappings/2009-2010.json``).
@@ -670,14 +692,14 @@ def _match_named_merit_leagues(path: str, season: str) -> tuple[int, str] | None
             stem = f"merit/Hampshire/{suffix}"
             if path.startswith(stem) and (len(path) == len(stem) or path[len(stem)] in "./"):
                 return (local_tier, f"Level {local_tier}")
-    for prefix, local_tier in sorted(
-        _NAMED_MERIT_LEAGUES.items(), key=lambda kv: len(kv[0]), reverse=True
-    ):
-        if path.startswith(prefix):
-            return (local_tier, f"Level {local_tier}")
+    prefix = _NAMED_MERIT_LEAGUES.longest_prefix(path)
+    if prefix is not None:
+        local_tier = _NAMED_MERIT_LEAGUES[prefix]
+        return (local_tier, f"Level {local_tier}")
     return None
 
 
+@functools.lru_cache(maxsize=8192)
 def extract_tier(path_or_filename: str, season: str = "2025-2026") -> tuple[int, str]:
     """Extract tier from a league path or filename.
 
@@ -688,6 +710,10 @@ def extract_tier(path_or_filename: str, season: str = "2025-2026") -> tuple[int,
 
     For merit paths, the returned tier number is **local** to the competition
     (1-based) and the name is competition-qualified (e.g. ``"Essex 2"``).
+
+    Results are memoized: the same league files are resolved once per season by maps,
+    team pages, pyramids and distances alike. The season-dependent prefix tables are
+    themselves built once per season and answer longest-prefix lookups directly.
     """
     normalized = path_or_filename.replace("\\", "/")
     filename = normalized.split("/")[-1]
@@ -806,14 +832,68 @@ def _league_title_sponsor_phrases_longest_first() -> tuple[str, ...]:
 LEAGUE_TITLE_SPONSOR_PHRASES = _league_title_sponsor_phrases_longest_first()
 
 
+_SPONSOR_PREFIX_TUPLE = tuple(_SPONSOR_PREFIXES)
+
+
 def _strip_sponsor_prefix(filename: str) -> str:
     """Remove known sponsor prefixes from league filenames."""
+    if not filename.startswith(_SPONSOR_PREFIX_TUPLE):
+        return filename
     for prefix in _SPONSOR_PREFIXES:
         if filename.startswith(prefix):
             filename = filename.removeprefix(prefix)
     return filename
 
 
+@functools.cache
+def _men_current_offsets(season: str) -> _PrefixTable:
+    """Zeroth-tier offsets for :func:`extract_tier_men_current`, built once per season."""
+    return _PrefixTable(
+        {
+            "National_League": 2,
+            "Regional": 4,
+            "Cumbria_Conference": 7,
+            "Counties": 6,
+            # Merit entries: values are local offsets (absolute - COMPETITION_OFFSETS)
+            "merit/East_Midlands/East_Midlands": 0,
+            "merit/Hampshire/Counties": 0,
+            "merit/Herts_Middlesex/Merit_Championship": 1,
+            "merit/Herts_Middlesex/Merit_North": 2,
+            "merit/Herts_Middlesex/Merit_South": 2,
+            "merit/Sussex/Counties": 0,
+            "merit/CANDY": 0,
+            "merit/Devon": (1 if season >= "2025-2026" else 0),
+            "merit/East_Midlands": 1,
+            "merit/Eastern_Counties": 0,
+            # Essex 2022-2023 renamed Division_1 to Premier_Division (no Division_1 that
+            # season). Specific prefix gives "Premier_Division" → 1+0=1 so it slots into
+            # the merit pyramid as local tier 1 instead of tier 0 (which created a gap).
+            "merit/Essex/Premier": 1,
+            "merit/Essex": 0,
+            "merit/GRFU_District": 0,
+            "merit/Hampshire/Solent": 5,
+            "merit/Hampshire": 6,
+            "merit/Herts_Middlesex": 0,
+            "merit/Leicestershire": 0,
+            "merit/Middlesex": 1,
+            "merit/Midlands_Reserve": 0,
+            "merit/Lancashire/Premier": 1,
+            # Lancashire merit always uses offset 1: it never has a Championship-style
+            # second-named tier above the divisions (unlike NOWIRUL 2017-2020), so the
+            # Premier league is local 1 directly. Without this, ADM_Premier_Division
+            # in 2018-2020 was misplaced at local 2, leaving a gap at local 1.
+            "merit/Lancashire": 1,
+            "merit/NOWIRUL/Premier": 1,
+            "merit/NOWIRUL": (2 if "2016-2017" <= season <= "2019-2020" else 1),
+            "merit/Nottinghamshire": 0,
+            "merit/Rural_Kent": 0,
+            "merit/Surrey": 1,
+            "merit/Sussex": 3,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_tier_men_current(filename: str, season: str) -> tuple[int, str] | None:
     """Extract tier from 2022-2023 onwards filename format."""
     if filename == "Premiership.json":
@@ -823,73 +903,137 @@ def extract_tier_men_current(filename: str, season: str) -> tuple[int, str] | No
 
     cleaned = _strip_sponsor_prefix(filename)
 
-    zeroth_tier_map = {
-        "National_League": 2,
-        "Regional": 4,
-        "Cumbria_Conference": 7,
-        "Counties": 6,
-        # Merit entries: values are local offsets (absolute - COMPETITION_OFFSETS)
-        "merit/East_Midlands/East_Midlands": 0,
-        "merit/Hampshire/Counties": 0,
-        "merit/Herts_Middlesex/Merit_Championship": 1,
-        "merit/Herts_Middlesex/Merit_North": 2,
-        "merit/Herts_Middlesex/Merit_South": 2,
-        "merit/Sussex/Counties": 0,
-        "merit/CANDY": 0,
-        "merit/Devon": (1 if season >= "2025-2026" else 0),
-        "merit/East_Midlands": 1,
-        "merit/Eastern_Counties": 0,
-        # Essex 2022-2023 renamed Division_1 to Premier_Division (no Division_1 that
-        # season). Specific prefix gives "Premier_Division" → 1+0=1 so it slots into
-        # the merit pyramid as local tier 1 instead of tier 0 (which created a gap).
-        "merit/Essex/Premier": 1,
-        "merit/Essex": 0,
-        "merit/GRFU_District": 0,
-        "merit/Hampshire/Solent": 5,
-        "merit/Hampshire": 6,
-        "merit/Herts_Middlesex": 0,
-        "merit/Leicestershire": 0,
-        "merit/Middlesex": 1,
-        "merit/Midlands_Reserve": 0,
-        "merit/Lancashire/Premier": 1,
-        # Lancashire merit always uses offset 1: it never has a Championship-style
-        # second-named tier above the divisions (unlike NOWIRUL 2017-2020), so the
-        # Premier league is local 1 directly. Without this, ADM_Premier_Division
-        # in 2018-2020 was misplaced at local 2, leaving a gap at local 1.
-        "merit/Lancashire": 1,
-        "merit/NOWIRUL/Premier": 1,
-        "merit/NOWIRUL": (2 if "2016-2017" <= season <= "2019-2020" else 1),
-        "merit/Nottinghamshire": 0,
-        "merit/Rural_Kent": 0,
-        "merit/Surrey": 1,
-        "merit/Sussex": 3,
-    }
-    for prefix, offset in zeroth_tier_map.items():
-        if cleaned.startswith(prefix):
-            num = get_number_from_tier_name(cleaned, prefix)
-            tier = offset + num
-            return (tier, mens_current_tier_name(tier))
+    zeroth_tier_map = _men_current_offsets(season)
+    prefix = zeroth_tier_map.longest_prefix(cleaned)
+    if prefix is not None:
+        num = get_number_from_tier_name(cleaned, prefix)
+        tier = zeroth_tier_map[prefix] + num
+        return (tier, mens_current_tier_name(tier))
 
     return None
 
 
+_WOMEN_CURRENT_OFFSETS = _PrefixTable(
+    {
+        "Women's_Championship": 101,
+        "Women's_NC": 103,
+    }
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_tier_women_current(filename: str, season: str) -> tuple[int, str] | None:
     """Extract tier from 2019-2020 onwards filename format."""
     if filename.startswith("Women's_Premiership"):
         return (101, "Premiership Women's")
 
-    zeroth_tier_map = {
-        "Women's_Championship": 101,
-        "Women's_NC": 103,
-    }
-    for prefix, offset in zeroth_tier_map.items():
-        if filename.startswith(prefix):
-            num = get_number_from_tier_name(filename, prefix)
-            tier = offset + num
-            return (tier, womens_current_tier_name(tier))
+    prefix = _WOMEN_CURRENT_OFFSETS.longest_prefix(filename)
+    if prefix is not None:
+        num = get_number_from_tier_name(filename, prefix)
+        tier = _WOMEN_CURRENT_OFFSETS[prefix] + num
+        return (tier, womens_current_tier_name(tier))
     return None
 
 
+@functools.cache
+def _men_pre_2021_offsets(season: str) -> _PrefixTable:
+    """Zeroth-tier offsets for :func:`extract_tier_men_pre_2021`, built once per season."""
+    pre_champ = season < "2009-2010"
+    return _PrefixTable(
+        {
+            "National_League": (1 if pre_champ else 2),
+            "North_Midlands": 8,
+            "North_Mids": 8,
+            "North_Lancs_Cumbria": 7,
+            "North_Lancashire": 7,
+            "North_Lancs": 7,
+            "North": 5,
+            "Midlands_East_(South)_A": 11,
+            "Midlands_East_(South)_B": 11,
+            "Midlands_East_(North)_A": 11,
+            "Midlands_East_(North)_B": 11,
+            "Midlands": 5,
+            "London": 5,
+            "South_West_Pilot": 6,
+            "South_West": 5,
+            "Cumbria": (6 if season >= "2018-2019" else 8),
+            "Durham_Northumberland": 6,
+            "Durham_N'thm'land": 6,
+            "Essex": 8,
+            "Eastern_Counties": 8,
+            "Hampshire": (9 if season >= "2018-2019" else 8),
+            "Sussex": 8,
+            "Herts_Middlesex": 8,
+            "Kent": 8,
+            "Surrey": 8,
+            "Berks_Bucks_&_Oxon": 8,
+            "Cornwall_Devon": 8,
+            "Cornwall": 8,
+            "Devon": 8,
+            "Dorset_&_Wilts": 7,
+            "Dorset": 7,
+            "Gloucester": 8,
+            "Somerset": 8,
+            "Southern_Counties": 7,
+            "Western_Counties": 7,
+            "Yorkshire": 6,
+            # Same regional band as South_Lancs_Cheshire; the >=2018 bump was off by one for 2018-2019.
+            "Lancs_Cheshire": (6 if season <= "2018-2019" else 7),
+            "South_Lancs_Cheshire": 6,
+            "Lancashire_(North)": 8,
+            "Cheshire": 8,
+            "Merseyside": 8,
+            "NC_Lancashire": 8,
+            "NC_Midlands": 8,
+            "Staffordshire": 8,
+            "Warwickshire": 8,
+            "NLD_Leics": 8,
+            # One level below other offset-8 county leagues (tier 9 base, not 8).
+            "NLD_N_Leics": 9,
+            "Derbys_N_Leics": 9,
+            "East_Mids_S_Leics": 8,
+            "East_Midlands": 8,
+            "Notts_Lincs": 9,
+            "East_Counties": 8,
+            # Merit entries: values are local offsets (absolute - COMPETITION_OFFSETS)
+            "merit/East_Midlands/East_Midlands": 0,
+            "merit/Hampshire/Counties": 0,
+            "merit/Herts_Middlesex/Merit_Championship": 1,
+            "merit/Herts_Middlesex/Merit_North": 2,
+            "merit/Herts_Middlesex/Merit_South": 2,
+            "merit/Sussex/Counties": 0,
+            "merit/CANDY": 0,
+            "merit/Devon": 0,
+            "merit/East_Midlands": 1,
+            "merit/Eastern_Counties": 0,
+            "merit/Essex": 0,
+            "merit/GRFU_District": 0,
+            "merit/Hampshire/Solent": 5,
+            "merit/Hampshire": (5 if season < "2014-2015" else 6),
+            "merit/Herts_Middlesex": 0,
+            "merit/Leicestershire": (1 if season < "2015-2016" else 0),
+            "merit/Middlesex": 0,
+            "merit/Midlands_Reserve": 0,
+            "merit/Lancashire/Premier": 1,
+            # Lancashire merit always uses offset 1: it never has a Championship-style
+            # second-named tier above the divisions (unlike NOWIRUL 2017-2020), so the
+            # Premier league is local 1 directly.
+            "merit/Lancashire": 1,
+            "merit/NOWIRUL/Premier": 1,
+            "merit/NOWIRUL": (2 if "2016-2017" <= season <= "2019-2020" else 1),
+            "merit/Nottinghamshire": 0,
+            # Rural Kent 2013-2018 has a single "Premier 2 East" file at the top of the merit
+            # pyramid; the `_2_` is the tier number, so a specific prefix forces num extraction
+            # past "Premier" (which would otherwise return 0).
+            "merit/Rural_Kent/Premier": 0,
+            "merit/Rural_Kent": 0,
+            "merit/Surrey": 1,
+            "merit/Sussex": 3,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_tier_men_pre_2021(filename: str, season: str) -> tuple[int, str] | None:
     """Extract tier from 2021-2022 and earlier filename format."""
     filename = _strip_sponsor_prefix(filename)
@@ -898,127 +1042,35 @@ def extract_tier_men_pre_2021(filename: str, season: str) -> tuple[int, str] | N
 
     pre_champ = season < "2009-2010"
 
-    zeroth_tier_map = {
-        "National_League": (1 if pre_champ else 2),
-        "North_Midlands": 8,
-        "North_Mids": 8,
-        "North_Lancs_Cumbria": 7,
-        "North_Lancashire": 7,
-        "North_Lancs": 7,
-        "North": 5,
-        "Midlands_East_(South)_A": 11,
-        "Midlands_East_(South)_B": 11,
-        "Midlands_East_(North)_A": 11,
-        "Midlands_East_(North)_B": 11,
-        "Midlands": 5,
-        "London": 5,
-        "South_West_Pilot": 6,
-        "South_West": 5,
-        "Cumbria": (6 if season >= "2018-2019" else 8),
-        "Durham_Northumberland": 6,
-        "Durham_N'thm'land": 6,
-        "Essex": 8,
-        "Eastern_Counties": 8,
-        "Hampshire": (9 if season >= "2018-2019" else 8),
-        "Sussex": 8,
-        "Herts_Middlesex": 8,
-        "Kent": 8,
-        "Surrey": 8,
-        "Berks_Bucks_&_Oxon": 8,
-        "Cornwall_Devon": 8,
-        "Cornwall": 8,
-        "Devon": 8,
-        "Dorset_&_Wilts": 7,
-        "Dorset": 7,
-        "Gloucester": 8,
-        "Somerset": 8,
-        "Southern_Counties": 7,
-        "Western_Counties": 7,
-        "Yorkshire": 6,
-        # Same regional band as South_Lancs_Cheshire; the >=2018 bump was off by one for 2018-2019.
-        "Lancs_Cheshire": (6 if season <= "2018-2019" else 7),
-        "South_Lancs_Cheshire": 6,
-        "Lancashire_(North)": 8,
-        "Cheshire": 8,
-        "Merseyside": 8,
-        "NC_Lancashire": 8,
-        "NC_Midlands": 8,
-        "Staffordshire": 8,
-        "Warwickshire": 8,
-        "NLD_Leics": 8,
-        # One level below other offset-8 county leagues (tier 9 base, not 8).
-        "NLD_N_Leics": 9,
-        "Derbys_N_Leics": 9,
-        "East_Mids_S_Leics": 8,
-        "East_Midlands": 8,
-        "Notts_Lincs": 9,
-        "East_Counties": 8,
-        # Merit entries: values are local offsets (absolute - COMPETITION_OFFSETS)
-        "merit/East_Midlands/East_Midlands": 0,
-        "merit/Hampshire/Counties": 0,
-        "merit/Herts_Middlesex/Merit_Championship": 1,
-        "merit/Herts_Middlesex/Merit_North": 2,
-        "merit/Herts_Middlesex/Merit_South": 2,
-        "merit/Sussex/Counties": 0,
-        "merit/CANDY": 0,
-        "merit/Devon": 0,
-        "merit/East_Midlands": 1,
-        "merit/Eastern_Counties": 0,
-        "merit/Essex": 0,
-        "merit/GRFU_District": 0,
-        "merit/Hampshire/Solent": 5,
-        "merit/Hampshire": (5 if season < "2014-2015" else 6),
-        "merit/Herts_Middlesex": 0,
-        "merit/Leicestershire": (1 if season < "2015-2016" else 0),
-        "merit/Middlesex": 0,
-        "merit/Midlands_Reserve": 0,
-        "merit/Lancashire/Premier": 1,
-        # Lancashire merit always uses offset 1: it never has a Championship-style
-        # second-named tier above the divisions (unlike NOWIRUL 2017-2020), so the
-        # Premier league is local 1 directly.
-        "merit/Lancashire": 1,
-        "merit/NOWIRUL/Premier": 1,
-        "merit/NOWIRUL": (2 if "2016-2017" <= season <= "2019-2020" else 1),
-        "merit/Nottinghamshire": 0,
-        # Rural Kent 2013-2018 has a single "Premier 2 East" file at the top of the merit
-        # pyramid; the `_2_` is the tier number, so a specific prefix forces num extraction
-        # past "Premier" (which would otherwise return 0).
-        "merit/Rural_Kent/Premier": 0,
-        "merit/Rural_Kent": 0,
-        "merit/Surrey": 1,
-        "merit/Sussex": 3,
-    }
     if filename.startswith("Premiership"):
         return (1, "Premiership")
     if filename.startswith("Championship"):
         return (2, "Championship")
-    for prefix, offset in zeroth_tier_map.items():
-        if filename.startswith(prefix):
-            num = get_number_from_tier_name(filename, prefix)
-            if (
-                prefix == "Berks_Bucks_&_Oxon"
-                and season < "2004-2005"
-                and "Premier" not in filename
-            ):
-                num -= 1
-            tier = offset + num
-            main_pyramid_prefixes = {
-                "North",
-                "Midlands",
-                "London",
-                "South_West",
-                "South_West_Pilot",
-            }
-            if pre_champ and prefix in main_pyramid_prefixes:
-                tier -= 1
-            if prefix == "National_League":
-                # Filename league number is authoritative (NL3 stays NL3; never "Regional 1").
-                return (tier, f"National League {num}")
-            # Neutral map titles for pre-2022 eras (avoid anachronistic Regional/Counties wording).
-            return (tier, f"Level {tier}")
-    return None
+    zeroth_tier_map = _men_pre_2021_offsets(season)
+    prefix = zeroth_tier_map.longest_prefix(filename)
+    if prefix is None:
+        return None
+    num = get_number_from_tier_name(filename, prefix)
+    if prefix == "Berks_Bucks_&_Oxon" and season < "2004-2005" and "Premier" not in filename:
+        num -= 1
+    tier = zeroth_tier_map[prefix] + num
+    main_pyramid_prefixes = {
+        "North",
+        "Midlands",
+        "London",
+        "South_West",
+        "South_West_Pilot",
+    }
+    if pre_champ and prefix in main_pyramid_prefixes:
+        tier -= 1
+    if prefix == "National_League":
+        # Filename league number is authoritative (NL3 stays NL3; never "Regional 1").
+        return (tier, f"National League {num}")
+    # Neutral map titles for pre-2022 eras (avoid anachronistic Regional/Counties wording).
+    return (tier, f"Level {tier}")
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_tier_women_pre_2018(filename: str, season: str) -> tuple[int, str] | None:
     if season < "2012-2013":
         return extract_tier_women_pre_2012(filename, season)
@@ -1086,79 +1138,82 @@ def extract_tier_women_pre_2012(filename: str, season: str) -> tuple[int, str] |
     return extract_tier_women_pre_2018(filename, "2012-2013")
 
 
+_TIER_NUMBER_WORDS: dict[str, int] = {
+    "Prem": 0,
+    "Premier": 0,
+    "1": 1,
+    "One": 1,
+    "First": 1,
+    "A": 1,
+    "Championship": 1,
+    "2": 2,
+    "Two": 2,
+    "Second": 2,
+    "B": 2,
+    "3": 3,
+    "Three": 3,
+    "Third": 3,
+    "C": 3,
+    "4": 4,
+    "Four": 4,
+    "Fourth": 4,
+    "D": 4,
+    "5": 5,
+    "Five": 5,
+    "Fifth": 5,
+    "6": 6,
+    "Six": 6,
+    "Sixth": 6,
+    "7": 7,
+    "Seven": 7,
+    "Seventh": 7,
+    "8": 8,
+    "Eight": 8,
+    "9": 9,
+    "Nine": 9,
+    "D1": 1,
+    "D2": 2,
+    "D3": 3,
+    "D4": 4,
+    "D5": 5,
+    "1N": 1,
+    "1S": 1,
+    "2N": 2,
+    "2S": 2,
+    "2NE": 2,
+    "2SW": 2,
+    "3N": 3,
+    "3S": 3,
+    "3NE": 3,
+    "3SW": 3,
+    "4N": 4,
+    "4S": 4,
+    "4NE": 4,
+    "4SW": 4,
+    "5A": 5,
+    "5B": 5,
+    "5C": 5,
+    "5N": 5,
+    "5S": 5,
+    "5NE": 5,
+    "5SW": 5,
+    "6N": 6,
+    "6S": 6,
+    "6NE": 6,
+    "6SW": 6,
+    "7N": 7,
+    "7S": 7,
+    "7NE": 7,
+    "7SW": 7,
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def get_number_from_tier_name(filename: str, prefix: str) -> int:
     other_words = filename.removesuffix(".json")[len(prefix) :].lstrip("/_").split("_")
-    num_map = {
-        "Prem": 0,
-        "Premier": 0,
-        "1": 1,
-        "One": 1,
-        "First": 1,
-        "A": 1,
-        "Championship": 1,
-        "2": 2,
-        "Two": 2,
-        "Second": 2,
-        "B": 2,
-        "3": 3,
-        "Three": 3,
-        "Third": 3,
-        "C": 3,
-        "4": 4,
-        "Four": 4,
-        "Fourth": 4,
-        "D": 4,
-        "5": 5,
-        "Five": 5,
-        "Fifth": 5,
-        "6": 6,
-        "Six": 6,
-        "Sixth": 6,
-        "7": 7,
-        "Seven": 7,
-        "Seventh": 7,
-        "8": 8,
-        "Eight": 8,
-        "9": 9,
-        "Nine": 9,
-        "D1": 1,
-        "D2": 2,
-        "D3": 3,
-        "D4": 4,
-        "D5": 5,
-        "1N": 1,
-        "1S": 1,
-        "2N": 2,
-        "2S": 2,
-        "2NE": 2,
-        "2SW": 2,
-        "3N": 3,
-        "3S": 3,
-        "3NE": 3,
-        "3SW": 3,
-        "4N": 4,
-        "4S": 4,
-        "4NE": 4,
-        "4SW": 4,
-        "5A": 5,
-        "5B": 5,
-        "5C": 5,
-        "5N": 5,
-        "5S": 5,
-        "5NE": 5,
-        "5SW": 5,
-        "6N": 6,
-        "6S": 6,
-        "6NE": 6,
-        "6SW": 6,
-        "7N": 7,
-        "7S": 7,
-        "7NE": 7,
-        "7SW": 7,
-    }
     num = 0
     for part in other_words:
-        if part in num_map:
-            num = num_map[part]
+        if part in _TIER_NUMBER_WORDS:
+            num = _TIER_NUMBER_WORDS[part]
             break
     return num
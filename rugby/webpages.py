@@ -7,6 +7,7 @@ Creates:
 
 import argparse
 import json
+import os
 import re
 from html import escape
 from pathlib import Path
@@ -22,20 +23,27 @@ from core.config import DIST_DIR
 from rugby import BRAND, short_season
 from rugby.seo import BASE_URL, OG_DEFAULT_IMAGE, breadcrumb_ld_script, og_image_meta_html
 
+_SEASON_RE = re.compile(r"^\d{4}-\d{4}$")
+
+
+def discover_season_dirnames(dist_dir: Path) -> list[str]:
+    """Season slugs ``YYYY-YYYY`` that are directories directly under ``dist_dir``.
+
+    The name is matched before ``is_dir()`` so non-season entries never cost a stat;
+    ``os.scandir`` usually answers ``is_dir()`` from the cached dirent type.
+    """
+    with os.scandir(dist_dir) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if _SEASON_RE.match(entry.name) and entry.is_dir(follow_symlinks=False)
+        ]
+
 
 def discover_latest_season_dirname(dist_dir: Path) -> str:
     """Highest season slug ``YYYY-YYYY`` under dist (same heuristic as ``main()``)."""
-    seasons: list[str] = []
-    for item in dist_dir.iterdir():
-        if (
-            item.is_dir()
-            and not item.name.startswith(".")
-            and "-" in item.name
-            and len(item.name) == 9
-            and re.match(r"\d{4}-\d{4}", item.name)
-        ):
-            seasons.append(item.name)
-    return sorted(seasons, reverse=True)[0] if seasons else ""
+    seasons = discover_season_dirnames(dist_dir)
+    return max(seasons) if seasons else ""
 
 
 _HOME_PAGE_FAQ: tuple[dict[str, str | None], ...] = (
@@ -903,16 +911,7 @@ def main() -> None:
         return
 
     # Find all season directories
-    seasons = []
-    for item in dist_dir.iterdir():
-        # Check if it looks like a season (YYYY-YYYY format)
-        if (
-            item.is_dir()
-            and not item.name.startswith(".")
-            and "-" in item.name
-            and len(item.name) == 9
-        ):
-            seasons.append(item.name)
+    seasons = discover_season_dirnames(dist_dir)
 
     if not seasons:
         print(f"No season directories found in {dist_dir}")
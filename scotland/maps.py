@@ -16,14 +16,20 @@ import re
 from html import escape
 from pathlib import Path
 
-from core import setup_logging
-from core.config import BOUNDARIES_DIR, DIST_DIR
+from core import json_load_all, setup_logging
+from core.config import BOUNDARIES_DIR, CACHE_DIR, DIST_DIR
 from core.map_builder import (
     MapConfig,
     MarkerItem,
+    TerritoryCache,
     generate_multi_group_map,
     generate_single_group_map,
     load_itl_hierarchy,
+    load_territory_cache,
+    preassign_itl_regions,
+    save_territory_cache,
+    simplified_features,
+    write_shared_boundaries,
 )
 from scotland import DATA_DIR
 
@@ -119,7 +125,6 @@ def _export_scotland_boundaries(boundaries_path: Path) -> None:
         return
 
     from shapely.geometry import mapping, shape
-    from shapely.prepared import prep
 
     countries_file = Path(BOUNDARY_PATHS["countries"])
     if not countries_file.exists():
@@ -139,8 +144,6 @@ def _export_scotland_boundaries(boundaries_path: Path) -> None:
         logger.warning("Scotland feature not found in countries GeoJSON")
         return
 
-    scotland_prep = prep(scotland_geom)
-
     boundary_data: dict = {
         "countries": {},
         "itl_1": None,
@@ -172,17 +175,7 @@ def _export_scotland_boundaries(boundaries_path: Path) -> None:
         with open(gp, encoding="utf-8") as f:
             data = json.load(f)
 
-        scottish_feats = []
-        for feat in data["features"]:
-            geom = shape(feat["geometry"])
-            if scotland_prep.contains(geom.centroid):
-                scottish_feats.append(
-                    {
-                        "type": "Feature",
-                        "geometry": mapping(geom.simplify(0.001, preserve_topology=True)),
-                        "properties": feat.get("properties", {}),
-                    }
-                )
+        scottish_feats = simplified_features(data["features"], scotland_geom)
 
         if scottish_feats:
             boundary_data[level] = {
@@ -192,8 +185,7 @@ def _export_scotland_boundaries(boundaries_path: Path) -> None:
             logger.info("  %s: %d Scottish regions", level, len(scottish_feats))
 
     boundaries_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(boundaries_path, "w") as fout:
-        json.dump(boundary_data, fout, separators=(",", ":"))
+    write_shared_boundaries(boundary_data, boundaries_path)
     logger.info("Exported Scotland boundaries to %s", boundaries_path)
 
 
@@ -284,10 +276,7 @@ def _load_marker_items(geocoded_dir: Path) -> list[MarkerItem]:
 
     items: list[MarkerItem] = []
 
-    for filepath in geocoded_dir.rglob("*.json"):
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
-
+    for data in json_load_all(geocoded_dir.rglob("*.json")):
         league_name = data.get("league_name", "Unknown League")
         league_url = data.get("league_url", "")
         tier_num, tier_name = _classify_league(league_name)
@@ -403,6 +392,11 @@ def main() -> None:
     )
 
     itl_hierarchy = load_itl_hierarchy(BOUNDARY_PATHS)
+    # Locate every item once and share territories between the per-tier maps and the
+    # combined maps, which would otherwise recompute the same tiers from scratch.
+    preassign_itl_regions(items, itl_hierarchy)
+    territory_cache_file = CACHE_DIR / f"scotland_territories_{season}.pkl"
+    territory_cache: TerritoryCache = load_territory_cache(BOUNDARY_PATHS, territory_cache_file)
 
     output_dir = DIST_DIR / "scotland" / season
 
@@ -420,27 +414,28 @@ def main() -> None:
             file_name = tier_name.replace(" ", "_").replace("'", "")
             out = output_dir / f"{file_name}.html"
             config = _build_config(tier_name, season, _rotated_palette(tier_num))
-            generate_single_group_map(tier_items, out, itl_hierarchy, config)
+            generate_single_group_map(tier_items, out, itl_hierarchy, config, territory_cache)
 
     # --- Combined all-tiers maps ---
     if mens:
         logger.info("Creating men's all-tiers map...")
         out = output_dir / "All_Tiers_Mens.html"
         config = _build_config("All Tiers Men's", season)
-        generate_multi_group_map(mens, out, itl_hierarchy, config)
+        generate_multi_group_map(mens, out, itl_hierarchy, config, territory_cache)
 
     if womens:
         logger.info("Creating women's all-tiers map...")
         out = output_dir / "All_Tiers_Womens.html"
         config = _build_config("All Tiers Women's", season)
-        generate_multi_group_map(womens, out, itl_hierarchy, config)
+        generate_multi_group_map(womens, out, itl_hierarchy, config, territory_cache)
 
     # --- Grand combined map ---
     logger.info("Creating combined all-leagues map...")
     out = output_dir / "All_Leagues.html"
     config = _build_config("All Leagues", season)
-    generate_multi_group_map(items, out, itl_hierarchy, config)
+    generate_multi_group_map(items, out, itl_hierarchy, config, territory_cache)
 
+    save_territory_cache(territory_cache, BOUNDARY_PATHS, territory_cache_file)
     logger.info("All maps created in %s", output_dir)
 
 
@@ -0,0 +1,196 @@
+"""Tests for Nominatim geocoding helpers."""
+
+import concurrent.futures
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from rugby import geocode
+from rugby.geocode import _normalize_cache_key, geocode_with_nominatim, normalize_address
+
+
+class TestNormalizeAddress:
+    """Tests for canonicalising addresses into cache keys."""
+
+    def test_whitespace_and_case(self):
+        assert normalize_address("1 High St , London ") == normalize_address("1 high st, London")
+
+    def test_trailing_punctuation(self):
+        assert normalize_address("Twickenham Stadium, TW2 7BA.") == "twickenham stadium, tw2 7ba"
+
+    def test_unicode_compatibility_forms(self):
+        assert normalize_address("Ｒｏｓｓｌｙｎ Park Rd") == "rosslyn park rd"
+
+    def test_idempotent(self):
+        once = normalize_address("  Franklin's  Gardens ,Weedon Rd ")
+        assert normalize_address(once) == once
+
+
+def test_normalize_cache_key_keeps_limit_suffix():
+    assert _normalize_cache_key("Bath Rec \0limit=5") == "bath rec\0limit=5"
+
+
+class _EmptyResponse:
+    status_code = 200
+    content = b"[]"
+
+    def close(self):
+        pass
+
+
+def _fake_nominatim(monkeypatch) -> list[str]:
+    queries: list[str] = []
+
+    class FakeSession:
+        def get(self, url, **_k):
+            queries.append(parse_qs(urlsplit(url).query)["q"][0])
+            return _EmptyResponse()
+
+    monkeypatch.setattr(geocode, "_cache_shards", [{} for _ in range(geocode._CACHE_SHARDS)])
+    monkeypatch.setattr(geocode, "_journal_keys", [])
+    monkeypatch.setattr(geocode, "get_session", FakeSession)
+    monkeypatch.setattr(geocode, "wait_for_rate_limit", lambda *_a: None)
+    return queries
+
+
+def test_no_results_are_not_cached_after_an_http_error(monkeypatch):
+    queries = _fake_nominatim(monkeypatch)
+
+    class RateLimited(_EmptyResponse):
+        status_code = 429
+
+    responses = iter([_EmptyResponse(), RateLimited(), _EmptyResponse()])
+
+    class FakeSession:
+        def get(self, url, **_k):
+            queries.append(parse_qs(urlsplit(url).query)["q"][0])
+            return next(responses)
+
+    monkeypatch.setattr(geocode, "get_session", FakeSession)
+    monkeypatch.setattr(geocode, "_record_response_status", lambda *_a: None)
+
+    assert geocode_with_nominatim("Nowhere Lane, AB1 2CD")[0] is None
+    assert queries == ["nowhere lane, ab1 2cd", "ab1 2cd", "ab1"]
+    assert geocode._cache_get(normalize_address("Nowhere Lane, AB1 2CD")) is None
+
+
+def _stale_no_results() -> dict:
+    return {"no_results": True, "cached_at": time.time() - geocode.NEGATIVE_CACHE_TTL_SECONDS - 1}
+
+
+def test_no_results_are_cached_until_stale(monkeypatch):
+    queries = _fake_nominatim(monkeypatch)
+
+    assert geocode_with_nominatim("Nowhere Lane, AB1 2CD")[0] is None
+    assert queries == ["nowhere lane, ab1 2cd", "ab1 2cd", "ab1"]
+
+    assert geocode_with_nominatim("Nowhere Lane , AB1 2CD ")[0] is None
+    assert len(queries) == 3
+
+    geocode._cache_put(normalize_address("Nowhere Lane, AB1 2CD"), _stale_no_results())  # type: ignore
+    geocode_with_nominatim("Nowhere Lane, AB1 2CD")
+    assert len(queries) == 6
+
+
+def test_prefetch_requeues_stale_negative_entries(monkeypatch, tmp_path):
+    queries = _fake_nominatim(monkeypatch)
+    monkeypatch.setattr(geocode, "flush_cache", lambda *_a, **_k: None)
+    fresh = {"no_results": True, "cached_at": time.time()}
+    geocode._cache_put(normalize_address("Stale Lane, AB1 2CD"), _stale_no_results())  # type: ignore
+    geocode._cache_put(normalize_address("Fresh Lane, EF3 4GH"), fresh)  # type: ignore
+    address_file = tmp_path / "league.json"
+    address_file.write_text(
+        json.dumps(
+            {
+                "league_name": "League",
+                "teams": [
+                    {"name": "Stale RFC", "address": "Stale Lane, AB1 2CD"},
+                    {"name": "Fresh RFC", "address": "Fresh Lane, EF3 4GH"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    failed = geocode.prefetch_addresses([address_file], max_workers=1)
+
+    assert failed == {"stale lane, ab1 2cd"}
+    assert queries == ["stale lane, ab1 2cd", "ab1 2cd", "ab1"]
+
+
+def test_search_nominatim_requeries_stale_negative_entries(monkeypatch):
+    queries = _fake_nominatim(monkeypatch)
+    key = geocode._nominatim_cache_key(normalize_address("Stale Lane"), 5)
+    geocode._cache_put(key, _stale_no_results())  # type: ignore
+
+    assert geocode.search_nominatim("Stale Lane") == []
+    assert queries == ["stale lane"]
+
+
+def test_request_interval_backs_off_and_recovers(monkeypatch):
+    monkeypatch.setattr(geocode, "_request_interval", geocode._MIN_REQUEST_INTERVAL_SECONDS)
+
+    for _ in range(10):
+        geocode._record_response_status(429)
+    assert geocode._request_interval == geocode._MAX_REQUEST_INTERVAL_SECONDS
+
+    geocode._record_response_status(200)
+    assert geocode._request_interval == geocode._MAX_REQUEST_INTERVAL_SECONDS - 0.25
+
+    for _ in range(100):
+        geocode._record_response_status(200)
+    assert geocode._request_interval == geocode._MIN_REQUEST_INTERVAL_SECONDS
+
+
+def test_completed_in_window_bounds_outstanding_jobs():
+    futures: list[concurrent.futures.Future] = []
+    outstanding: list[int] = []
+
+    class RecordingPool(concurrent.futures.ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            outstanding.append(sum(not f.done() for f in futures) + 1)
+            futures.append(super().submit(fn, *args, **kwargs))
+            return futures[-1]
+
+    results: dict[int, int] = {}
+    with RecordingPool(max_workers=2) as pool:
+        jobs = ((i, (i,)) for i in range(20))
+        for key, future in geocode._completed_in_window(pool, lambda x: x * x, jobs, window=3):
+            results[key] = future.result()
+
+    assert results == {i: i * i for i in range(20)}
+    assert max(outstanding) <= 3
+
+
+def test_load_cache_stops_at_truncated_journal_line(monkeypatch, tmp_path):
+    cache_file, journal_file = tmp_path / "cache.json", tmp_path / "cache.journal.jsonl"
+    monkeypatch.setattr(geocode, "CACHE_FILE", str(cache_file))
+    monkeypatch.setattr(geocode, "CACHE_JOURNAL_FILE", str(journal_file))
+    monkeypatch.setattr(geocode, "_cache_shards", [{} for _ in range(geocode._CACHE_SHARDS)])
+    cache_file.write_text(json.dumps({"a": {"latitude": 1.0}}), encoding="utf-8")
+    good = json.dumps(["b", {"latitude": 2.0}]) + "\n"
+    journal_file.write_text(good + '["c", {"lat', encoding="utf-8")
+
+    geocode.load_cache()
+
+    assert geocode._cache_get("a") == {"latitude": 1.0}
+    assert geocode._cache_get("b") == {"latitude": 2.0}
+    assert geocode._cache_get("c") is None
+    assert journal_file.read_text(encoding="utf-8") == good
+
+
+def test_flushed_entries_reach_the_journal_before_exit(monkeypatch, tmp_path):
+    journal_file = tmp_path / "cache.journal.jsonl"
+    monkeypatch.setattr(geocode, "CACHE_JOURNAL_FILE", str(journal_file))
+    monkeypatch.setattr(geocode, "_cache_shards", [{} for _ in range(geocode._CACHE_SHARDS)])
+    monkeypatch.setattr(geocode, "_journal_keys", [])
+    registered = []
+    monkeypatch.setattr(geocode.atexit, "register", registered.append)
+    monkeypatch.setattr(geocode, "_journal_writer", None)
+
+    geocode._cache_put("a", {"latitude": 1.0})  # type: ignore
+    geocode.flush_cache()
+    assert registered == [geocode._wait_for_journal_writes]
+    registered[0]()
+
+    assert journal_file.read_text(encoding="utf-8") == '["a", {"latitude": 1.0}]\n'
@@ -0,0 +1,360 @@
+"""Tests for core.map_builder boundary loading and territory cells."""
+
+import gzip
+import json
+
+import folium
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import mapping, shape
+
+import core.map_builder
+from core.map_builder import (
+    MapConfig,
+    MarkerItem,
+    _add_markers,
+    _create_bounded_voronoi,
+    _delta_rings,
+    _haversine_km_grid,
+    _haversine_km_many,
+    _inline_boundaries_json,
+    _save_map,
+    _territory_cache_key,
+    generate_multi_group_map,
+    geometries_from_geojson,
+    load_itl_hierarchy,
+    load_territory_cache,
+    save_territory_cache,
+    simplified_features,
+    write_shared_boundaries,
+)
+
+
+def _feature(props: dict, x0: float, x1: float) -> dict:
+    ring = [[x0, 50.0], [x1, 50.0], [x1, 51.0], [x0, 51.0], [x0, 50.0]]
+    return {
+        "type": "Feature",
+        "properties": props,
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+    }
+
+
+def _write_boundaries(tmp_path) -> dict[str, str]:
+    layers = {
+        "countries": [_feature({"CTRY24NM": "England", "CTRY24CD": "E92000001"}, 0, 2)],
+        "itl1": [_feature({"ITL125NM": "East", "ITL125CD": "TLH"}, 0, 2)],
+        "itl2": [_feature({"ITL225NM": "Essex", "ITL225CD": "TLH3"}, 0, 2)],
+        "itl3": [
+            _feature({"ITL325NM": "West Essex", "ITL325CD": "TLH31"}, 0, 1),
+            _feature({"ITL325NM": "East Essex", "ITL325CD": "TLH32"}, 1, 2),
+        ],
+        "lad": [
+            _feature({"LAD25NM": "Harlow", "LAD25CD": "E07000073"}, 0, 1),
+            _feature({"LAD25NM": "Tendring", "LAD25CD": "E07000076"}, 1, 2),
+        ],
+    }
+    paths = {}
+    for level, features in layers.items():
+        path = tmp_path / f"{level}.geojson"
+        path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+        paths[level] = str(path)
+    paths["wards"] = str(tmp_path / "missing_wards.geojson")
+    return paths
+
+
+class TestItlHierarchyCache:
+    """Tests for the pickled ITL hierarchy cache."""
+
+    def test_cached_hierarchy_matches_fresh_build(self, tmp_path):
+        paths = _write_boundaries(tmp_path)
+        cache_file = tmp_path / "itl_hierarchy.pkl"
+
+        fresh = load_itl_hierarchy(paths, cache_file=cache_file)
+        assert cache_file.exists()
+        cached = load_itl_hierarchy(paths, cache_file=cache_file)
+
+        assert (
+            cached["lad_to_itl3"]
+            == fresh["lad_to_itl3"]
+            == {
+                "E07000073": "West Essex",
+                "E07000076": "East Essex",
+            }
+        )
+        assert cached["itl2_to_itl3s"] == fresh["itl2_to_itl3s"]
+        for key, region in fresh["itl3_regions"].items():
+            restored = cached["itl3_regions"][key]
+            assert restored["code"] == region["code"]
+            assert restored["geom"].equals(region["geom"])
+            assert restored["centroid"].equals(region["centroid"])
+            assert shapely.is_prepared(restored["geom"])
+            assert restored["geom"].contains(region["centroid"])
+
+    def test_source_change_invalidates_cache(self, tmp_path, monkeypatch):
+        paths = _write_boundaries(tmp_path)
+        cache_file = tmp_path / "itl_hierarchy.pkl"
+        load_itl_hierarchy(paths, cache_file=cache_file)
+
+        builds = []
+        real_build = core.map_builder._build_itl_hierarchy
+        monkeypatch.setattr(
+            core.map_builder,
+            "_build_itl_hierarchy",
+            lambda p: builds.append(p) or real_build(p),
+        )
+        load_itl_hierarchy(paths, cache_file=cache_file)
+        assert builds == []
+
+        with open(paths["itl3"], "a", encoding="utf-8") as f:
+            f.write("\n")
+        load_itl_hierarchy(paths, cache_file=cache_file)
+        assert len(builds) == 1
+
+
+class TestTerritoryCache:
+    """Tests for the pickled territory cache."""
+
+    def test_round_trip_until_sources_change(self, tmp_path):
+        paths = _write_boundaries(tmp_path)
+        cache_file = tmp_path / "territories.pkl"
+        key = ("itl2", "itl3", frozenset({("A", "G")}))
+        territories = {key: {"G": {"type": "Polygon"}}}
+
+        assert load_territory_cache(paths, cache_file).get(key) is None
+        save_territory_cache(territories, paths, cache_file)
+        assert load_territory_cache(paths, cache_file).get(key) == territories[key]
+
+        with open(paths["lad"], "a", encoding="utf-8") as f:
+            f.write("\n")
+        assert load_territory_cache(paths, cache_file).get(key) is None
+
+    def test_save_drops_entries_this_run_did_not_use(self, tmp_path):
+        paths = _write_boundaries(tmp_path)
+        cache_file = tmp_path / "territories.pkl"
+        used, unused, new = (("itl2", "itl3", frozenset({(name, "G")})) for name in "ABC")
+        save_territory_cache(
+            {used: {"G": {"type": "Polygon"}}, unused: {"G": {"type": "Point"}}}, paths, cache_file
+        )
+
+        territories = load_territory_cache(paths, cache_file)
+        assert territories.get(used) == {"G": {"type": "Polygon"}}
+        territories[new] = {"G": {"type": "LineString"}}
+        save_territory_cache(territories, paths, cache_file)
+
+        reloaded = load_territory_cache(paths, cache_file)
+        assert set(reloaded.stored) == {used, new}
+
+    def test_key_changes_when_an_item_moves(self):
+        config = MapConfig(title="T", color_palette=["red"])
+        item = {
+            "name": "A",
+            "group": "G",
+            "tier_num": 1,
+            "latitude": 50.5,
+            "longitude": 0.5,
+            **dict.fromkeys(("itl0", "itl1", "itl2", "itl3", "lad", "ward")),
+        }
+
+        moved = dict(item, longitude=0.6)
+
+        assert _territory_cache_key([item], config) != _territory_cache_key([moved], config)
+
+
+class TestBoundedVoronoi:
+    """Tests for per-region Voronoi territory cells."""
+
+    @staticmethod
+    def _item(lon: float, lat: float, group: str) -> dict:
+        return {"longitude": lon, "latitude": lat, "group": group}
+
+    def test_cells_are_reused_with_caller_colors(self, monkeypatch):
+        boundary = shapely.box(0, 50, 2, 51)
+        items = [self._item(0.5, 50.5, "A"), self._item(1.5, 50.5, "B"), self._item(0.5, 50.5, "C")]
+        calls = []
+        real = core.map_builder._voronoi_group_cells
+        monkeypatch.setattr(core.map_builder, "_voronoi_cache", {})
+        monkeypatch.setattr(
+            core.map_builder,
+            "_voronoi_group_cells",
+            lambda *a: calls.append(a) or real(*a),
+        )
+
+        first = _create_bounded_voronoi(items, boundary, {"A": "red", "B": "blue", "C": "green"})
+        again = _create_bounded_voronoi(items, boundary, {"A": "x", "B": "y", "C": "z"})
+
+        assert len(calls) == 1
+        assert [c["group"] for c in first] == ["A", "B", "C"]
+        assert [c["color"] for c in again] == ["x", "y", "z"]
+        # Items sharing a ground share its cell
+        assert first[0]["geom"].equals(first[2]["geom"])
+        assert first[0]["geom"].area + first[1]["geom"].area == pytest.approx(boundary.area)
+
+        _create_bounded_voronoi(items, shapely.box(0, 50, 2, 51), {"A": "", "B": "", "C": ""})
+        assert len(calls) == 2
+
+    def test_shared_ground_takes_whole_boundary(self):
+        boundary = shapely.box(0, 50, 2, 51)
+        items = [self._item(1.0, 50.5, "A"), self._item(1.0, 50.5, "B")]
+
+        cells = _create_bounded_voronoi(items, boundary, {"A": "red", "B": "blue"})
+
+        assert [c["group"] for c in cells] == ["A", "B"]
+        assert all(c["geom"].equals(boundary) for c in cells)
+
+    def test_edge_slivers_are_dropped_from_cells(self):
+        # The x=2 bisector runs along the edge of the lower part
+        boundary = shapely.MultiPolygon([shapely.box(0, 0, 2, 2), shapely.box(2, -1, 3, 0)])
+        items = [self._item(1.0, 1.0, "A"), self._item(3.0, 1.0, "B")]
+
+        cells = _create_bounded_voronoi(items, boundary, {"A": "red", "B": "blue"})
+
+        assert [c["geom"].geom_type for c in cells] == ["Polygon", "Polygon"]
+
+
+def test_geometries_from_geojson_matches_shape():
+    donut = shapely.box(0, 0, 4, 4).difference(shapely.box(1, 1, 2, 2))
+    geometries = json.loads(
+        json.dumps(
+            [
+                mapping(donut),
+                mapping(shapely.MultiPolygon([shapely.box(5, 5, 6, 6), donut])),
+                {"type": "Point", "coordinates": [1.0, 2.0]},
+            ]
+        )
+    )
+
+    built = geometries_from_geojson(geometries)
+
+    for geom, expected in zip(built, map(shape, geometries), strict=True):
+        assert geom.geom_type == expected.geom_type
+        assert geom.equals_exact(expected, 0)
+
+
+def test_marker_batch_interns_icons_and_escapes_script():
+
+    item = {"name": "Team </script>", "latitude": 51.0, "longitude": -1.0, "group": "A"}
+    items = [item, dict(item, latitude=52.0), dict(item, icon_url="https://x/a.png")]
+    group = folium.FeatureGroup().add_to(folium.Map())
+
+    _add_markers(group, items, ["red", "red", "red"], tier_order=3)
+
+    (batch,) = group._children.values()
+    data = json.loads(batch.data)
+    assert data["icon"] == [0, 0, 1]
+    assert data["lats"] == [51.0, 52.0, 51.0]
+    assert data["tierOrder"] == 3
+    assert data["imageUrls"] == ["", "", "https://x/a.png"]
+    assert "</script>" not in batch.data
+
+
+def test_save_map_keeps_template_syntax_in_data(tmp_path):
+
+    item = {"name": "Team {{ x }}", "latitude": 51.0, "longitude": -1.0, "group": "A"}
+    m = folium.Map()
+    _add_markers(folium.FeatureGroup().add_to(m), [item], ["red"])
+    out = tmp_path / "maps" / "map.html"
+
+    _save_map(m, out)
+
+    assert "Team {{ x }}" in out.read_text(encoding="utf-8")
+
+
+def test_territory_files_are_written_beside_the_map(tmp_path):
+    hierarchy = load_itl_hierarchy(_write_boundaries(tmp_path), cache_file=None)
+    items = [
+        MarkerItem(f"Team {i}", 50.5, 0.5 + i, group=f"L{i}", tier="T", tier_num=1)
+        for i in range(2)
+    ]
+    config = MapConfig(
+        title="T",
+        color_palette=["red", "blue"],
+        inline_boundaries_file=str(tmp_path / "none.json"),
+        territory_files=True,
+    )
+    out = tmp_path / "site" / "index.html"
+
+    generate_multi_group_map(items, out, hierarchy, config)
+
+    territories = json.loads((tmp_path / "site" / "index_territories" / "0.json").read_text())
+    assert territories["type"] == "FeatureCollection"
+    styles = [f["properties"]["style"]["color"] for f in territories["features"]]
+    assert sorted(styles) == ["blue", "red"]
+    assert '"index_territories/0.json"' in out.read_text(encoding="utf-8")
+
+
+def test_simplified_features_snap_coordinates():
+    feature = _feature(
+        {"LAD25CD": "E1", "LAD25NM": "A", "OBJECTID": 7, "Shape__Area": 1.5},
+        0.123456789,
+        1.987654321,
+    )
+
+    (out,) = simplified_features([feature])
+
+    xs = {x for x, _ in out["geometry"]["coordinates"][0]}
+    assert xs == {0.12346, 1.98765}
+    assert out["properties"] == {"LAD25CD": "E1", "LAD25NM": "A"}
+
+
+def test_delta_rings_encode_grid_steps():
+    square = {
+        "type": "Polygon",
+        "coordinates": [[(0.1, 0.2), (0.10002, 0.2), (0.10002, 0.20003), (0.1, 0.2)]],
+    }
+
+    assert _delta_rings(square) == [[[10000, 20000, 2, 0, 0, 3, -2, -3]]]
+    assert _delta_rings({"type": "Point", "coordinates": (0.1, 0.2)}) is None
+
+
+def test_write_shared_boundaries_adds_gzip_copy(tmp_path):
+    data = {"countries": {}, "itl_1": None, "lad": {"type": "FeatureCollection", "features": []}}
+    path = tmp_path / "boundaries.json"
+    write_shared_boundaries(data, path)
+    assert json.loads(gzip.decompress((tmp_path / "boundaries.json.gz").read_bytes())) == data
+    assert json.loads(path.read_bytes()) == data
+
+
+def test_inline_boundaries_are_delta_encoded(tmp_path):
+    square = {"type": "Polygon", "coordinates": [[[0, 0], [0, 0.001], [0.001, 0], [0, 0]]]}
+    path = tmp_path / "boundaries.json"
+    write_shared_boundaries(
+        {
+            "countries": {},
+            "lad": {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "geometry": square, "properties": {"LAD25CD": "E1"}}
+                ],
+            },
+        },
+        path,
+    )
+    (feature,) = json.loads(_inline_boundaries_json(str(path)))["lad"]["features"]
+    assert feature["geometry"] is None
+    assert feature["q"] == [[[0, 0, 0, 100, 100, -100, -100, 0]]]
+    assert feature["properties"] == {"LAD25CD": "E1"}
+
+
+def test_export_shared_boundaries_skips_unchanged_sources(tmp_path, monkeypatch):
+    paths = _write_boundaries(tmp_path)
+    out = tmp_path / "shared"
+    core.map_builder.export_shared_boundaries(paths, str(out), country_names=["England"])
+    assert (out / "boundaries.json.gz").exists()
+
+    def fail(*args):
+        raise AssertionError("boundaries rewritten")
+
+    monkeypatch.setattr(core.map_builder, "write_shared_boundaries", fail)
+    core.map_builder.export_shared_boundaries(paths, str(out), country_names=["England"])
+    with pytest.raises(AssertionError):
+        core.map_builder.export_shared_boundaries(paths, str(out), country_names=["Wales"])
+
+
+def test_haversine_grid_matches_per_origin_distances():
+    lats, lons = np.array([51.5, 53.48, 50.37]), np.array([-0.13, -2.24, -4.14])
+    origins = np.array([[52.2, 0.12], [54.97, -1.61]])
+    grid = _haversine_km_grid(origins[:, :1], origins[:, 1:], lats, lons)
+    assert grid.shape == (2, 3)
+    for row, (lat, lon) in zip(grid, origins, strict=True):
+        np.testing.assert_array_equal(row, _haversine_km_many(lat, lon, lats, lons))
@@ -1,6 +1,14 @@
 """Tests for utility functions."""
 
-from core import team_name_to_filepath
+import core.types
+from core import (
+    json_dump_file,
+    json_dumps,
+    json_load_all,
+    json_load_mapped,
+    json_loads,
+    team_name_to_filepath,
+)
 
 
 class TestTeamNameToFilepath:
@@ -23,3 +31,61 @@ class TestTeamNameToFilepath:
     def test_roman_numerals_suffix(self):
         result = team_name_to_filepath("Saracens II")
         assert result == "Saracens_II.html"
+
+
+class TestJsonLoads:
+    """Tests for the optional-orjson JSON decoder."""
+
+    def test_bytes_and_str(self):
+        payload = '[{"lat": "51.5", "display_name": "Twickenham Stadium"}]'
+        assert json_loads(payload) == json_loads(payload.encode("utf-8"))
+        assert json_loads(payload)[0]["display_name"] == "Twickenham Stadium"
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(core.types, "orjson", None)
+        assert json_loads(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+
+
+class TestJsonDumps:
+    """Tests for the optional-orjson JSON encoder."""
+
+    def test_compact_output_matches_stdlib(self, monkeypatch):
+        data = {"type": "Polygon", "coordinates": [[[-1.5, 51.12345], [0, 52], [-1.5, 51.12345]]]}
+        encoded = json_dumps(data)
+        monkeypatch.setattr(core.types, "orjson", None)
+        assert json_dumps(data) == encoded
+        assert json_loads(encoded) == data
+
+    def test_dump_file_matches_stdlib(self, tmp_path, monkeypatch):
+        data = {"countries": {"Wales": [{"LAD25NM": "Ynys Môn", "coords": [-4.3, 53.25]}]}}
+        fast, slow = tmp_path / "fast.json", tmp_path / "slow.json"
+        json_dump_file(data, fast)
+        monkeypatch.setattr(core.types, "orjson", None)
+        json_dump_file(data, slow)
+        assert fast.read_bytes() == slow.read_bytes()
+        assert json_load_mapped(slow) == data
+
+
+class TestJsonLoadMapped:
+    """Tests for decoding JSON files through a memory map."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_text('{"Kingsholm, Gloucester": {"latitude": 51.87}}', encoding="utf-8")
+        assert json_load_mapped(path) == {"Kingsholm, Gloucester": {"latitude": 51.87}}
+
+    def test_stdlib_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(core.types, "orjson", None)
+        path = tmp_path / "cache.json"
+        path.write_text("[1, 2]", encoding="utf-8")
+        assert json_load_mapped(path) == [1, 2]
+
+    def test_load_all_keeps_path_order(self, tmp_path):
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"{i}.json"
+            path.write_text(f'{{"league_name": "League {i}"}}', encoding="utf-8")
+            paths.append(path)
+        assert [d["league_name"] for d in json_load_all(paths)] == [
+            f"League {i}" for i in range(20)
+        ]